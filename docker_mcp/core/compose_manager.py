@@ -1,9 +1,12 @@
 """Docker Compose file management for persistent stack operations."""
 
 import asyncio
+import hashlib
 import json
 import os
 import shlex
+import subprocess
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -11,12 +14,32 @@ import docker
 import structlog
 
 from ..constants import DOCKER_COMPOSE_CONFIG_FILES, DOCKER_COMPOSE_PROJECT
-from ..utils import build_ssh_command
+from ..utils import build_ssh_command, push_content_via_ssh
 from .config_loader import DockerMCPConfig
 from .docker_context import DockerContextManager
 
 logger = structlog.get_logger()
 
+# Compose file contents keyed by (host_id, path), validated by a remote stat signature.
+# Shared across ComposeManager instances so a write through one invalidates them all.
+COMPOSE_CONTENT_CACHE_MAX_ENTRIES = int(os.getenv("COMPOSE_CONTENT_CACHE_MAX_ENTRIES", "256"))
+_compose_content_cache: OrderedDict[tuple[str, str], tuple[str, str]] = OrderedDict()
+
+# size, inode and full-resolution mtime; any rewrite or rename changes at least one
+_STAT_FORMAT = "%s %i %y"
+
+# Digest of the last successfully deployed compose content + environment, kept in the stack dir
+DEPLOY_HASH_FILENAME = ".docker-mcp-deploy.sha256"
+
+
+def compute_deploy_hash(compose_content: str, environment: dict[str, str] | None = None) -> str:
+    """Hash compose content together with the deploy environment (order-independent)."""
+    payload = json.dumps(
+        {"compose": compose_content, "environment": dict(sorted((environment or {}).items()))},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 class ComposeManager:
     """Manages Docker Compose file locations and operations."""
@@ -341,6 +364,9 @@ class ComposeManager:
         stack_dir = f"{compose_base_dir}/{stack_name}"
         compose_file_path = f"{stack_dir}/docker-compose.yml"
 
+        # Drop the cached copy up front so a failed or partial write is never served
+        self.invalidate_compose_content(host_id, compose_file_path)
+
         try:
             # Create the compose file on the remote host using Docker contexts
             # We'll use a temporary container to write the file
@@ -367,111 +393,189 @@ class ComposeManager:
             )
             raise
 
-    async def _create_compose_file_on_remote(
-        self, host_id: str, stack_dir: str, compose_file_path: str, compose_content: str
-    ) -> None:
-        """Create compose file on remote host using SSH connection via Docker context."""
-        import subprocess
-        import tempfile
+    async def read_compose_file(self, host_id: str, compose_file_path: str) -> str:
+        """Read a compose file from a remote host, serving unchanged files from cache.
+
+        A single SSH round trip stats the file and only streams its content when
+        the stat signature differs from the cached entry.
 
-        # Get host configuration for SSH details
+        Args:
+            host_id: Host identifier
+            compose_file_path: Full path to the compose file
+
+        Returns:
+            Compose file content
+
+        Raises:
+            ValueError: If the host is not configured
+            FileNotFoundError: If the file cannot be stat'ed or read
+            subprocess.TimeoutExpired: If the SSH command times out
+        """
         host_config = self.config.hosts.get(host_id)
         if not host_config:
             raise ValueError(f"Host {host_id} not found")
 
-        # Create a temporary file locally with the compose content
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as temp_file:
-            temp_file.write(compose_content)
-            temp_local_path = temp_file.name
+        key = (host_id, compose_file_path)
+        cached = _compose_content_cache.get(key)
+        quoted_path = shlex.quote(compose_file_path)
+        cached_signature = shlex.quote(cached[0]) if cached else "''"
+        remote_cmd = (
+            f"sig=$(stat -c {shlex.quote(_STAT_FORMAT)} {quoted_path}) || exit 2; "
+            f'printf "%s\\n" "$sig"; '
+            f'[ "$sig" = {cached_signature} ] || cat {quoted_path}'
+        )
+        ssh_cmd = build_ssh_command(host_config) + [remote_cmd]
+
+        result = await asyncio.to_thread(
+            subprocess.run,  # nosec B603
+            ssh_cmd,
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode != 0:
+            _compose_content_cache.pop(key, None)
+            raise FileNotFoundError(
+                f"Failed to read compose file {compose_file_path}: {result.stderr.strip()}"
+            )
+
+        signature, _, content = result.stdout.partition("\n")
+        if cached and signature == cached[0]:
+            _compose_content_cache.move_to_end(key)
+            logger.debug("Compose content cache hit", host_id=host_id, path=compose_file_path)
+            return cached[1]
 
-        try:
-            # Build SSH command using the helper for directory creation
-            ssh_cmd_base = build_ssh_command(host_config)
+        _compose_content_cache[key] = (signature, content)
+        _compose_content_cache.move_to_end(key)
+        while len(_compose_content_cache) > COMPOSE_CONTENT_CACHE_MAX_ENTRIES:
+            _compose_content_cache.popitem(last=False)
+        return content
+
+    def invalidate_compose_content(
+        self, host_id: str, compose_file_path: str | None = None
+    ) -> None:
+        """Drop cached compose content for one file, or every file on a host."""
+        if compose_file_path is not None:
+            _compose_content_cache.pop((host_id, compose_file_path), None)
+            return
+        for key in [key for key in _compose_content_cache if key[0] == host_id]:
+            del _compose_content_cache[key]
+
+    async def read_deploy_state(
+        self, host_id: str, stack_name: str
+    ) -> tuple[str | None, str | None, str]:
+        """Read the stored deploy hash and the on-disk compose file digest in one SSH call.
+
+        Args:
+            host_id: Host identifier
+            stack_name: Stack name
 
-            # First, create the directory on remote host
-            mkdir_cmd = ssh_cmd_base + [f"mkdir -p {shlex.quote(stack_dir)}"]
+        Returns:
+            Tuple of (stored deploy hash, compose file sha256, compose file path);
+            hashes are None when the file is missing or the host is unreachable
+        """
+        compose_base_dir = await self.get_compose_path(host_id)
+        stack_dir = f"{compose_base_dir}/{stack_name}"
+        compose_file_path = f"{stack_dir}/docker-compose.yml"
 
-            logger.debug("Creating remote directory", host_id=host_id, stack_dir=stack_dir)
+        host_config = self.config.hosts.get(host_id)
+        if not host_config:
+            return None, None, compose_file_path
 
-            mkdir_result = await asyncio.to_thread(
+        hash_path = shlex.quote(f"{stack_dir}/{DEPLOY_HASH_FILENAME}")
+        remote_cmd = (
+            f'printf "stored=%s\\n" "$(cat {hash_path} 2>/dev/null)"; '
+            f'printf "file=%s\\n" '
+            f'"$(sha256sum {shlex.quote(compose_file_path)} 2>/dev/null | cut -d" " -f1)"'
+        )
+        try:
+            result = await asyncio.to_thread(
                 subprocess.run,  # nosec B603
-                mkdir_cmd,
+                build_ssh_command(host_config) + [remote_cmd],
                 check=False,
                 capture_output=True,
                 text=True,
-                timeout=30,
-            )
-
-            if mkdir_result.returncode != 0:
-                raise Exception(f"Failed to create directory on remote host: {mkdir_result.stderr}")
-
-            # Then, copy the file using scp
-            scp_cmd = ["scp", "-B"]
-
-            # Add port if not default
-            if host_config.port != 22:
-                scp_cmd.extend(["-P", str(host_config.port)])
-
-            # Add identity file if specified
-            if host_config.identity_file:
-                scp_cmd.extend(["-i", host_config.identity_file])
-
-            # Add common SCP options for automation
-            scp_cmd.extend(
-                [
-                    "-o",
-                    "StrictHostKeyChecking=no",
-                    "-o",
-                    "UserKnownHostsFile=/dev/null",
-                    "-o",
-                    "LogLevel=ERROR",
-                ]
+                timeout=15,
             )
+        except subprocess.TimeoutExpired:
+            return None, None, compose_file_path
+        if result.returncode != 0:
+            return None, None, compose_file_path
 
-            # Add source and destination
-            ssh_host = f"{host_config.user}@{host_config.hostname}"
-            scp_cmd.extend([temp_local_path, f"{ssh_host}:{compose_file_path}"])
+        values = dict(
+            line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+        )
+        return (
+            values.get("stored", "").strip() or None,
+            values.get("file", "").strip() or None,
+            compose_file_path,
+        )
 
-            logger.debug(
-                "Copying compose file to remote host",
+    async def write_deploy_hash(self, host_id: str, stack_name: str, deploy_hash: str) -> bool:
+        """Record the deploy hash beside the stack's compose file."""
+        host_config = self.config.hosts.get(host_id)
+        if not host_config:
+            return False
+        compose_base_dir = await self.get_compose_path(host_id)
+        result = await push_content_via_ssh(
+            host_config,
+            f"{compose_base_dir}/{stack_name}/{DEPLOY_HASH_FILENAME}",
+            f"{deploy_hash}\n",
+            verify_checksum=False,
+        )
+        if not result["success"]:
+            logger.warning(
+                "Failed to record deploy hash",
                 host_id=host_id,
-                compose_file=compose_file_path,
+                stack_name=stack_name,
+                error=result.get("error"),
             )
+        return result["success"]
 
-            scp_result = await asyncio.to_thread(
-                subprocess.run,  # nosec B603 - SCP command execution is intentional
-                scp_cmd,
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+    async def _create_compose_file_on_remote(
+        self, host_id: str, stack_dir: str, compose_file_path: str, compose_content: str
+    ) -> None:
+        """Create compose file on remote host in a single SSH round trip.
+
+        The content is streamed over SSH stdin; the remote side creates the stack
+        directory, writes a temp file, renames it into place and echoes its checksum.
+        """
+        host_config = self.config.hosts.get(host_id)
+        if not host_config:
+            raise ValueError(f"Host {host_id} not found")
 
-            if scp_result.returncode != 0:
-                raise Exception(f"Failed to copy compose file to remote host: {scp_result.stderr}")
+        logger.debug(
+            "Pushing compose file to remote host",
+            host_id=host_id,
+            stack_dir=stack_dir,
+            compose_file=compose_file_path,
+        )
 
-            logger.info(
-                "Successfully created compose file on remote host",
+        result = await push_content_via_ssh(host_config, compose_file_path, compose_content)
+        if not result["success"]:
+            logger.error(
+                "Failed to create compose file via SSH",
                 host_id=host_id,
                 compose_file=compose_file_path,
+                error=result["error"],
             )
-
-        except Exception as e:
-            logger.error(
-                "Failed to create compose file via SSH",
+            raise Exception(f"Could not create compose file on remote host: {result['error']}")
+        if not result["verified"]:
+            logger.warning(
+                "Compose file written without checksum verification",
                 host_id=host_id,
                 compose_file=compose_file_path,
-                error=str(e),
+                reason=result.get("warning"),
             )
-            raise Exception(f"Could not create compose file on remote host: {e}") from e
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(temp_local_path)
-            except Exception as e:
-                logger.debug(
-                    "Failed to cleanup temporary file", temp_path=temp_local_path, error=str(e)
-                )
+
+        logger.info(
+            "Successfully created compose file on remote host",
+            host_id=host_id,
+            compose_file=compose_file_path,
+            bytes_written=result["bytes_written"],
+            checksum=result["checksum"],
+        )
 
     async def _file_exists_via_ssh(self, host_id: str, file_path: str) -> bool:
         """Check if a specific file exists on remote host via SSH.
@@ -0,0 +1,377 @@
+"""Parse-once Docker Compose model.
+
+Compose YAML is parsed once per content hash into an immutable model with each
+service's host ports, volumes and names precomputed. Validation, volume handling,
+port checks and risk assessment read from the same memoized instance instead of
+calling ``yaml.safe_load`` themselves.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import yaml
+from pydantic import BaseModel
+
+# Parsed models kept in memory, keyed by SHA-256 of the compose content
+COMPOSE_MODEL_CACHE_SIZE = int(os.getenv("COMPOSE_MODEL_CACHE_SIZE", "32"))
+_model_cache: OrderedDict[str, "ComposeModel"] = OrderedDict()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert parsed YAML into read-only mappings and tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert a frozen value back into plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def parse_port_string(port_spec: str) -> int | None:
+    """Parse string format ports and extract the published host port.
+
+    Returns the host port (int) for published ports, or None for container-only ports.
+
+    Extracts host port from formats:
+    - 'host_port:container_port' -> host_port
+    - 'ip:host_port:container_port' -> host_port
+    - 'ip:host_port:container_port/proto' -> host_port
+    - '[::1]:host_port:container_port' -> host_port (IPv6)
+
+    Returns None for container-only formats:
+    - 'port' or 'container_port' -> None (no host mapping)
+    """
+    try:
+        # Remove protocol suffix if present (e.g., /tcp, /udp)
+        if "/" in port_spec:
+            port_spec = port_spec.split("/")[0]
+
+        # Handle IPv6 format [ip]:host:container
+        if port_spec.startswith("[") and "]:" in port_spec:
+            # Extract everything after the IPv6 part: [::1]:8080:80 -> 8080:80
+            _, port_part = port_spec.split("]", 1)
+            if port_part.startswith(":"):
+                port_part = port_part[1:]  # Remove leading colon
+            port_spec = port_part
+
+        # Split on colons to handle different formats
+        parts = port_spec.split(":")
+
+        if len(parts) == 1:
+            # Simple format: just 'port' (container-only port, no host mapping)
+            return None
+        elif len(parts) == 2:
+            # Format: 'host_port:container_port'
+            return int(parts[0])
+        elif len(parts) == 3:
+            # Format: 'ip:host_port:container_port' - use middle part as host port
+            return int(parts[1])
+        else:
+            # Complex format like host:ip:hostport:containerport - use second-to-last as host port
+            return int(parts[-2])
+
+    except (ValueError, IndexError):
+        return None
+
+
+def parse_port_dict(port_spec: Mapping) -> int | None:
+    """Parse dictionary format ports with robust field handling.
+
+    Handles formats like:
+    - {target: 80, published: 8080}
+    - {target: 80, published: "8080"}
+    - {containerPort: 80, hostPort: 8080}
+    """
+    # Try different field names for published/host port
+    for field_name in ["published", "hostPort", "host_port", "external"]:
+        port_value = port_spec.get(field_name)
+        if port_value is not None:
+            try:
+                if isinstance(port_value, str):
+                    # Handle string values that might be complex port specs
+                    parsed = parse_port_string(port_value)
+                    if parsed is not None:
+                        return parsed
+                else:
+                    return int(port_value)
+            except (ValueError, TypeError):
+                continue
+    return None
+
+
+def parse_host_port(port_spec: Any) -> int | None:
+    """Parse a single port specification into a host port number."""
+    if isinstance(port_spec, str):
+        return parse_port_string(port_spec)
+    elif isinstance(port_spec, int):
+        return port_spec
+    elif isinstance(port_spec, Mapping):
+        return parse_port_dict(port_spec)
+    return None
+
+
+def _named_volume_source(volume: Any) -> str | None:
+    """Return the named volume a service volume entry refers to, if any."""
+    if isinstance(volume, str) and ":" in volume:
+        source = volume.split(":")[0]
+        if not source.startswith("/") and not source.startswith("."):
+            return source
+    elif isinstance(volume, Mapping) and volume.get("type") == "volume":
+        return volume.get("source") or None
+    return None
+
+
+class ComposeBindMount(BaseModel):
+    """Bind mount declared by a compose service."""
+
+    model_config = {"frozen": True}
+
+    service: str
+    source: str
+    target: str
+    options: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "service": self.service,
+            "source": self.source,
+            "target": self.target,
+            "options": self.options,
+            "type": "bind",
+        }
+
+    @classmethod
+    def from_entry(cls, service_name: str, volume: Any) -> "ComposeBindMount | None":
+        """Build a bind mount from a short or long syntax volume entry."""
+        if isinstance(volume, str) and ":" in volume:
+            parts = volume.split(":", 2)
+            if len(parts) >= 2 and parts[0].startswith("/"):
+                return cls(
+                    service=service_name,
+                    source=parts[0],
+                    target=parts[1],
+                    options=parts[2] if len(parts) > 2 else None,
+                )
+        elif isinstance(volume, Mapping) and volume.get("type") == "bind":
+            return cls(
+                service=service_name,
+                source=str(volume.get("source", "")),
+                target=str(volume.get("target", "")),
+                options=(volume.get("bind") or {}).get("propagation"),
+            )
+        return None
+
+
+class ComposeService(BaseModel):
+    """One compose service with its ports, volumes and names precomputed."""
+
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}
+
+    name: str
+    config: Any  # read-only mapping (or the raw value when the service is malformed)
+    image: str | None = None
+    host_ports: tuple[int, ...] = ()
+    volumes: tuple[Any, ...] = ()
+    named_volumes: tuple[str, ...] = ()
+    bind_mounts: tuple[ComposeBindMount, ...] = ()
+    networks: tuple[str, ...] = ()
+    depends_on: tuple[str, ...] = ()
+    has_healthcheck: bool = False
+
+    @classmethod
+    def from_config(cls, name: str, config: Any) -> "ComposeService":
+        if not isinstance(config, Mapping):
+            return cls(name=name, config=config)
+
+        ports, volumes, networks, depends_on = (
+            value if isinstance(value, tuple | Mapping) else ()
+            for value in (
+                config.get("ports"),
+                config.get("volumes"),
+                config.get("networks"),
+                config.get("depends_on"),
+            )
+        )
+        volumes = volumes if isinstance(volumes, tuple) else ()
+
+        host_ports = [
+            port for port in (parse_host_port(spec) for spec in ports) if port is not None
+        ]
+        named_volumes = list(
+            dict.fromkeys(
+                source for source in map(_named_volume_source, volumes) if source is not None
+            )
+        )
+        bind_mounts = [
+            mount
+            for mount in (ComposeBindMount.from_entry(name, volume) for volume in volumes)
+            if mount is not None
+        ]
+
+        return cls(
+            name=name,
+            config=config,
+            image=config.get("image") if isinstance(config.get("image"), str) else None,
+            host_ports=tuple(host_ports),
+            volumes=volumes,
+            named_volumes=tuple(named_volumes),
+            bind_mounts=tuple(bind_mounts),
+            networks=tuple(str(network) for network in networks),
+            depends_on=tuple(str(dependency) for dependency in depends_on),
+            has_healthcheck="healthcheck" in config,
+        )
+
+
+class ComposeModel(BaseModel):
+    """Immutable parsed compose file shared by every consumer of the same content."""
+
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}
+
+    content_hash: str
+    document: Any  # read-only mappings and tuples, as parsed
+    services: tuple[ComposeService, ...] = ()
+    network_names: tuple[str, ...] = ()
+    volume_names: tuple[str, ...] = ()
+
+    @property
+    def service_names(self) -> list[str]:
+        return [service.name for service in self.services]
+
+    @property
+    def host_ports(self) -> list[int]:
+        """Unique published host ports across all services, sorted."""
+        return sorted({port for service in self.services for port in service.host_ports})
+
+    @property
+    def named_volumes(self) -> list[str]:
+        """Top-level volume names followed by named volumes referenced by services."""
+        names = list(self.volume_names)
+        for service in self.services:
+            names.extend(name for name in service.named_volumes if name not in names)
+        return names
+
+    @property
+    def bind_mounts(self) -> list[ComposeBindMount]:
+        return [mount for service in self.services for mount in service.bind_mounts]
+
+    def service(self, name: str) -> ComposeService | None:
+        return next((service for service in self.services if service.name == name), None)
+
+    def to_dict(self) -> Any:
+        """Return a mutable deep copy of the parsed document."""
+        return _thaw(self.document)
+
+
+def diff_compose_models(old: ComposeModel, new: ComposeModel) -> dict[str, Any]:
+    """Compare two compose models service by service.
+
+    Returns:
+        Dict with changed, added, removed and unchanged service names, dependents
+        (services in the new model that transitively depend on a changed or added
+        service, excluding those already listed) and top_level_changed (top-level
+        keys other than ``services`` whose value differs)
+    """
+    old_services = {service.name: service for service in old.services}
+    new_services = {service.name: service for service in new.services}
+
+    changed = sorted(
+        name
+        for name in new_services.keys() & old_services.keys()
+        if new_services[name].config != old_services[name].config
+    )
+    added = sorted(new_services.keys() - old_services.keys())
+    removed = sorted(old_services.keys() - new_services.keys())
+    unchanged = sorted(new_services.keys() - set(changed) - set(added))
+
+    affected = set(changed) | set(added)
+    dependents: set[str] = set()
+    grew = True
+    while grew:
+        grew = False
+        for service in new.services:
+            if service.name in affected or service.name in dependents:
+                continue
+            if any(dep in affected or dep in dependents for dep in service.depends_on):
+                dependents.add(service.name)
+                grew = True
+
+    old_document = old.document if isinstance(old.document, Mapping) else {}
+    new_document = new.document if isinstance(new.document, Mapping) else {}
+    top_level_changed = sorted(
+        key
+        for key in (old_document.keys() | new_document.keys()) - {"services"}
+        if old_document.get(key) != new_document.get(key)
+    )
+
+    return {
+        "changed": changed,
+        "added": added,
+        "removed": removed,
+        "dependents": sorted(dependents),
+        "unchanged": sorted(set(unchanged) - dependents),
+        "top_level_changed": top_level_changed,
+    }
+
+
+def _build_model(content_hash: str, parsed: Any) -> ComposeModel:
+    document = _freeze(parsed)
+    if not isinstance(document, Mapping):
+        return ComposeModel(content_hash=content_hash, document=document)
+
+    services = document.get("services")
+    networks = document.get("networks")
+    volumes = document.get("volumes")
+    return ComposeModel(
+        content_hash=content_hash,
+        document=document,
+        services=tuple(
+            ComposeService.from_config(str(name), config)
+            for name, config in (services.items() if isinstance(services, Mapping) else ())
+        ),
+        network_names=tuple(networks) if isinstance(networks, Mapping) else (),
+        volume_names=tuple(volumes) if isinstance(volumes, Mapping) else (),
+    )
+
+
+def compose_content_hash(compose_content: str) -> str:
+    return hashlib.sha256(compose_content.encode("utf-8")).hexdigest()
+
+
+def get_compose_model(compose: "str | ComposeModel") -> ComposeModel:
+    """Return the parsed model for compose content, parsing at most once per content hash.
+
+    Args:
+        compose: Compose YAML content, or an already parsed model
+
+    Returns:
+        Memoized immutable compose model
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    if isinstance(compose, ComposeModel):
+        return compose
+
+    content_hash = compose_content_hash(compose)
+    model = _model_cache.get(content_hash)
+    if model is not None:
+        _model_cache.move_to_end(content_hash)
+        return model
+
+    model = _build_model(content_hash, yaml.safe_load(compose))
+    _model_cache[content_hash] = model
+    while len(_model_cache) > COMPOSE_MODEL_CACHE_SIZE:
+        _model_cache.popitem(last=False)
+    return model
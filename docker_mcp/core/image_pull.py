@@ -0,0 +1,275 @@
+"""Concurrent image pulls on Docker hosts.
+
+Pulls run through the Docker SDK in worker threads, bounded per host so that
+overlapping deploys on one host share the same limit. Concurrent requests for
+the same image on the same host join a single in-flight pull and receive its
+layer progress events. Images whose local digest already matches the registry
+can be skipped without pulling.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import docker
+import structlog
+from docker.utils import parse_repository_tag
+
+from .settings import CONTAINER_PULL_TIMEOUT
+
+logger = structlog.get_logger()
+
+# Concurrent image pulls per host (shared by every caller on the same host)
+IMAGE_PULL_PER_HOST_PARALLEL = int(os.getenv("IMAGE_PULL_PER_HOST_PARALLEL", "3"))
+
+# Minimum per-layer percentage change between reported progress events
+PULL_PROGRESS_STEP_PERCENT = int(os.getenv("PULL_PROGRESS_STEP_PERCENT", "10"))
+
+ProgressCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+_host_pull_limits: dict[str, asyncio.Semaphore] = {}
+_inflight_pulls: dict[tuple[str, str], "_PullFlight"] = {}
+
+
+def _host_limit(host_id: str) -> asyncio.Semaphore:
+    limit = _host_pull_limits.get(host_id)
+    if limit is None:
+        limit = _host_pull_limits[host_id] = asyncio.Semaphore(IMAGE_PULL_PER_HOST_PARALLEL)
+    return limit
+
+
+def _split_image_ref(image: str) -> tuple[str, str]:
+    """Split an image reference into repository and tag (or digest), defaulting to latest."""
+    repository, tag = parse_repository_tag(image)
+    return repository, tag or "latest"
+
+
+def _local_image_current(client: docker.DockerClient, image: str) -> bool:
+    """True when the image exists locally and its digest matches the registry."""
+    try:
+        local = client.images.get(image)
+    except docker.errors.ImageNotFound:
+        return False
+
+    _, tag = _split_image_ref(image)
+    if tag.startswith("sha256:"):
+        # Pinned by digest: a local copy is by definition the right content
+        return True
+
+    try:
+        registry_digest = client.images.get_registry_data(image).id
+    except docker.errors.APIError:
+        # Registry unreachable or no distribution access; let the pull decide
+        return False
+    return any(
+        repo_digest.endswith(f"@{registry_digest}")
+        for repo_digest in local.attrs.get("RepoDigests") or []
+    )
+
+
+def _pull_blocking(
+    client: docker.DockerClient, image: str, emit: Callable[[dict[str, Any]], None]
+) -> dict[str, Any]:
+    """Pull an image, emitting throttled layer progress events.
+
+    Returns:
+        Dict with bytes_downloaded, layers, digest, image_id and whether the
+        engine reported the image as already up to date
+    """
+    repository, tag = _split_image_ref(image)
+    layers: dict[str, dict[str, Any]] = {}
+    digest = ""
+    already_current = False
+
+    for event in client.api.pull(repository, tag=tag, stream=True, decode=True):
+        if error := event.get("error"):
+            raise docker.errors.APIError(error)
+        status = str(event.get("status") or "")
+        layer_id = event.get("id")
+        if status.startswith("Digest: "):
+            digest = status.removeprefix("Digest: ")
+        elif status.startswith("Status: Image is up to date"):
+            already_current = True
+        if not layer_id or layer_id == tag:
+            continue
+
+        layer = layers.setdefault(layer_id, {"status": "", "current": 0, "total": 0, "percent": 0})
+        detail = event.get("progressDetail") or {}
+        if status == "Downloading" and detail.get("total"):
+            layer["total"] = detail["total"]
+            layer["current"] = detail.get("current", 0)
+        elif status in ("Download complete", "Pull complete", "Already exists"):
+            layer["current"] = layer["total"]
+        percent = int(layer["current"] * 100 / layer["total"]) if layer["total"] else 0
+
+        # Only report status changes and progress steps, not every chunk
+        if status == layer["status"] and percent < layer["percent"] + PULL_PROGRESS_STEP_PERCENT:
+            continue
+        layer.update(status=status, percent=percent)
+        downloaded = sum(entry["current"] for entry in layers.values())
+        total = sum(entry["total"] for entry in layers.values())
+        emit(
+            {
+                "image": image,
+                "layer": layer_id,
+                "status": status,
+                "current": layer["current"],
+                "total": layer["total"],
+                "percent": percent,
+                "downloaded_bytes": downloaded,
+                "total_bytes": total,
+                "overall_percent": int(downloaded * 100 / total) if total else 0,
+            }
+        )
+
+    try:
+        image_id = client.images.get(image).id
+    except docker.errors.APIError:
+        image_id = ""
+    return {
+        "bytes_downloaded": sum(entry["total"] for entry in layers.values()),
+        "layers": len(layers),
+        "digest": digest,
+        "image_id": image_id,
+        "already_current": already_current,
+    }
+
+
+class _PullFlight:
+    """One in-flight pull of an image on a host, shared by every caller that asks for it."""
+
+    task: "asyncio.Task[dict[str, Any]]"
+
+    def __init__(self) -> None:
+        self.listeners: list[ProgressCallback] = []
+
+    async def dispatch(self, queue: "asyncio.Queue[dict[str, Any] | None]") -> None:
+        while (event := await queue.get()) is not None:
+            for listener in list(self.listeners):
+                try:
+                    await listener(event)
+                except Exception as e:
+                    logger.debug("Pull progress listener failed", error=str(e))
+                    self.listeners.remove(listener)
+
+
+async def _run_flight(
+    host_id: str,
+    client: docker.DockerClient,
+    image: str,
+    flight: _PullFlight,
+    skip_if_current: bool,
+) -> dict[str, Any]:
+    async with _host_limit(host_id):
+        started = time.monotonic()
+        result: dict[str, Any] = {"image": image, "host_id": host_id, "bytes_downloaded": 0}
+        try:
+            if skip_if_current and await asyncio.to_thread(_local_image_current, client, image):
+                result["status"] = "up_to_date"
+            else:
+                loop = asyncio.get_running_loop()
+                queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+                dispatcher = asyncio.create_task(flight.dispatch(queue))
+
+                def emit(event: dict[str, Any]) -> None:
+                    loop.call_soon_threadsafe(queue.put_nowait, {"host_id": host_id, **event})
+
+                try:
+                    pulled = await asyncio.wait_for(
+                        asyncio.to_thread(_pull_blocking, client, image, emit),
+                        timeout=CONTAINER_PULL_TIMEOUT,
+                    )
+                finally:
+                    queue.put_nowait(None)
+                    await dispatcher
+                already_current = pulled.pop("already_current")
+                result.update(pulled, status="up_to_date" if already_current else "pulled")
+        except Exception as e:
+            logger.warning("Image pull failed", host_id=host_id, image=image, error=str(e))
+            result.update(status="failed", error=str(e))
+
+    result["duration_seconds"] = round(time.monotonic() - started, 2)
+    return result
+
+
+async def pull_image(
+    host_id: str,
+    client: docker.DockerClient,
+    image: str,
+    on_progress: ProgressCallback | None = None,
+    skip_if_current: bool = False,
+) -> dict[str, Any]:
+    """Pull an image on a host, joining a pull of the same image that is already running.
+
+    Concurrent requests for the same (host, image) share one pull and all receive
+    its progress events and result. Pulls are bounded per host by
+    IMAGE_PULL_PER_HOST_PARALLEL.
+
+    Args:
+        host_id: ID of the Docker host
+        client: Docker client for the host
+        image: Image reference
+        on_progress: Awaited with each layer progress event
+        skip_if_current: Skip the pull when the local digest matches the registry
+
+    Returns:
+        Dict with image, status (pulled, up_to_date or failed), duration_seconds,
+        bytes_downloaded, joined (True if an existing pull was reused) and error on
+        failure
+    """
+    key = (host_id, image)
+    flight = _inflight_pulls.get(key)
+    joined = flight is not None
+    if flight is None:
+        flight = _inflight_pulls[key] = _PullFlight()
+        flight.task = asyncio.create_task(
+            _run_flight(host_id, client, image, flight, skip_if_current)
+        )
+        flight.task.add_done_callback(lambda _: _inflight_pulls.pop(key, None))
+
+    if on_progress is not None:
+        flight.listeners.append(on_progress)
+    try:
+        # Shielded so one caller giving up does not cancel the pull for the others
+        result = await asyncio.shield(flight.task)
+    finally:
+        if on_progress in flight.listeners:
+            flight.listeners.remove(on_progress)
+
+    if joined:
+        logger.debug("Joined in-flight image pull", host_id=host_id, image=image)
+    return {**result, "joined": joined}
+
+
+async def prepull_images(
+    host_id: str,
+    client: docker.DockerClient,
+    images: list[str],
+    on_progress: ProgressCallback | None = None,
+) -> dict[str, Any]:
+    """Pull images on a host concurrently, bounded by IMAGE_PULL_PER_HOST_PARALLEL.
+
+    ``on_progress`` receives the layer progress events of every image.
+
+    Returns:
+        Per-image results plus pulled/up_to_date/failed counts, total bytes
+        downloaded and wall-clock duration
+    """
+    started = time.monotonic()
+    results = await asyncio.gather(
+        *(
+            pull_image(host_id, client, image, on_progress, skip_if_current=True)
+            for image in dict.fromkeys(images)
+        )
+    )
+    summary: dict[str, Any] = {
+        status: sum(1 for result in results if result["status"] == status)
+        for status in ("pulled", "up_to_date", "failed")
+    }
+    summary["bytes_downloaded"] = sum(result["bytes_downloaded"] for result in results)
+    summary["duration_seconds"] = round(time.monotonic() - started, 2)
+
+    logger.info("Image pre-pull completed", host_id=host_id, images=len(results), **summary)
+    return {"images": list(results), **summary}
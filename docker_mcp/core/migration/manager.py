@@ -10,6 +10,7 @@ import structlog
 
 from ..config_loader import DockerHost
 from ..exceptions import DockerMCPError
+from ..progress import emit_progress
 from ..transfer import ArchiveUtils, ContainerizedRsyncTransfer, RsyncTransfer
 from .verification import MigrationVerifier
 from .volume_parser import VolumeParser
@@ -251,8 +252,15 @@ class MigrationManager:
         target_dirs_created: set[str] = set()
         ssh_cmd_target = self.rsync_transfer.build_ssh_cmd(target_host)
 
-        for source_path in source_paths:
+        bytes_transferred = 0
+        for index, source_path in enumerate(source_paths, start=1):
             normalized_source_path = self._normalize_source_path(source_path, source_host)
+            emit_progress(
+                "step",
+                f"Transferring {source_path} ({index}/{len(source_paths)})",
+                step="transfer_data",
+                path=source_path,
+            )
             try:
                 desired_target_path = (
                     path_mappings.get(source_path)
@@ -275,6 +283,15 @@ class MigrationManager:
 
                 result.setdefault("metadata", {})["original_source_path"] = source_path
                 transfer_results.append(result)
+                bytes_transferred += (result.get("stats") or {}).get("total_size", 0)
+                emit_progress(
+                    "transfer",
+                    f"Transferred {source_path} ({index}/{len(source_paths)})",
+                    path=source_path,
+                    paths_done=index,
+                    paths_total=len(source_paths),
+                    bytes_transferred=bytes_transferred,
+                )
                 if not result.get("success", False):
                     overall_success = False
 
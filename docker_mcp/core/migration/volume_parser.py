@@ -3,11 +3,13 @@
 import asyncio
 import shlex
 import subprocess
+from collections.abc import Mapping
 from typing import Any
 
 import structlog
 import yaml
 
+from ..compose_model import ComposeModel, get_compose_model
 from ..exceptions import DockerMCPError
 
 logger = structlog.get_logger()
@@ -26,12 +28,12 @@ class VolumeParser:
         self.logger = logger.bind(component="volume_parser")
 
     async def parse_compose_volumes(
-        self, compose_content: str, source_appdata_path: str = None
+        self, compose_content: str | ComposeModel, source_appdata_path: str = None
     ) -> dict[str, Any]:
         """Parse Docker Compose file to extract volume information.
 
         Args:
-            compose_content: Docker Compose YAML content
+            compose_content: Docker Compose YAML content or parsed compose model
             source_appdata_path: Source host's appdata path from hosts.yml for expanding ${APPDATA_PATH}
 
         Returns:
@@ -41,7 +43,7 @@ class VolumeParser:
             - volume_definitions: Volume configuration from compose
         """
         try:
-            compose_data = yaml.safe_load(compose_content)
+            compose_model = get_compose_model(compose_content)
 
             volumes_info = {
                 "named_volumes": [],
@@ -50,11 +52,11 @@ class VolumeParser:
             }
 
             # Extract top-level volume definitions
-            if "volumes" in compose_data:
-                volumes_info["volume_definitions"] = compose_data["volumes"]
+            if "volumes" in compose_model.document:
+                volumes_info["volume_definitions"] = compose_model.to_dict()["volumes"]
 
             # Parse service volumes using helper method
-            service_volumes = self._collect_service_volumes(compose_data, source_appdata_path)
+            service_volumes = self._collect_service_volumes(compose_model, source_appdata_path)
             volumes_info["named_volumes"].extend(service_volumes["named"])
             volumes_info["bind_mounts"].extend(service_volumes["bind"])
 
@@ -65,7 +67,7 @@ class VolumeParser:
             # Enhanced logging with detailed breakdown
             self.logger.info(
                 "Parsed compose volumes successfully",
-                total_services=len(compose_data.get("services", {})),
+                total_services=len(compose_model.services),
                 named_volumes_count=len(volumes_info["named_volumes"]),
                 bind_mounts_count=len(volumes_info["bind_mounts"]),
                 top_level_volumes=len(volumes_info["volume_definitions"]),
@@ -83,12 +85,12 @@ class VolumeParser:
             raise VolumeParsingError(f"Error extracting volumes: {e}") from e
 
     def _collect_service_volumes(
-        self, compose_data: dict[str, Any], source_appdata_path: str = None
+        self, compose_model: ComposeModel, source_appdata_path: str = None
     ) -> dict[str, list[str]]:
         """Collect and categorize volumes from all services.
 
         Args:
-            compose_data: Parsed Docker Compose YAML data
+            compose_model: Parsed Docker Compose model
             source_appdata_path: Source host's appdata path for variable expansion
 
         Returns:
@@ -96,18 +98,19 @@ class VolumeParser:
         """
         result = {"named": [], "bind": []}
 
-        services = compose_data.get("services", {})
+        services = compose_model.services
         services_with_volumes = 0
         volume_entries_processed = 0
 
-        for service_name, service_config in services.items():
-            if "volumes" not in service_config:
+        for service in services:
+            if not service.volumes:
                 continue
 
+            service_name = service.name
             services_with_volumes += 1
             service_volumes = {"named": 0, "bind": 0, "skipped": 0}
 
-            for volume in service_config["volumes"]:
+            for volume in service.volumes:
                 volume_entries_processed += 1
                 volume_info = self._normalize_volume_entry(volume, source_appdata_path)
 
@@ -177,7 +180,7 @@ class VolumeParser:
         """
         if isinstance(volume, str):
             return self._parse_volume_string(volume, source_appdata_path)
-        elif isinstance(volume, dict):
+        elif isinstance(volume, Mapping):
             if volume.get("type") == "volume":
                 return {
                     "type": "named",
@@ -0,0 +1,101 @@
+"""Progress events for long-running operations.
+
+A tracked operation installs its emitter for the duration of its task; code
+anywhere below it (deploy steps, image pulls, compose output, rsync transfers)
+reports through ``emit_progress`` without the emitter being passed down every
+call chain. Outside a tracked operation reporting is a no-op.
+"""
+
+import asyncio
+import subprocess
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# emit(event_type, message, **data)
+ProgressEmitter = Callable[..., None]
+
+_current_emitter: ContextVar[ProgressEmitter | None] = ContextVar(
+    "progress_emitter", default=None
+)
+
+
+def current_progress() -> ProgressEmitter | None:
+    """The emitter of the operation running in this context, if any.
+
+    Capture it before handing work to threads or shared tasks that run in
+    another context (e.g. a joined image pull).
+    """
+    return _current_emitter.get()
+
+
+def emit_progress(event_type: str, message: str, **data) -> None:
+    """Report a progress event for the operation running in this context, if any."""
+    emitter = _current_emitter.get()
+    if emitter is not None:
+        emitter(event_type, message, **data)
+
+
+@contextmanager
+def progress_scope(emitter: ProgressEmitter) -> Iterator[None]:
+    """Route emit_progress calls in this context (and tasks it starts) to ``emitter``."""
+    token = _current_emitter.set(emitter)
+    try:
+        yield
+    finally:
+        _current_emitter.reset(token)
+
+
+async def run_command_streaming(
+    cmd: list[str], on_line: Callable[[str, str], None], timeout: float
+) -> subprocess.CompletedProcess:
+    """Run a command like ``subprocess.run(capture_output=True, text=True)``.
+
+    Each non-empty output line is also passed to ``on_line(stream, line)`` on the
+    calling event loop as it arrives; ``\\r``-separated progress updates count as
+    lines.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than ``timeout``
+    """
+    loop = asyncio.get_running_loop()
+
+    def deliver(stream: str, line: str) -> None:
+        try:
+            loop.call_soon_threadsafe(on_line, stream, line)
+        except RuntimeError:
+            pass  # loop already closed during shutdown
+
+    def run() -> subprocess.CompletedProcess:
+        # Text mode translates "\r" to "\n", so progress redraws arrive as lines
+        process = subprocess.Popen(  # nosec B603
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        captured: dict[str, list[str]] = {"stdout": [], "stderr": []}
+
+        def pump(stream: str) -> None:
+            for line in getattr(process, stream):
+                captured[stream].append(line)
+                if line.strip():
+                    deliver(stream, line.strip())
+
+        readers = [
+            threading.Thread(target=pump, args=(stream,), daemon=True) for stream in captured
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join()
+        return subprocess.CompletedProcess(
+            cmd, process.returncode, "".join(captured["stdout"]), "".join(captured["stderr"])
+        )
+
+    return await asyncio.to_thread(run)
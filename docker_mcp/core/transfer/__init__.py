@@ -3,11 +3,13 @@
 from .archive import ArchiveUtils  # noqa: F401
 from .base import BaseTransfer  # noqa: F401
 from .containerized_rsync import ContainerizedRsyncTransfer  # noqa: F401
+from .image import ImageTransfer  # noqa: F401
 from .rsync import RsyncTransfer  # noqa: F401
 
 __all__ = [
     "BaseTransfer",
     "ArchiveUtils",
     "ContainerizedRsyncTransfer",
+    "ImageTransfer",
     "RsyncTransfer",
 ]
@@ -0,0 +1,147 @@
+"""Image transfer between hosts by streaming docker save into docker load."""
+
+import asyncio
+import shlex
+import subprocess
+import time
+from typing import Any
+
+import structlog
+
+from ..config_loader import DockerHost
+from ..exceptions import DockerMCPError
+from ..settings import ARCHIVE_TIMEOUT
+from .base import BaseTransfer
+
+logger = structlog.get_logger()
+
+
+class ImageTransferError(DockerMCPError):
+    """Image transfer operation failed."""
+
+    pass
+
+
+class ImageTransfer(BaseTransfer):
+    """Copy a Docker image host-to-host: docker save | zstd | ssh target docker load.
+
+    The pipeline runs on the source host, so image data never passes through the
+    machine running the MCP server and never touches disk on either host.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.logger = logger.bind(component="image_transfer")
+
+    def get_transfer_type(self) -> str:
+        """Get the name/type of this transfer method."""
+        return "image"
+
+    async def validate_requirements(self, host: DockerHost) -> tuple[bool, str]:
+        """Validate that docker and zstd are available on the host.
+
+        Args:
+            host: Host configuration to validate
+
+        Returns:
+            Tuple of (is_valid: bool, error_message: str)
+        """
+        check_cmd = self.build_ssh_cmd(host) + [
+            "for tool in docker zstd; do command -v $tool >/dev/null 2>&1 || echo $tool; done"
+        ]
+        try:
+            result = await asyncio.to_thread(
+                subprocess.run,  # nosec B603
+                check_cmd,
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=ARCHIVE_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired:
+            return False, f"Requirement check timed out after {ARCHIVE_TIMEOUT}s"
+        except Exception as e:
+            return False, f"Failed to check image transfer requirements: {str(e)}"
+
+        if result.returncode != 0:
+            return False, f"Could not reach {host.hostname}: {(result.stderr or '').strip()[:200]}"
+        if missing := result.stdout.split():
+            return False, f"{', '.join(missing)} not available on host {host.hostname}"
+        return True, ""
+
+    async def transfer(
+        self,
+        source_host: DockerHost,
+        target_host: DockerHost,
+        source_path: str,
+        target_path: str = "",
+        compression_level: int = 3,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Stream an image from the source host into the target host's Docker engine.
+
+        Args:
+            source_host: Host that has the image
+            target_host: Host to load the image on
+            source_path: Image reference to transfer
+            target_path: Unused (images are loaded into the engine)
+            compression_level: zstd compression level
+            **kwargs: Additional options (ignored)
+
+        Returns:
+            Transfer result with the docker load output and duration
+        """
+        image = source_path
+
+        # SSH from the source host to the target, mirroring RsyncTransfer's nested options
+        target_user = (target_host.user or "root").strip() or "root"
+        nested_ssh = ["ssh", "-o", "BatchMode=yes"]
+        if target_host.identity_file:
+            nested_ssh.extend(["-i", target_host.identity_file])
+        if target_host.port and target_host.port != 22:
+            nested_ssh.extend(["-p", str(target_host.port)])
+        nested_ssh.extend([f"{target_user}@{target_host.hostname}", "zstd -dc | docker load"])
+
+        pipeline = (
+            f"docker save {shlex.quote(image)} "
+            f"| zstd -T0 -{int(compression_level)} -c "
+            f"| {shlex.join(nested_ssh)}"
+        )
+        transfer_cmd = self.build_ssh_cmd(source_host) + [pipeline]
+
+        self.logger.info(
+            "Starting image transfer",
+            image=image,
+            source_host=source_host.hostname,
+            target_host=target_host.hostname,
+        )
+
+        started = time.monotonic()
+        try:
+            result = await asyncio.to_thread(
+                subprocess.run,  # nosec B603
+                transfer_cmd,
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=ARCHIVE_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired as e:
+            raise ImageTransferError(f"Image transfer timed out after {ARCHIVE_TIMEOUT}s") from e
+
+        # docker load prints "Loaded image: ..." only when the stream arrived intact
+        if result.returncode != 0 or "Loaded image" not in result.stdout:
+            detail = (result.stderr or result.stdout or "")[:500]
+            raise ImageTransferError(
+                f"Image transfer failed (exit {result.returncode}): {detail.strip()}"
+            )
+
+        return {
+            "success": True,
+            "transfer_type": "image",
+            "image": image,
+            "source_host": source_host.hostname,
+            "target_host": target_host.hostname,
+            "duration_seconds": round(time.monotonic() - started, 2),
+            "output": result.stdout.strip(),
+        }
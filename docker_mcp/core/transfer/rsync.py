@@ -1,20 +1,32 @@
 """Rsync transfer implementation for file synchronization between hosts."""
 
 import asyncio
+import os
 import re
 import shlex
 import subprocess
+import time
+from collections.abc import Callable
 from typing import Any
 
 import structlog
 
 from ..config_loader import DockerHost
 from ..exceptions import DockerMCPError
+from ..progress import ProgressEmitter, current_progress, run_command_streaming
 from ..settings import RSYNC_TIMEOUT
 from .base import BaseTransfer
 
 logger = structlog.get_logger()
 
+# Minimum interval between byte progress events during a transfer
+TRANSFER_PROGRESS_INTERVAL_SECONDS = float(os.getenv("TRANSFER_PROGRESS_INTERVAL_SECONDS", "1"))
+
+# rsync -P progress line, e.g. "  1,234,567  45%  10.00MB/s  0:00:10 (xfr#3, to-chk=5/10)"
+_PROGRESS_LINE = re.compile(
+    r"^([\d,]+)\s+(\d+)%.*?(?:\(xfe?r#(\d+), (?:to|ir)-chk=(\d+)/(\d+)\))?$"
+)
+
 
 class RsyncError(DockerMCPError):
     """Rsync transfer operation failed."""
@@ -148,15 +160,21 @@ class RsyncTransfer(BaseTransfer):
         )
 
         # Execute rsync with timeout
+        emitter = current_progress()
         try:
-            result = await asyncio.to_thread(
-                subprocess.run,  # nosec B603
-                rsync_cmd,
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=RSYNC_TIMEOUT,
-            )
+            if emitter is None:
+                result = await asyncio.to_thread(
+                    subprocess.run,  # nosec B603
+                    rsync_cmd,
+                    check=False,
+                    capture_output=True,
+                    text=True,
+                    timeout=RSYNC_TIMEOUT,
+                )
+            else:
+                result = await run_command_streaming(
+                    rsync_cmd, self._progress_reporter(emitter, source_path), RSYNC_TIMEOUT
+                )
         except subprocess.TimeoutExpired as e:
             raise RsyncError(f"Rsync timed out after {RSYNC_TIMEOUT}s") from e
 
@@ -184,6 +202,40 @@ class RsyncTransfer(BaseTransfer):
             "output": result.stdout,
         }
 
+    def _progress_reporter(
+        self, emitter: ProgressEmitter, source_path: str
+    ) -> Callable[[str, str], None]:
+        """Turn rsync -P progress lines into throttled "transfer" progress events."""
+        completed_bytes = 0
+        last_emit = 0.0
+
+        def on_line(stream: str, line: str) -> None:
+            nonlocal completed_bytes, last_emit
+            match = _PROGRESS_LINE.match(line) if stream == "stdout" else None
+            if match is None:
+                return
+            current = int(match.group(1).replace(",", ""))
+            transferred = completed_bytes + current
+            if match.group(3) is not None:
+                # File finished: its bytes now count towards the running total
+                completed_bytes = transferred
+            now = time.monotonic()
+            if now - last_emit < TRANSFER_PROGRESS_INTERVAL_SECONDS:
+                return
+            last_emit = now
+            event: dict[str, Any] = {
+                "path": source_path,
+                "bytes_transferred": transferred,
+                "file_percent": int(match.group(2)),
+            }
+            if match.group(3) is not None:
+                event["files_transferred"] = int(match.group(3))
+                event["files_remaining"] = int(match.group(4))
+                event["files_total"] = int(match.group(5))
+            emitter("transfer", f"{source_path}: {transferred:,} bytes transferred", **event)
+
+        return on_line
+
     def _parse_stats(self, output: str) -> dict[str, Any]:
         """Parse rsync output for transfer statistics.
 
@@ -54,6 +54,22 @@ class ContainerLogs(MCPModel):
     logs: list[str]
     timestamp: datetime = Field(description="Log retrieval timestamp in ISO 8601 format")
     truncated: bool = False
+    lines_scanned: int | None = Field(
+        default=None, description="Lines examined when filters were applied"
+    )
+    lines_matched: int | None = Field(default=None, description="Lines that matched the filters")
+    bytes_returned: int | None = Field(
+        default=None, description="Bytes of log data returned (before redaction)"
+    )
+    lines_dropped: int | None = Field(
+        default=None, description="Older lines dropped to stay within the line or byte budget"
+    )
+    lines_clipped: int | None = Field(
+        default=None, description="Oversized lines cut to the per-line byte limit"
+    )
+    truncated_by: str | None = Field(
+        default=None, description="Budget that cut the output: lines, bytes or scan_limit"
+    )
 
 
 class StackInfo(MCPModel):
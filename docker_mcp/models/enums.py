@@ -7,6 +7,7 @@ from typing import Literal
 ProtocolLiteral = Literal["tcp", "udp", "sctp"]
 CleanupType = Literal["check", "safe", "moderate", "aggressive"]
 ScheduleFrequency = Literal["daily", "weekly", "monthly", "custom"]
+StatsSortLiteral = Literal["cpu", "memory", "network", "block_io"]
 
 
 class HostAction(Enum):
@@ -34,6 +35,8 @@ class ContainerAction(Enum):
     LOGS = "logs"
     PULL = "pull"
     REMOVE = "remove"  # Added for test cleanup
+    TOP = "top"
+    DISTRIBUTE = "distribute"
 
 
 class ComposeAction(Enum):
@@ -51,6 +54,9 @@ class ComposeAction(Enum):
     PS = "ps"
     MIGRATE = "migrate"
     PULL = "pull"
+    ROLLOUT = "rollout"
+    FIND = "find"
+    STATUS = "status"
 
 
 # Removed unused Protocol enum; protocol strings are handled directly where needed.
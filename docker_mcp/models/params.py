@@ -7,7 +7,7 @@ from pydantic import Field, StringConstraints, computed_field, field_validator
 from .container import MCPModel
 
 # Import Enum types
-from .enums import ComposeAction, ContainerAction, HostAction
+from .enums import ComposeAction, ContainerAction, HostAction, StatsSortLiteral
 
 # Type aliases for string constraints
 DNSName = Annotated[
@@ -86,7 +86,10 @@ class DockerContainerParams(MCPModel):
 
     action: ContainerAction = Field(..., description="Action to perform")
     container_id: str = Field(default="", description="Container identifier")
-    image_name: str = Field(default="", description="Image name to pull (for pull action)")
+    image_name: str = Field(
+        default="",
+        description="Image name to pull (for pull action); comma-separate to pull several",
+    )
     all_containers: bool = Field(
         default=False, description="Include all containers (not just running ones)"
     )
@@ -94,8 +97,32 @@ class DockerContainerParams(MCPModel):
     offset: int = Field(default=0, ge=0, description="Number of results to skip")
     follow: bool = Field(default=False, description="Follow log output")
     lines: int = Field(default=100, ge=1, le=10000, description="Number of log lines to retrieve")
+    since: str | None = Field(
+        default=None, description="Only logs since this timestamp (e.g. 2024-01-01T00:00:00Z)"
+    )
+    grep: str | None = Field(default=None, description="Only log lines containing this text")
+    level: str | None = Field(
+        default=None, description="Only log lines at or above this level (e.g. warn, error)"
+    )
+    regex: str | None = Field(default=None, description="Only log lines matching this regex")
+    summarize: bool = Field(
+        default=False, description="Group log lines into counted patterns instead of raw lines"
+    )
+    max_bytes: int | None = Field(
+        default=None, ge=1024, description="Byte budget for returned log lines"
+    )
     force: bool = Field(default=False, description="Force the operation")
     timeout: int = Field(default=10, ge=1, le=300, description="Operation timeout in seconds")
+    sort_by: StatsSortLiteral = Field(
+        default="cpu", description="Ranking metric for top action (cpu, memory, network, block_io)"
+    )
+    selected_hosts: str | None = Field(
+        default=None,
+        description="Comma-separated target hosts for distribute (default: all enabled hosts)",
+    )
+    max_parallel: int | None = Field(
+        default=None, ge=1, le=64, description="Concurrent host-to-host transfers for distribute"
+    )
     host_id: str = Field(default="", description="Host identifier")
 
     @field_validator("action", mode="before")
@@ -141,8 +168,25 @@ class DockerComposeParams(MCPModel):
         return v
     pull_images: bool = Field(default=True, description="Pull images before deploying")
     recreate: bool = Field(default=False, description="Recreate containers")
+    force: bool = Field(
+        default=False, description="Deploy even if compose content and environment are unchanged"
+    )
     follow: bool = Field(default=False, description="Follow log output")
     lines: int = Field(default=100, ge=1, le=10000, description="Number of log lines to retrieve")
+    since: str | None = Field(
+        default=None, description="Only logs since this timestamp (e.g. 2024-01-01T00:00:00Z)"
+    )
+    grep: str | None = Field(default=None, description="Only log lines containing this text")
+    level: str | None = Field(
+        default=None, description="Only log lines at or above this level (e.g. warn, error)"
+    )
+    regex: str | None = Field(default=None, description="Only log lines matching this regex")
+    summarize: bool = Field(
+        default=False, description="Group log lines into counted patterns instead of raw lines"
+    )
+    service_name: str = Field(
+        default="", description="Limit logs to one compose service (all of its replicas)"
+    )
     dry_run: bool = Field(description="Perform a dry run without making changes (must be explicitly specified)")
     options: dict[str, str] | None = Field(
         default=None, description="Additional options for the operation"
@@ -153,6 +197,45 @@ class DockerComposeParams(MCPModel):
         default=False, description="Skip stopping source stack before migration"
     )
     start_target: bool = Field(default=True, description="Start target stack after migration")
+    targets: list[str] | None = Field(
+        default=None, description="Bulk lifecycle targets as 'host_id/stack_name' entries"
+    )
+    batches: list[list[str]] | None = Field(
+        default=None, description="Bulk lifecycle targets in dependency-ordered batches"
+    )
+    stack_pattern: str | None = Field(
+        default=None, description="Glob selecting stacks on host_id (or all enabled hosts)"
+    )
+    stop_on_failure: bool = Field(
+        default=False, description="Skip remaining bulk targets after the first failure"
+    )
+    max_parallel: int | None = Field(
+        default=None, ge=1, le=64, description="Bulk concurrency limit across all hosts"
+    )
+    per_host_parallel: int | None = Field(
+        default=None, ge=1, le=16, description="Bulk concurrency limit per host"
+    )
+    selected_hosts: str | None = Field(
+        default=None, description="Comma-separated hosts for rollout, in rollout order"
+    )
+    wave_size: int | None = Field(
+        default=None, ge=1, le=64, description="Hosts deployed together per rollout wave"
+    )
+    health_timeout: int | None = Field(
+        default=None,
+        ge=1,
+        le=3600,
+        description="Seconds each rollout wave may take to become healthy",
+    )
+    rollback: bool = Field(
+        default=True, description="Roll deployed hosts back when a rollout wave fails"
+    )
+    operation_id: str = Field(
+        default="", description="Operation ID of a tracked operation (status action)"
+    )
+    since_event: int = Field(
+        default=0, ge=0, description="Only progress events after this sequence number (status)"
+    )
     host_id: str = Field(default="", description="Host identifier")
 
     @field_validator("action", mode="before")
@@ -136,14 +136,15 @@ class StackListResource(FunctionResource):
 
     URI Pattern: stacks://{host_id}
     Returns a summary of compose projects discovered on the host including
-    services, status, and timestamps. Data comes from the stack service so it
-    reflects the same view exposed through tooling.
+    services, status, health, and timestamps. Reads are served from the stack
+    state cache, which follows Docker events; clients can subscribe to the URI
+    to be notified when a stack's status changes instead of polling.
     """
 
     def __init__(self, stack_service: "StackService"):
         async def _list_stacks(host_id: str) -> dict[str, Any]:
             try:
-                result = await stack_service.list_stacks(host_id)
+                result = await stack_service.list_stacks_cached(host_id)
                 data: dict[str, Any] = {}
 
                 if isinstance(result, ToolResult):
@@ -166,6 +167,8 @@ class StackListResource(FunctionResource):
                     "summary": summary,
                     "total_stacks": len(stacks) if isinstance(stacks, list) else 0,
                     "timestamp": data.get("timestamp"),
+                    "source": data.get("source"),
+                    "synced_at": data.get("synced_at"),
                 }
             except Exception as exc:
                 logger.error("Failed to list stacks", host_id=host_id, error=str(exc))
@@ -210,6 +213,7 @@ class StackDetailsResource(FunctionResource):
                     data = {"success": False, "error": "Unexpected stack detail payload"}
 
                 compose_content = data.get("compose_content", "")
+                live_state = stack_service.state_cache.get_stack_state(host_id, stack_name) or {}
 
                 return {
                     "success": bool(data.get("success", False) and compose_content),
@@ -218,6 +222,9 @@ class StackDetailsResource(FunctionResource):
                     "resource_uri": f"stacks://{host_id}/{stack_name}",
                     "resource_type": "stack_details",
                     "compose_content": compose_content,
+                    "status": live_state.get("status"),
+                    "containers": live_state.get("containers"),
+                    "health": live_state.get("health"),
                     "timestamp": data.get("timestamp"),
                     "error": data.get("error"),
                 }
@@ -6,10 +6,13 @@ across multiple remote hosts via SSH connections.
 """
 
 import argparse
+import asyncio
 import importlib
 import os
 import sys
 import tempfile
+import weakref
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 
@@ -23,7 +26,7 @@ from fastmcp import FastMCP
 from fastmcp.resources.resource import FunctionResource
 from fastmcp.resources.template import FunctionResourceTemplate
 from fastmcp.tools.tool import ToolResult
-from pydantic import Field
+from pydantic import AnyUrl, Field
 
 try:
     from .core.config_loader import DockerMCPConfig, load_config
@@ -78,12 +81,14 @@ try:
         ComposeAction,
         ContainerAction,
         HostAction,
+        StatsSortLiteral,
     )
 except ImportError:
     from docker_mcp.models.enums import (
         ComposeAction,
         ContainerAction,
         HostAction,
+        StatsSortLiteral,
     )
 
 
@@ -334,14 +339,17 @@ class DockerMCPServer:
 
         # Initialize service layer
         from .services.logs import LogsService
+        from .services.stack.tracker import StackOperationTracker
 
         self.logs_service: LogsService = LogsService(config, self.context_manager)
+        # Shared so the status action can report container pulls as well as stack operations
+        self.operation_tracker = StackOperationTracker()
         self.host_service: HostService = HostService(config, self.context_manager)
         self.container_service: ContainerService = ContainerService(
-            config, self.context_manager, self.logs_service
+            config, self.context_manager, self.logs_service, self.operation_tracker
         )
         self.stack_service: StackService = StackService(
-            config, self.context_manager, self.logs_service
+            config, self.context_manager, self.logs_service, self.operation_tracker
         )
         self.config_service = ConfigService(config, self.context_manager)
         self.cleanup_service = CleanupService(config)
@@ -435,6 +443,112 @@ class DockerMCPServer:
         # Register MCP resources for data access (complement tools with clean URI-based data retrieval)
         self._register_resources()
 
+        # Let clients subscribe to stacks:// resources instead of polling them
+        self._register_resource_subscriptions()
+
+        # Serve follow-mode log streams over the HTTP transport
+        self._register_log_stream_route()
+
+    def _register_resource_subscriptions(self) -> None:
+        """Handle resources/subscribe for stacks:// URIs and push resources/updated.
+
+        Subscribing starts the stack state cache for the host; every aggregate
+        status change of a stack notifies subscribers of ``stacks://{host_id}``
+        and ``stacks://{host_id}/{stack_name}``.
+        """
+        mcp_server = getattr(self.app, "_mcp_server", None)
+        if mcp_server is None:
+            self.logger.warning("Low-level MCP server not found; resource subscriptions disabled")
+            return
+
+        subscriptions: dict[str, weakref.WeakSet] = {}
+
+        @mcp_server.subscribe_resource()
+        async def _subscribe(uri: AnyUrl) -> None:
+            uri_str = str(uri)
+            subscriptions.setdefault(uri_str, weakref.WeakSet()).add(
+                mcp_server.request_context.session
+            )
+            if uri_str.startswith("stacks://"):
+                host_id = uri_str.removeprefix("stacks://").split("/", 1)[0]
+                if host_id in self.config.hosts:
+                    self.stack_service.state_cache.ensure_watching(host_id)
+
+        @mcp_server.unsubscribe_resource()
+        async def _unsubscribe(uri: AnyUrl) -> None:
+            sessions = subscriptions.get(str(uri))
+            if sessions is not None:
+                sessions.discard(mcp_server.request_context.session)
+
+        self.stack_service.state_cache.add_listener(self._stack_change_notifier(subscriptions))
+        self._advertise_resource_subscribe(mcp_server)
+
+    def _stack_change_notifier(
+        self, subscriptions: dict[str, Any]
+    ) -> Callable[[str, str, str | None, str | None], Awaitable[None]]:
+        """State cache listener that sends resources/updated to stacks:// subscribers."""
+
+        async def notify(
+            host_id: str, stack_name: str, old_status: str | None, new_status: str | None
+        ) -> None:
+            for uri in (f"stacks://{host_id}", f"stacks://{host_id}/{stack_name}"):
+                for session in list(subscriptions.get(uri, ())):
+                    try:
+                        await session.send_resource_updated(AnyUrl(uri))
+                    except Exception as e:
+                        self.logger.debug("Dropping resource subscriber", uri=uri, error=str(e))
+                        subscriptions[uri].discard(session)
+
+        return notify
+
+    def _advertise_resource_subscribe(self, mcp_server: Any) -> None:
+        """Report ``resources.subscribe: true`` in the server capabilities.
+
+        The low-level server hardcodes ``subscribe=False`` even when a subscribe
+        handler is registered, and spec-compliant clients never subscribe then.
+        There is no supported hook for this, so fastmcp and mcp are pinned to the
+        minor versions this override is tested against (tests/test_server_capabilities.py).
+        """
+        get_capabilities = getattr(mcp_server, "get_capabilities", None)
+        if get_capabilities is None:
+            self.logger.warning("Cannot advertise resource subscriptions: get_capabilities missing")
+            return
+
+        def _get_capabilities(*args: Any, **kwargs: Any) -> Any:
+            capabilities = get_capabilities(*args, **kwargs)
+            if capabilities.resources is not None:
+                capabilities.resources = capabilities.resources.model_copy(
+                    update={"subscribe": True}
+                )
+            return capabilities
+
+        mcp_server.get_capabilities = _get_capabilities
+
+    def _register_log_stream_route(self) -> None:
+        """Register the SSE endpoint for streams created by container logs follow mode."""
+        if self.app is None:
+            return
+
+        from starlette.requests import Request
+        from starlette.responses import JSONResponse, Response, StreamingResponse
+
+        @self.app.custom_route("/streams/logs/{stream_id}", methods=["GET"])
+        async def stream_logs(request: Request) -> Response:
+            stream_id = request.path_params["stream_id"]
+            stream = self.logs_service.open_log_stream(stream_id)
+            if stream is None:
+                return JSONResponse(
+                    {"success": False, "error": f"Log stream '{stream_id}' not found or expired"},
+                    status_code=404,
+                )
+            # Starlette cancels the generator when the client disconnects, which
+            # releases the host stream slot and closes the Docker log connection
+            return StreamingResponse(
+                stream,
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
     def _setup_test_compatibility(self) -> None:
         """Set up test compatibility wrapper for list_tools."""
         if self.app is None:
@@ -1083,7 +1197,9 @@ class DockerMCPServer:
         self,
         action: Annotated[str | ContainerAction, Field(description="Action to perform")],
         container_id: Annotated[str, Field(default="", description="Container identifier")] = "",
-        image_name: Annotated[str, Field(default="", description="Image name for pull action")] = "",
+        image_name: Annotated[
+            str, Field(default="", description="Image name(s) for pull action, comma-separated")
+        ] = "",
         all_containers: Annotated[
             bool, Field(default=False, description="Include all containers, not just running")
         ] = False,
@@ -1095,10 +1211,42 @@ class DockerMCPServer:
         lines: Annotated[
             int, Field(default=100, ge=1, le=10000, description="Number of log lines to retrieve")
         ] = 100,
+        since: Annotated[
+            str | None,
+            Field(default=None, description="Only logs since this timestamp (ISO 8601)"),
+        ] = None,
+        grep: Annotated[
+            str | None, Field(default=None, description="Only log lines containing this text")
+        ] = None,
+        level: Annotated[
+            str | None,
+            Field(default=None, description="Only log lines at or above this level (warn, error)"),
+        ] = None,
+        regex: Annotated[
+            str | None, Field(default=None, description="Only log lines matching this regex")
+        ] = None,
+        summarize: Annotated[
+            bool, Field(default=False, description="Summarize logs as counted line patterns")
+        ] = False,
+        max_bytes: Annotated[
+            int | None,
+            Field(default=None, ge=1024, description="Byte budget for returned log lines"),
+        ] = None,
         force: Annotated[bool, Field(default=False, description="Force the operation")] = False,
         timeout: Annotated[
             int, Field(default=10, ge=1, le=300, description="Operation timeout in seconds")
         ] = 10,
+        sort_by: Annotated[
+            StatsSortLiteral,
+            Field(default="cpu", description="Ranking metric for top action"),
+        ] = "cpu",
+        selected_hosts: Annotated[
+            str, Field(default="", description="Comma-separated target hosts for distribute")
+        ] = "",
+        max_parallel: Annotated[
+            int | None,
+            Field(default=None, ge=1, le=64, description="Concurrent transfers for distribute"),
+        ] = None,
         host_id: Annotated[str, Field(default="", description="Host identifier")] = "",
     ) -> ToolResult | dict[str, Any]:
         """Consolidated Docker container management tool.
@@ -1129,10 +1277,23 @@ class DockerMCPServer:
 
         • logs: Get container logs
           - Required: container_id, host_id
-          - Optional: follow, lines
+          - Optional: follow, lines, since, grep, level, regex, max_bytes, summarize
+          - A comma-separated container_id merges several containers by timestamp
 
-        • pull: Pull a container image
+        • pull: Pull one or more container images
           - Required: image_name, host_id
+          - A comma-separated image_name pulls several images concurrently
+          - Concurrent pulls of the same image on a host share one download
+          - Returns operation_id; layer progress is streamed as progress
+            notifications and available through docker_compose status
+
+        • top: Top resource consumers across all enabled hosts
+          - Optional: sort_by (cpu, memory, network, block_io), limit, timeout (per-host deadline)
+
+        • distribute: Pull an image once on host_id and copy it host-to-host to other hosts
+          - Required: image_name, host_id (seed host)
+          - Optional: selected_hosts (default: all enabled hosts), max_parallel
+          - Hosts that already have the image are skipped; needs zstd on every host
         """
         # Parse and validate parameters using the parameter model
         try:
@@ -1151,8 +1312,17 @@ class DockerMCPServer:
                 offset=offset,
                 follow=follow,
                 lines=lines,
+                since=since,
+                grep=grep,
+                level=level,
+                regex=regex,
+                summarize=summarize,
+                max_bytes=max_bytes,
                 force=force,
                 timeout=timeout,
+                sort_by=sort_by,
+                selected_hosts=selected_hosts or None,
+                max_parallel=max_parallel,
                 host_id=host_id,
             )
             # Use validated enum from parameter model
@@ -1166,7 +1336,9 @@ class DockerMCPServer:
 
         # Delegate to service layer for business logic
         return await self.container_service.handle_action(
-            action, **params.model_dump(exclude={"action"})
+            action,
+            progress_listener=self._mcp_progress_listener(),
+            **params.model_dump(exclude={"action"}),
         )
 
     async def docker_compose(
@@ -1183,10 +1355,33 @@ class DockerMCPServer:
             bool, Field(default=True, description="Pull images before deploying")
         ] = True,
         recreate: Annotated[bool, Field(default=False, description="Recreate containers")] = False,
+        force: Annotated[
+            bool, Field(default=False, description="Deploy even if nothing changed")
+        ] = False,
         follow: Annotated[bool, Field(default=False, description="Follow log output")] = False,
         lines: Annotated[
             int, Field(default=100, ge=1, le=10000, description="Number of log lines to retrieve")
         ] = 100,
+        since: Annotated[
+            str | None,
+            Field(default=None, description="Only logs since this timestamp (ISO 8601)"),
+        ] = None,
+        grep: Annotated[
+            str | None, Field(default=None, description="Only log lines containing this text")
+        ] = None,
+        level: Annotated[
+            str | None,
+            Field(default=None, description="Only log lines at or above this level (warn, error)"),
+        ] = None,
+        regex: Annotated[
+            str | None, Field(default=None, description="Only log lines matching this regex")
+        ] = None,
+        summarize: Annotated[
+            bool, Field(default=False, description="Summarize logs as counted line patterns")
+        ] = False,
+        service_name: Annotated[
+            str, Field(default="", description="Limit logs to one compose service")
+        ] = "",
         dry_run: Annotated[
             bool, Field(default=False, description="Perform a dry run without making changes")
         ] = False,
@@ -1206,6 +1401,50 @@ class DockerMCPServer:
         start_target: Annotated[
             bool, Field(default=True, description="Start target stack after migration")
         ] = True,
+        targets: Annotated[
+            list[str] | None,
+            Field(default=None, description="Bulk targets as 'host_id/stack_name' entries"),
+        ] = None,
+        batches: Annotated[
+            list[list[str]] | None,
+            Field(default=None, description="Bulk targets in dependency-ordered batches"),
+        ] = None,
+        stack_pattern: Annotated[
+            str | None,
+            Field(default=None, description="Glob selecting stacks for bulk operations or find"),
+        ] = None,
+        stop_on_failure: Annotated[
+            bool, Field(default=False, description="Stop a bulk operation at the first failure")
+        ] = False,
+        max_parallel: Annotated[
+            int | None,
+            Field(default=None, ge=1, le=64, description="Bulk concurrency limit overall"),
+        ] = None,
+        per_host_parallel: Annotated[
+            int | None,
+            Field(default=None, ge=1, le=16, description="Bulk concurrency limit per host"),
+        ] = None,
+        selected_hosts: Annotated[
+            str | None,
+            Field(default=None, description="Comma-separated hosts for rollout, in order"),
+        ] = None,
+        wave_size: Annotated[
+            int | None,
+            Field(default=None, ge=1, le=64, description="Hosts deployed per rollout wave"),
+        ] = None,
+        health_timeout: Annotated[
+            int | None,
+            Field(default=None, ge=1, le=3600, description="Seconds a rollout wave may take"),
+        ] = None,
+        rollback: Annotated[
+            bool, Field(default=True, description="Roll back hosts if a rollout wave fails")
+        ] = True,
+        operation_id: Annotated[
+            str, Field(default="", description="Operation ID to report on (status action)")
+        ] = "",
+        since_event: Annotated[
+            int, Field(default=0, ge=0, description="Only events after this sequence (status)")
+        ] = 0,
         host_id: Annotated[str, Field(default="", description="Host identifier")] = "",
     ) -> ToolResult | dict[str, Any]:
         """Consolidated Docker Compose stack management tool.
@@ -1219,11 +1458,36 @@ class DockerMCPServer:
 
         • deploy: Deploy a stack
           - Required: stack_name, compose_content, host_id
-          - Optional: environment, pull_images, recreate
+          - Optional: environment, pull_images, recreate, force
+          - Unchanged content + environment with all services running returns
+            "already up to date" without running compose (force to redeploy)
+
+        • rollout: Rolling deploy of one stack across hosts in waves
+          - Required: stack_name, compose_content, selected_hosts
+          - Optional: environment, pull_images, wave_size, health_timeout, rollback
+          - Each wave must be running and healthy before the next starts; a failed
+            wave stops the rollout and (with rollback) restores the previous compose
+            file on every host deployed so far
+
+        • status: Progress of a deploy, migrate, rollout, bulk run or image pull
+          - Optional: operation_id (omit to list recent operations), since_event
+          - deploy/migrate/rollout return operation_id and, when the client sends
+            a progress token, stream progress notifications (steps, image pull
+            layers, compose output, bytes transferred); if the call times out
+            the operation keeps running and status resumes from since_event
+
+        • find: Locate stacks across all hosts from the background fleet index
+          - Optional: stack_name (exact) or stack_pattern (glob); neither lists all
+          - deploy and migrate responses include duplicate_hosts when the index
+            knows the stack name on other hosts
 
         • up/down/restart/build/pull: Manage stack lifecycle
           - Required: stack_name, host_id
           - Optional: options
+          - Bulk: targets, batches or stack_pattern (with host_id, or all hosts)
+            instead of stack_name; optional stop_on_failure, max_parallel,
+            per_host_parallel. Batches run in order (reversed for down). Returns
+            operation_id; each target's result is a progress event
 
         • ps: List services in a stack
           - Required: stack_name, host_id
@@ -1232,9 +1496,9 @@ class DockerMCPServer:
         • discover: Discover compose paths on a host
           - Required: host_id
 
-        • logs: Get stack logs
+        • logs: Get stack logs (all stack containers merged by timestamp)
           - Required: stack_name, host_id
-          - Optional: follow, lines
+          - Optional: follow, lines, since, grep, level, regex, summarize, service_name
 
         • migrate: Migrate stack between hosts
           - Required: stack_name, target_host_id, host_id
@@ -1255,14 +1519,33 @@ class DockerMCPServer:
                 environment=environment or {},
                 pull_images=pull_images,
                 recreate=recreate,
+                force=force,
                 follow=follow,
                 lines=lines,
+                since=since,
+                grep=grep,
+                level=level,
+                regex=regex,
+                summarize=summarize,
+                service_name=service_name,
                 dry_run=dry_run,
                 options=options or {},
                 target_host_id=target_host_id,
                 remove_source=remove_source,
                 skip_stop_source=skip_stop_source,
                 start_target=start_target,
+                targets=targets,
+                batches=batches,
+                stack_pattern=stack_pattern,
+                stop_on_failure=stop_on_failure,
+                max_parallel=max_parallel,
+                per_host_parallel=per_host_parallel,
+                selected_hosts=selected_hosts,
+                wave_size=wave_size,
+                health_timeout=health_timeout,
+                rollback=rollback,
+                operation_id=operation_id,
+                since_event=since_event,
                 host_id=host_id,
             )
             # Use validated enum from parameter model
@@ -1276,9 +1559,32 @@ class DockerMCPServer:
 
         # Delegate to service layer for business logic
         return await self.stack_service.handle_action(
-            action, **params.model_dump(exclude={"action"})
+            action,
+            progress_listener=self._mcp_progress_listener(),
+            **params.model_dump(exclude={"action"}),
         )
 
+    def _mcp_progress_listener(self) -> Callable[[dict[str, Any]], Awaitable[None]] | None:
+        """Forward operation progress events as MCP progress notifications.
+
+        Notifications are only sent when the client supplied a progress token;
+        the event sequence number is the (monotonic) progress value.
+        """
+        try:
+            from fastmcp.server.dependencies import get_context
+
+            ctx = get_context()
+        except Exception:
+            return None
+
+        async def report(event: dict[str, Any]) -> None:
+            await ctx.report_progress(
+                progress=event["seq"],
+                message=f"[{event['operation_id']}] {event['type']}: {event['message']}",
+            )
+
+        return report
+
     async def add_docker_host(
         self,
         host_id: str,
@@ -1403,10 +1709,11 @@ class DockerMCPServer:
         environment: dict[str, str] | None = None,
         pull_images: bool = True,
         recreate: bool = False,
+        force: bool = False,
     ) -> ToolResult:
         """Deploy a Docker Compose stack to a remote host."""
         return await self.stack_service.deploy_stack(
-            host_id, stack_name, compose_content, environment, pull_images, recreate
+            host_id, stack_name, compose_content, environment, pull_images, recreate, force
         )
 
     async def manage_stack(
@@ -1454,6 +1761,9 @@ class DockerMCPServer:
         self.host_service.config = new_config
         self.container_service.config = new_config
         self.stack_service.config = new_config
+        self.stack_service.fleet_index.config = new_config
+        # Close every event stream; hosts still configured are re-watched from a fresh snapshot
+        self.stack_service.state_cache.reload(new_config)
         self.config_service.config = new_config
         self.cleanup_service.config = new_config
 
@@ -1493,19 +1803,27 @@ class DockerMCPServer:
                 port=self.config.server.port,
             )
 
-            # FastMCP.run() is synchronous and manages its own event loop
             if self.app is None:
                 raise RuntimeError("FastMCP app not initialized")
-            self.app.run(
-                transport="http",
-                host=self.config.server.host,
-                port=self.config.server.port,
-            )
+            asyncio.run(self._serve())
 
         except Exception as e:
             self.logger.error("Server startup failed", error=str(e))
             raise
 
+    async def _serve(self) -> None:
+        """Serve over HTTP, then stop background work (event streams, index refresh)."""
+        if self.app is None:
+            raise RuntimeError("FastMCP app not initialized")
+        try:
+            await self.app.run_async(
+                transport="http",
+                host=self.config.server.host,
+                port=self.config.server.port,
+            )
+        finally:
+            await self.stack_service.stop()
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -16,9 +16,14 @@ from mcp.types import TextContent
 
 from ..constants import CONTAINER_ID, HOST_ID
 from ..core.config_loader import DockerMCPConfig
+from ..core.image_pull import ProgressCallback
+from ..core.progress import current_progress
+from ..models.enums import ContainerAction
 from ..tools.containers import ContainerTools
-from ..utils import validate_host
+from ..utils import format_size, validate_host
+from .image_distribution import IMAGE_DISTRIBUTION_MAX_PARALLEL, ImageDistributionService
 from .logs import LogsService
+from .stack.tracker import ProgressListener, StackOperationTracker
 
 
 class ContainerService:
@@ -29,11 +34,14 @@ class ContainerService:
         config: DockerMCPConfig,
         context_manager: "DockerContextManager",
         logs_service: LogsService | None = None,
+        tracker: StackOperationTracker | None = None,
     ):
         self.config = config
         self.context_manager = context_manager
         self.container_tools = ContainerTools(config, context_manager)
         self.logs_service = logs_service or LogsService(config, context_manager)
+        self.image_distribution = ImageDistributionService(config, context_manager)
+        self.tracker = tracker or StackOperationTracker()
         self.logger = structlog.get_logger()
 
     def _build_error_response(
@@ -596,9 +604,10 @@ class ContainerService:
         message = result.get("message", "Image pulled successfully")
 
         # Extract useful information from result
+        data = result.get("data") or {}
         size = result.get("size", "")
-        digest = result.get("digest", "")
-        layers = result.get("layers", 0)
+        digest = result.get("digest", "") or data.get("digest", "")
+        layers = result.get("layers", 0) or data.get("layers", 0)
 
         formatted_lines = [
             f"✅ Image pull completed: {image_name}",
@@ -613,11 +622,70 @@ class ContainerService:
             formatted_lines.append(f"  → Layers: {layers}")
         if digest:
             formatted_lines.append(f"  → Digest: {digest}")
+        if "duration_seconds" in data:
+            formatted_lines.append(
+                f"  → Downloaded: {format_size(data.get('bytes_downloaded', 0))}"
+                f" in {data['duration_seconds']:.2f}s"
+            )
+        if data.get("joined"):
+            formatted_lines.append("  → Joined a pull already in progress on this host")
 
         formatted_lines.append("  ✓ Ready for use")
 
         return "\n".join(formatted_lines)
 
+    def _format_multi_pull(self, result: dict[str, Any], host_id: str) -> str:
+        """Format a multi-image pull as one line per image plus a summary."""
+        data = result.get("data") or {}
+        status_icons = {"pulled": "✅", "up_to_date": "✔️ ", "failed": "❌"}
+        formatted_lines = [
+            f"{'✅' if result.get('success') else '❌'} Image pull on {host_id}: "
+            f"{data.get('pulled', 0)} pulled, {data.get('up_to_date', 0)} up to date, "
+            f"{data.get('failed', 0)} failed "
+            f"({format_size(data.get('bytes_downloaded', 0))} "
+            f"in {data.get('duration_seconds', 0):.2f}s)",
+        ]
+        for image in data.get("images", []):
+            line = (
+                f"  {status_icons.get(image['status'], '❓')} {image['image']:<40} "
+                f"{format_size(image['bytes_downloaded']):>10} {image['duration_seconds']:>7.2f}s"
+            )
+            if image.get("joined"):
+                line += " (joined)"
+            if image.get("error"):
+                line += f" — {image['error']}"
+            formatted_lines.append(line)
+        return "\n".join(formatted_lines)
+
+    def _pull_progress_reporter(self) -> ProgressCallback:
+        """Report layer-level pull progress to the server log and the running operation.
+
+        The operation's emitter is captured here: layer events arrive from a pull
+        task that may have been started by another caller.
+        """
+        emitter = current_progress()
+
+        async def report(event: dict[str, Any]) -> None:
+            self.logger.info(
+                "Image pull progress",
+                host_id=event.get("host_id"),
+                image=event.get("image"),
+                layer=event.get("layer"),
+                status=event.get("status"),
+                percent=event.get("percent"),
+                downloaded_bytes=event.get("downloaded_bytes"),
+                total_bytes=event.get("total_bytes"),
+                overall_percent=event.get("overall_percent"),
+            )
+            if emitter is not None:
+                emitter(
+                    "pull",
+                    f"{event['image']} {event['layer']}: {event['status']} {event['percent']}%",
+                    **event,
+                )
+
+        return report
+
     def _format_pull_error(self, result: dict[str, Any], image_name: str, host_id: str) -> str:
         """Format image pull error with helpful context."""
         error_msg = result.get("message", result.get("error", "Unknown error"))
@@ -880,7 +948,10 @@ class ContainerService:
             )
 
     async def pull_image(self, host_id: str, image_name: str) -> ToolResult:
-        """Pull a Docker image on a remote host with enhanced progress indicators."""
+        """Pull a Docker image on a remote host with enhanced progress indicators.
+
+        A comma-separated image_name pulls every listed image concurrently.
+        """
         try:
             is_valid, error_msg = validate_host(self.config, host_id)
             if not is_valid:
@@ -889,11 +960,26 @@ class ContainerService:
                     structured_content={"success": False, "error": error_msg},
                 )
 
+            image_names = [name.strip() for name in image_name.split(",") if name.strip()]
+            if len(image_names) > 1:
+                result = await self.container_tools.pull_images(
+                    host_id, image_names, on_progress=self._pull_progress_reporter()
+                )
+                formatted_text = self._format_multi_pull(result, host_id)
+                result = dict(result)
+                result["formatted_output"] = formatted_text
+                return ToolResult(
+                    content=[TextContent(type="text", text=formatted_text)],
+                    structured_content=result,
+                )
+
             # Enhanced formatting for pull operation with progress indicators
             formatted_text = self._format_pull_progress(image_name, host_id, "starting")
 
             # Use container tools to pull image
-            result = await self.container_tools.pull_image(host_id, image_name)
+            result = await self.container_tools.pull_image(
+                host_id, image_name, on_progress=self._pull_progress_reporter()
+            )
 
             if result["success"]:
                 formatted_text = self._format_pull_success(result, image_name, host_id)
@@ -1244,9 +1330,6 @@ class ContainerService:
         This method consolidates all dispatcher logic from server.py into the service layer.
         """
         try:
-            # Import dependencies for this handler
-            from ..models.enums import ContainerAction
-
             # Extract common parameters
             host_id = params.get("host_id", "")
             container_id = params.get("container_id", "")
@@ -1256,8 +1339,19 @@ class ContainerService:
             offset = params.get("offset", 0)
             follow = params.get("follow", False)
             lines = params.get("lines", 100)
+            since = params.get("since")
+            max_bytes = params.get("max_bytes")
+            summarize = params.get("summarize", False)
+            log_filters = {
+                "grep": params.get("grep"),
+                "level": params.get("level"),
+                "regex": params.get("regex"),
+            }
             force = params.get("force", False)
             timeout = params.get("timeout", 10)
+            sort_by = params.get("sort_by", "cpu")
+            selected_hosts = params.get("selected_hosts", "")
+            max_parallel = params.get("max_parallel", IMAGE_DISTRIBUTION_MAX_PARALLEL)
 
             # Route to appropriate handler
             if action == ContainerAction.LIST:
@@ -1274,9 +1368,19 @@ class ContainerService:
                     action, host_id, container_id, force, timeout
                 )
             elif action == ContainerAction.LOGS:
-                return await self._handle_logs_action(host_id, container_id, lines, follow)
+                return await self._handle_logs_action(
+                    host_id, container_id, lines, follow, since, log_filters, max_bytes, summarize
+                )
             elif action == ContainerAction.PULL or (isinstance(action, str) and action == "pull"):
-                return await self._handle_pull_action(host_id, image_name or container_id)
+                return await self._handle_pull_action(
+                    host_id, image_name or container_id, params.get("progress_listener")
+                )
+            elif action == ContainerAction.TOP:
+                return await self._handle_top_action(sort_by, limit, timeout)
+            elif action == ContainerAction.DISTRIBUTE:
+                return await self._handle_distribute_action(
+                    host_id, image_name, selected_hosts, max_parallel
+                )
             else:
                 return self._handle_unknown_action(action)
 
@@ -1372,10 +1476,91 @@ class ContainerService:
             )
 
         result = await self.manage_container(host_id, container_id, action.value, force, timeout)
+        if action in (ContainerAction.RESTART, ContainerAction.REMOVE):
+            # Cached log tails belong to the previous run of the container
+            self.logs_service.invalidate_log_tail(host_id, container_id)
         return self._extract_structured_content(result)
 
+    def _unpack_logs_result(
+        self, logs_result: Any
+    ) -> tuple[list[str], bool, dict[str, Any], dict[str, Any]]:
+        """Return (logs, truncated, filter_stats, budget_stats) from a logs service result."""
+        logs: list[str] = []
+        truncated = False
+        filter_stats: dict[str, Any] = {}
+        budget_stats: dict[str, Any] = {}
+
+        if isinstance(logs_result, dict):
+            # Preferred shape: success response with payload under "data"
+            if isinstance(logs_result.get("data"), dict):
+                data = logs_result["data"]
+                logs = data.get("logs", []) or []
+                truncated = data.get("truncated", False)
+                filter_stats = {
+                    key: data[key] for key in ("lines_scanned", "lines_matched") if key in data
+                }
+                budget_keys = ("bytes_returned", "lines_dropped", "lines_clipped", "truncated_by")
+                budget_stats = {key: data[key] for key in budget_keys if key in data}
+            # Legacy shape: logs returned at the top level
+            elif "logs" in logs_result:
+                logs = logs_result.get("logs", []) or []
+                truncated = logs_result.get("truncated", False)
+
+        # Ensure we always return a list even if upstream gave us something unexpected
+        if not isinstance(logs, list):
+            logs = []
+        return logs, truncated, filter_stats, budget_stats
+
+    def _annotate_logs_text(
+        self,
+        formatted_text: str,
+        log_filters: dict[str, str | None] | None,
+        filter_stats: dict[str, Any],
+        budget_stats: dict[str, Any],
+    ) -> str:
+        """Prefix the filter match counts and append the output budget note."""
+        if filter_stats:
+            active = ", ".join(f"{k}={v}" for k, v in (log_filters or {}).items() if v)
+            formatted_text = (
+                f"🔎 Filter {active}: {filter_stats.get('lines_matched', 0)} of "
+                f"{filter_stats.get('lines_scanned', 0)} scanned lines matched\n{formatted_text}"
+            )
+        budget_note = self._format_log_budget_note(budget_stats)
+        if budget_note:
+            formatted_text = f"{formatted_text}\n{budget_note}"
+        return formatted_text
+
+    async def _attach_follow_stream(
+        self, response: dict[str, Any], host_id: str, container_id: str, since: str
+    ) -> None:
+        """Set up an SSE follow stream continuing from ``since`` and add it to the response."""
+        stream_result = await self.logs_service.stream_container_logs_setup(
+            host_id=host_id,
+            container_id=container_id,
+            follow=True,
+            tail=0,
+            since=since,
+        )
+        if stream_result.get("success"):
+            stream_data = stream_result.get("data", {})
+            response["stream"] = stream_data
+            response["formatted_output"] = (
+                f"{response['formatted_output']}\n\n📡 Follow stream (SSE): "
+                f"{stream_data.get('stream_endpoint')}"
+            )
+        else:
+            response["stream_error"] = stream_result.get("error")
+
     async def _handle_logs_action(
-        self, host_id: str, container_id: str, lines: int, follow: bool
+        self,
+        host_id: str,
+        container_id: str,
+        lines: int,
+        follow: bool,
+        since: str | None = None,
+        log_filters: dict[str, str | None] | None = None,
+        max_bytes: int | None = None,
+        summarize: bool = False,
     ) -> dict[str, Any]:
         """Handle container logs action."""
         if not host_id:
@@ -1405,37 +1590,51 @@ class ContainerService:
                 message="lines must be between 1 and 10000",
             )
 
+        if "," in container_id:
+            container_ids = [cid.strip() for cid in container_id.split(",") if cid.strip()]
+            return await self._handle_aggregated_logs(
+                host_id, container_ids, lines, since, log_filters, max_bytes, summarize
+            )
+
         try:
+            # Follow mode continues from here, so capture the cut-over point first
+            stream_since = datetime.now(UTC).isoformat()
             logs_result = await self.logs_service.get_container_logs(
                 host_id=host_id,
                 container_id=container_id,
                 lines=lines,
-                since=None,
-                timestamps=False,
+                since=since,
+                # Summaries report first/last occurrence by timestamp
+                timestamps=summarize,
+                max_bytes=max_bytes,
+                **(log_filters or {}),
             )
 
-            logs: list[str] = []
-            truncated = False
-
-            if isinstance(logs_result, dict):
-                # Preferred shape: success response with payload under "data"
-                if isinstance(logs_result.get("data"), dict):
-                    data = logs_result["data"]
-                    logs = data.get("logs", []) or []
-                    truncated = data.get("truncated", False)
-                # Legacy shape: logs returned at the top level
-                elif "logs" in logs_result:
-                    logs = logs_result.get("logs", []) or []
-                    truncated = logs_result.get("truncated", False)
-
-            # Ensure we always return a list even if upstream gave us something unexpected
-            if not isinstance(logs, list):
-                logs = []
-
-            # Enhanced logs formatting with better structure and visual indicators
-            formatted_text = self._format_container_logs(logs, container_id, host_id, lines, truncated)
+            if (
+                isinstance(logs_result, dict)
+                and logs_result.get("success") is False
+                and logs_result.get("error")
+            ):
+                logs_result.setdefault("formatted_output", f"❌ {logs_result['error']}")
+                return logs_result
+            logs, truncated, filter_stats, budget_stats = self._unpack_logs_result(logs_result)
+
+            summary: dict[str, Any] | None = None
+            if summarize:
+                summary = self.logs_service.summarize_logs(logs)
+                formatted_text = self.logs_service.format_log_summary(
+                    summary, f"Log summary for {container_id} on {host_id}"
+                )
+            else:
+                # Enhanced logs formatting with better structure and visual indicators
+                formatted_text = self._format_container_logs(
+                    logs, container_id, host_id, lines, truncated
+                )
+            formatted_text = self._annotate_logs_text(
+                formatted_text, log_filters, filter_stats, budget_stats
+            )
 
-            return {
+            response = {
                 "success": True,
                 "host_id": host_id,
                 "container_id": container_id,
@@ -1445,7 +1644,18 @@ class ContainerService:
                 "truncated": truncated,
                 "follow": follow,
                 "formatted_output": formatted_text,
+                **filter_stats,
+                **budget_stats,
             }
+            if summary is not None:
+                # The summary replaces the raw lines; summarize=False returns them
+                del response["logs"]
+                response["summary"] = summary
+
+            if follow:
+                await self._attach_follow_stream(response, host_id, container_id, stream_since)
+
+            return response
 
         except Exception as e:
             return self._build_error_response(
@@ -1456,8 +1666,77 @@ class ContainerService:
                 message="Failed to get container logs",
             )
 
-    async def _handle_pull_action(self, host_id: str, image_name: str) -> dict[str, Any]:
-        """Handle image pull action."""
+    async def _handle_aggregated_logs(
+        self,
+        host_id: str,
+        container_ids: list[str],
+        lines: int,
+        since: str | None,
+        log_filters: dict[str, str | None] | None = None,
+        max_bytes: int | None = None,
+        summarize: bool = False,
+    ) -> dict[str, Any]:
+        """Handle logs for several containers merged into one timestamp-ordered view."""
+        result = await self.logs_service.get_aggregated_logs(
+            host_id=host_id,
+            container_ids=container_ids,
+            lines=lines,
+            since=since,
+            max_bytes=max_bytes,
+            **(log_filters or {}),
+        )
+        if not result.get("success"):
+            result.setdefault(
+                "formatted_output", f"❌ {result.get('error', 'Failed to aggregate logs')}"
+            )
+            return result
+
+        data = result.get("data", {})
+        logs = data.get("logs", [])
+        formatted_lines = [
+            f"Merged logs: {len(container_ids)} containers on {host_id} ({len(logs)} lines)"
+        ]
+        for source in data.get("sources", []):
+            if source.get("error"):
+                formatted_lines.append(f"  ❌ {source['source']}: {source['error']}")
+        if data.get("truncated"):
+            formatted_lines.append(f"  ⚠️  Truncated by {data.get('truncated_by')} budget")
+        response = {
+            "success": True,
+            "container_ids": container_ids,
+            "lines_requested": lines,
+            **data,
+        }
+        if summarize:
+            summary = self.logs_service.summarize_logs(logs)
+            formatted_lines.append(
+                self.logs_service.format_log_summary(summary, "Merged log summary")
+            )
+            del response["logs"]
+            response["summary"] = summary
+        elif logs:
+            formatted_lines.append("")
+            formatted_lines.extend(logs)
+
+        response["formatted_output"] = "\n".join(formatted_lines)
+        return response
+
+    def _format_log_budget_note(self, budget_stats: dict[str, Any]) -> str:
+        """Describe byte-budget truncation and clipped lines, or return an empty string."""
+        notes = []
+        if budget_stats.get("truncated_by") == "bytes":
+            notes.append(
+                f"{budget_stats.get('lines_dropped', 0)} older lines dropped at the byte budget "
+                f"({format_size(budget_stats.get('bytes_returned', 0))} returned)"
+            )
+        if budget_stats.get("lines_clipped"):
+            notes.append(f"{budget_stats['lines_clipped']} oversized lines clipped")
+        return f"✂️  {'; '.join(notes)} (raise max_bytes for more)" if notes else ""
+
+    async def _handle_pull_action(
+        self, host_id: str, image_name: str, progress_listener: ProgressListener | None = None
+    ) -> dict[str, Any]:
+        """Handle image pull action as a tracked operation with layer progress events."""
         if not host_id:
             return self._build_error_response(
                 host_id="",
@@ -1475,8 +1754,131 @@ class ContainerService:
                 message="image_name is required for pull action",
             )
 
-        result = await self.pull_image(host_id, image_name)
-        return self._extract_structured_content(result)
+        async def pull() -> dict[str, Any]:
+            return self._extract_structured_content(await self.pull_image(host_id, image_name))
+
+        operation = self.tracker.start("pull", host_id=host_id, image=image_name)
+        return await self.tracker.run(operation, pull, progress_listener)
+
+    async def _handle_distribute_action(
+        self, host_id: str, image_name: str, selected_hosts: str, max_parallel: int
+    ) -> dict[str, Any]:
+        """Handle fleet image distribution from a seed host."""
+        if not host_id or not image_name:
+            return self._build_error_response(
+                host_id=host_id,
+                container_id=None,
+                action="distribute",
+                error=ValueError("host_id or image_name missing"),
+                message="host_id (seed host) and image_name are required for distribute action",
+            )
+
+        if selected_hosts:
+            target_host_ids = [h.strip() for h in selected_hosts.split(",") if h.strip()]
+        else:
+            target_host_ids = [
+                target for target, host in self.config.hosts.items() if host.enabled
+            ]
+        for target in [host_id, *target_host_ids]:
+            is_valid, error_msg = validate_host(self.config, target)
+            if not is_valid:
+                return {
+                    "success": False,
+                    "error": error_msg,
+                    "formatted_output": f"❌ {error_msg}",
+                }
+
+        try:
+            result = await self.image_distribution.distribute(
+                image_name, host_id, target_host_ids, max_parallel
+            )
+        except Exception as e:
+            self.logger.error(
+                "Image distribution failed", host_id=host_id, image_name=image_name, error=str(e)
+            )
+            result = {"success": False, "error": str(e)}
+
+        result["formatted_output"] = self._format_distribution(result, image_name)
+        return result
+
+    def _format_distribution(self, result: dict[str, Any], image_name: str) -> str:
+        """Format image distribution results per target host."""
+        if "summary" not in result:
+            return f"❌ Image distribution of {image_name} failed: {result.get('error')}"
+
+        summary = result["summary"]
+        seed = result.get("seed") or {}
+        lines = [
+            f"{'✅' if result['success'] else '⚠️ '} Distributed {image_name} from "
+            f"{result['seed_host_id']} ({seed.get('status', 'unknown')} in "
+            f"{seed.get('duration_seconds', 0):.2f}s): {summary['transferred']} transferred, "
+            f"{summary['skipped']} skipped, {summary['failed']} failed "
+            f"in {result.get('duration_seconds', 0):.2f}s",
+            "",
+        ]
+        status_icons = {"transferred": "✅", "skipped": "⏭️ ", "failed": "❌"}
+        for entry in result.get("results", []):
+            line = f"  {status_icons.get(entry['status'], '❓')} {entry['host_id']:<20}"
+            if entry.get("source"):
+                line += f" ← {entry['source']:<20}"
+            if "duration_seconds" in entry:
+                line += f" {entry['duration_seconds']:>7.2f}s"
+            if detail := entry.get("error") or entry.get("reason"):
+                line += f" {detail}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    async def _handle_top_action(self, sort_by: str, limit: int, timeout: int) -> dict[str, Any]:
+        """Handle fleet-wide top resource consumers action."""
+        result = await self.container_tools.get_fleet_top_containers(
+            sort_by=sort_by, limit=limit, host_timeout=float(timeout)
+        )
+        if not result.get("success"):
+            result["formatted_output"] = f"❌ {result.get('error', 'Failed to collect fleet stats')}"
+            return result
+
+        data = result.get("data", {})
+        formatted_text = "\n".join(self._format_fleet_top(data))
+        return {"formatted_output": formatted_text, "success": True, **data}
+
+    def _format_fleet_top(self, data: dict[str, Any]) -> list[str]:
+        """Format fleet-wide top containers table."""
+        containers = data.get("containers", [])
+        lines = [
+            f"Top {len(containers)} containers by {data.get('sort_by')} "
+            f"({data.get('hosts_responded', 0)}/{len(data.get('hosts_queried', []))} hosts responded, "
+            f"{data.get('containers_sampled', 0)} sampled)",
+            "",
+            f"  {'Host':<15} {'Container':<25} {'CPU%':>7} {'Memory':>10} {'Net I/O':>10} {'Block I/O':>10} {'Age':>6}",
+        ]
+        for entry in containers:
+            net = (entry.get("network_rx") or 0) + (entry.get("network_tx") or 0)
+            blk = (entry.get("block_read") or 0) + (entry.get("block_write") or 0)
+            name = entry.get("name") or entry.get("container_id", "")
+            lines.append(
+                f"  {entry.get('host_id', ''):<15} {name[:25]:<25} "
+                f"{entry.get('cpu_percentage') or 0.0:>6.1f}% "
+                f"{format_size(entry.get('memory_usage') or 0):>10} "
+                f"{format_size(net):>10} {format_size(blk):>10} "
+                f"{entry.get('sample_age_seconds', 0):>5.1f}s"
+            )
+
+        if timed_out := data.get("timed_out_hosts"):
+            lines.append("")
+            lines.append(f"⏱️  Timed out after {data.get('host_timeout')}s: {', '.join(timed_out)}")
+        if partial := data.get("partial_hosts"):
+            lines.append("")
+            lines.append(f"⏱️  Partial results after {data.get('host_timeout')}s:")
+            for host_id, counts in partial.items():
+                lines.append(
+                    f"  • {host_id}: {counts['sampled']}/{counts['containers']} containers sampled"
+                )
+        if failed := data.get("failed_hosts"):
+            lines.append("")
+            lines.append("❌ Failed hosts:")
+            for host_id, error in failed.items():
+                lines.append(f"  • {host_id}: {error}")
+        return lines
 
     def _handle_unknown_action(self, action) -> dict[str, Any]:
         """Handle unknown action."""
@@ -1493,6 +1895,8 @@ class ContainerService:
                 "remove",
                 "logs",
                 "pull",
+                "top",
+                "distribute",
             ],
             "formatted_output": formatted_text,
         }
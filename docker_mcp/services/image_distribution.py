@@ -0,0 +1,184 @@
+"""
+Image Distribution Service
+
+Rolls an image out to many hosts with a single registry pull: the image is
+pulled on a seed host and then streamed host-to-host, with every host that
+has received it becoming a source for the remaining ones.
+"""
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING, Any
+
+import docker
+import structlog
+
+from ..core.config_loader import DockerMCPConfig
+from ..core.image_pull import pull_image
+from ..core.transfer import ImageTransfer
+
+if TYPE_CHECKING:
+    from ..core.docker_context import DockerContextManager
+
+# Concurrent host-to-host image transfers across the whole fan-out
+IMAGE_DISTRIBUTION_MAX_PARALLEL = int(os.getenv("IMAGE_DISTRIBUTION_MAX_PARALLEL", "4"))
+
+
+class ImageDistributionService:
+    """Distribute an image from a seed host to other hosts in a tree fan-out."""
+
+    def __init__(self, config: DockerMCPConfig, context_manager: "DockerContextManager"):
+        self.config = config
+        self.context_manager = context_manager
+        self.image_transfer = ImageTransfer()
+        self.logger = structlog.get_logger()
+
+    async def distribute(
+        self,
+        image: str,
+        seed_host_id: str,
+        target_host_ids: list[str],
+        max_parallel: int = IMAGE_DISTRIBUTION_MAX_PARALLEL,
+    ) -> dict[str, Any]:
+        """Pull an image on the seed host and fan it out to the target hosts.
+
+        Each host sends to one target at a time and every host that receives the
+        image becomes a source, so the number of copies doubles per round (bounded
+        by ``max_parallel`` overall). Targets that already have the seed's image
+        under the same reference are skipped.
+
+        Args:
+            image: Image reference
+            seed_host_id: Host that pulls from the registry
+            target_host_ids: Hosts to receive the image
+            max_parallel: Maximum concurrent host-to-host transfers
+
+        Returns:
+            Per-host results plus a summary
+        """
+        started = time.monotonic()
+        targets = [
+            host_id for host_id in dict.fromkeys(target_host_ids) if host_id != seed_host_id
+        ]
+
+        client = await self.context_manager.get_client(seed_host_id)
+        if client is None:
+            return {
+                "success": False,
+                "error": f"Could not connect to Docker on seed host {seed_host_id}",
+            }
+        seed_pull = await pull_image(seed_host_id, client, image, skip_if_current=True)
+        if seed_pull["status"] == "failed":
+            return {
+                "success": False,
+                "error": f"Seed pull on {seed_host_id} failed: {seed_pull['error']}",
+                "seed": seed_pull,
+            }
+        image_id = await asyncio.to_thread(lambda: client.images.get(image).id)
+
+        present = await asyncio.gather(
+            *(self._has_image(host_id, image, image_id) for host_id in targets)
+        )
+        results: list[dict[str, Any]] = [
+            {"host_id": host_id, "status": "skipped", "reason": "image already present"}
+            for host_id, has_image in zip(targets, present, strict=True)
+            if has_image
+        ]
+        pending = [
+            host_id for host_id, has_image in zip(targets, present, strict=True) if not has_image
+        ]
+
+        # Hosts missing docker or zstd cannot take part in the pipeline
+        checks = await asyncio.gather(
+            *(
+                self.image_transfer.validate_requirements(self.config.hosts[host_id])
+                for host_id in [seed_host_id, *pending]
+            )
+        )
+        seed_ok, seed_error = checks[0]
+        if not seed_ok:
+            return {"success": False, "error": seed_error, "seed": seed_pull}
+        ready = []
+        for host_id, (ok, error) in zip(pending, checks[1:], strict=True):
+            if ok:
+                ready.append(host_id)
+            else:
+                results.append({"host_id": host_id, "status": "failed", "error": error})
+
+        results.extend(await self._fan_out(image, seed_host_id, ready, max_parallel))
+
+        summary = {
+            status: sum(1 for result in results if result["status"] == status)
+            for status in ("transferred", "skipped", "failed")
+        }
+        summary["total"] = len(results)
+        duration = round(time.monotonic() - started, 2)
+
+        self.logger.info(
+            "Image distribution completed",
+            image=image,
+            seed_host_id=seed_host_id,
+            duration_seconds=duration,
+            **summary,
+        )
+        return {
+            "success": summary["failed"] == 0,
+            "image": image,
+            "image_id": image_id,
+            "seed_host_id": seed_host_id,
+            "seed": seed_pull,
+            "summary": summary,
+            "results": results,
+            "duration_seconds": duration,
+        }
+
+    async def _has_image(self, host_id: str, image: str, image_id: str) -> bool:
+        """True if the host resolves the reference to the seed's image ID."""
+        try:
+            client = await self.context_manager.get_client(host_id)
+            if client is None:
+                return False
+            local = await asyncio.to_thread(client.images.get, image)
+            return local.id == image_id
+        except docker.errors.ImageNotFound:
+            return False
+        except Exception as e:
+            self.logger.debug("Image presence check failed", host_id=host_id, error=str(e))
+            return False
+
+    async def _fan_out(
+        self, image: str, seed_host_id: str, targets: list[str], max_parallel: int
+    ) -> list[dict[str, Any]]:
+        """Transfer to targets, recruiting each completed target as a new source."""
+        sources: asyncio.Queue[str] = asyncio.Queue()
+        sources.put_nowait(seed_host_id)
+        slots = asyncio.Semaphore(max_parallel)
+        results: list[dict[str, Any]] = []
+
+        async def send(source_host_id: str, target_host_id: str) -> None:
+            started = time.monotonic()
+            entry: dict[str, Any] = {"host_id": target_host_id, "source": source_host_id}
+            try:
+                await self.image_transfer.transfer(
+                    self.config.hosts[source_host_id],
+                    self.config.hosts[target_host_id],
+                    image,
+                )
+                entry["status"] = "transferred"
+                sources.put_nowait(target_host_id)
+            except Exception as e:
+                entry.update(status="failed", error=str(e))
+            finally:
+                entry["duration_seconds"] = round(time.monotonic() - started, 2)
+                results.append(entry)
+                sources.put_nowait(source_host_id)
+                slots.release()
+
+        tasks = []
+        for target_host_id in targets:
+            await slots.acquire()
+            source_host_id = await sources.get()
+            tasks.append(asyncio.create_task(send(source_host_id, target_host_id)))
+        await asyncio.gather(*tasks)
+        return results
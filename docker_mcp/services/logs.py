@@ -5,13 +5,14 @@ Thin service wrapper around LogTools to provide logs functionality from the
 service layer, enabling consistent dependency injection and future refactors.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 import structlog
 
 from ..core.config_loader import DockerMCPConfig
 from ..core.docker_context import DockerContextManager
-from ..tools.logs import LogTools
+from ..tools.logs import LogTools, summarize_log_lines
 
 
 class LogsService:
@@ -28,6 +29,10 @@ class LogsService:
         lines: int = 100,
         since: str | None = None,
         timestamps: bool = False,
+        grep: str | None = None,
+        level: str | None = None,
+        regex: str | None = None,
+        max_bytes: int | None = None,
     ) -> dict[str, Any]:
         """Fetch recent container logs using underlying tools implementation."""
         return await self._tools.get_container_logs(
@@ -36,6 +41,10 @@ class LogsService:
             lines=lines,
             since=since,
             timestamps=timestamps,
+            grep=grep,
+            level=level,
+            regex=regex,
+            max_bytes=max_bytes,
         )
 
     async def get_service_logs(
@@ -45,6 +54,11 @@ class LogsService:
         lines: int = 100,
         since: str | None = None,
         timestamps: bool = False,
+        grep: str | None = None,
+        level: str | None = None,
+        regex: str | None = None,
+        stack_name: str | None = None,
+        max_bytes: int | None = None,
     ) -> dict[str, Any]:
         """Fetch recent Docker Compose service logs using underlying tools implementation."""
         return await self._tools.get_service_logs(
@@ -53,4 +67,87 @@ class LogsService:
             lines=lines,
             since=since,
             timestamps=timestamps,
+            grep=grep,
+            level=level,
+            regex=regex,
+            stack_name=stack_name,
+            max_bytes=max_bytes,
         )
+
+    async def get_aggregated_logs(
+        self,
+        host_id: str,
+        container_ids: list[str] | None = None,
+        stack_name: str | None = None,
+        lines: int = 100,
+        since: str | None = None,
+        grep: str | None = None,
+        level: str | None = None,
+        regex: str | None = None,
+        max_bytes: int | None = None,
+    ) -> dict[str, Any]:
+        """Fetch logs from several containers or a whole stack, merged by timestamp."""
+        return await self._tools.get_aggregated_logs(
+            host_id=host_id,
+            container_ids=container_ids,
+            stack_name=stack_name,
+            lines=lines,
+            since=since,
+            grep=grep,
+            level=level,
+            regex=regex,
+            max_bytes=max_bytes,
+        )
+
+    async def stream_container_logs_setup(
+        self,
+        host_id: str,
+        container_id: str,
+        follow: bool = True,
+        tail: int = 100,
+        since: str | None = None,
+        timestamps: bool = False,
+    ) -> dict[str, Any]:
+        """Register a follow-mode log stream and return its HTTP endpoint."""
+        return await self._tools.stream_container_logs_setup(
+            host_id=host_id,
+            container_id=container_id,
+            follow=follow,
+            tail=tail,
+            since=since,
+            timestamps=timestamps,
+        )
+
+    def summarize_logs(self, log_lines: list[str]) -> dict[str, Any]:
+        """Group log lines into masked templates with counts and first/last occurrence."""
+        return summarize_log_lines(log_lines)
+
+    def format_log_summary(self, summary: dict[str, Any], title: str) -> str:
+        """Render a log summary as compact text, most frequent template first."""
+        lines = [
+            f"📊 {title}: {summary['lines_total']} lines → "
+            f"{summary['templates_total']} patterns"
+        ]
+        for group in summary["templates"]:
+            if group["count"] == 1:
+                # A one-off line says more verbatim than as a masked template
+                lines.append(f"{1:>7}× {group['exemplar']}")
+                continue
+            lines.append(f"{group['count']:>7}× {group['template']}")
+            lines.append(f"          first {group['first_seen']}, last {group['last_seen']}")
+            lines.append(f"          e.g. {group['exemplar']}")
+        if summary["other_lines"]:
+            lines.append(f"  … {summary['other_lines']} more lines in less frequent patterns")
+        lines.append("Use summarize=false for the raw log lines")
+        return "\n".join(lines)
+
+    def invalidate_log_tail(self, host_id: str, container_id: str | None = None) -> int:
+        """Drop cached log tails for a container or every container on a host."""
+        return self._tools.invalidate_log_tail(host_id, container_id)
+
+    def open_log_stream(self, stream_id: str) -> AsyncIterator[str] | None:
+        """Claim a registered stream and return its SSE generator, or None if unknown."""
+        stream_config = self._tools.claim_log_stream(stream_id)
+        if stream_config is None:
+            return None
+        return self._tools._stream_logs_generator(stream_config)
@@ -9,15 +9,25 @@ Refactored stack management into focused, single-responsibility modules:
 - volume_utils: Volume and mount handling utilities
 - migration_executor: Actual migration execution logic
 - migration_orchestrator: High-level migration coordination
+- bulk: Lifecycle actions across many stacks and hosts
+- state_cache: Event-sourced stack status per host
+- rolling: Health-gated rolling deploys across hosts
+- fleet_index: Stack name to hosts index across the fleet
+- tracker: Progress tracking for long-running operations
 
 The main StackService acts as a facade that delegates to these specialized modules.
 """
 
+from .bulk import StackBulkOperations
+from .fleet_index import FleetStackIndex
 from .migration_executor import StackMigrationExecutor
 from .migration_orchestrator import StackMigrationOrchestrator
 from .network import StackNetwork
 from .operations import StackOperations
 from .risk_assessment import StackRiskAssessment
+from .rolling import StackRollingDeploy
+from .state_cache import StackStateCache
+from .tracker import StackOperationTracker
 from .validation import StackValidation
 from .volume_utils import StackVolumeUtils
 
@@ -29,4 +39,9 @@ __all__ = [
     "StackVolumeUtils",
     "StackMigrationExecutor",
     "StackMigrationOrchestrator",
+    "StackBulkOperations",
+    "StackStateCache",
+    "StackRollingDeploy",
+    "FleetStackIndex",
+    "StackOperationTracker",
 ]
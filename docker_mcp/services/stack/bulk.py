@@ -0,0 +1,213 @@
+"""
+Stack Bulk Operations Module
+
+Runs lifecycle actions (up/down/restart/build/pull) across many stacks and hosts
+with global and per-host concurrency limits, dependency-ordered batches and
+optional stop-on-first-failure.
+"""
+
+import asyncio
+import fnmatch
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+
+from ...core.config_loader import DockerMCPConfig
+from ...tools.stacks import StackTools
+
+# Default concurrency limits for bulk lifecycle operations
+BULK_MAX_PARALLEL = int(os.getenv("BULK_MAX_PARALLEL", "8"))
+BULK_PER_HOST_PARALLEL = int(os.getenv("BULK_PER_HOST_PARALLEL", "2"))
+
+BULK_ACTIONS = frozenset({"up", "down", "restart", "build", "pull"})
+
+BulkTarget = tuple[str, str]
+ResultCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class StackBulkOperations:
+    """Lifecycle actions over many (host, stack) targets with bounded parallelism."""
+
+    def __init__(self, config: DockerMCPConfig, stack_tools: StackTools):
+        self.config = config
+        self.stack_tools = stack_tools
+        self.logger = structlog.get_logger()
+
+    def parse_targets(self, entries: list[str], default_host_id: str = "") -> list[BulkTarget]:
+        """Parse "host_id/stack_name" entries (bare stack names use the default host).
+
+        Raises:
+            ValueError: If an entry is malformed or names an unknown host
+        """
+        targets: list[BulkTarget] = []
+        for entry in entries:
+            host_id, _, stack_name = entry.strip().rpartition("/")
+            host_id = host_id or default_host_id
+            if not host_id or not stack_name:
+                raise ValueError(
+                    f"Invalid target '{entry}': use 'host_id/stack_name' or set host_id"
+                )
+            if host_id not in self.config.hosts:
+                raise ValueError(f"Host '{host_id}' not found (target '{entry}')")
+            targets.append((host_id, stack_name))
+        return targets
+
+    async def resolve_selector(self, pattern: str, host_ids: list[str]) -> list[BulkTarget]:
+        """Match a glob pattern against the stacks listed on each host.
+
+        Raises:
+            ValueError: If listing stacks fails on any host
+        """
+        listings = await asyncio.gather(
+            *(self.stack_tools.list_stacks(host_id) for host_id in host_ids)
+        )
+        targets: list[BulkTarget] = []
+        for host_id, listing in zip(host_ids, listings, strict=True):
+            if not listing.get("success"):
+                raise ValueError(
+                    f"Could not list stacks on {host_id}: {listing.get('error', 'unknown error')}"
+                )
+            targets.extend(
+                (host_id, stack["name"])
+                for stack in listing.get("stacks", [])
+                if fnmatch.fnmatchcase(stack["name"], pattern)
+            )
+        return targets
+
+    async def run(
+        self,
+        action: str,
+        batches: list[list[BulkTarget]],
+        options: dict[str, Any] | None = None,
+        max_parallel: int = BULK_MAX_PARALLEL,
+        per_host_parallel: int = BULK_PER_HOST_PARALLEL,
+        stop_on_failure: bool = False,
+        on_result: ResultCallback | None = None,
+    ) -> dict[str, Any]:
+        """Run a lifecycle action over batches of targets.
+
+        Batches run one after another; targets within a batch run concurrently,
+        bounded by ``max_parallel`` overall and ``per_host_parallel`` per host.
+        ``down`` walks the batches in reverse so dependents stop first. With
+        ``stop_on_failure`` targets that have not started when a failure is seen
+        are skipped; targets already running are allowed to finish.
+
+        Args:
+            action: Lifecycle action (up, down, restart, build, pull)
+            batches: Dependency-ordered batches of (host_id, stack_name) targets
+            options: Options passed to every manage_stack call
+            max_parallel: Global concurrency limit
+            per_host_parallel: Concurrency limit per host
+            stop_on_failure: Skip remaining targets after the first failure
+            on_result: Awaited with each target's result as soon as it completes
+
+        Returns:
+            Per-target results in completion order plus a summary
+        """
+        if action not in BULK_ACTIONS:
+            raise ValueError(
+                f"Bulk mode supports {', '.join(sorted(BULK_ACTIONS))}, not '{action}'"
+            )
+
+        ordered = list(reversed(batches)) if action == "down" else list(batches)
+        global_limit = asyncio.Semaphore(max_parallel)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+        stopped = asyncio.Event()
+        results: list[dict[str, Any]] = []
+
+        async def record(entry: dict[str, Any]) -> None:
+            results.append(entry)
+            if on_result is not None:
+                await on_result(entry)
+
+        async def run_target(batch_index: int, host_id: str, stack_name: str) -> None:
+            host_limit = host_limits.setdefault(host_id, asyncio.Semaphore(per_host_parallel))
+            # Take the host slot first so a busy host does not hold global slots idle
+            async with host_limit, global_limit:
+                if stopped.is_set():
+                    await record(self._skipped(batch_index, host_id, stack_name))
+                    return
+                started = time.monotonic()
+                outcome = await self._manage_target(host_id, stack_name, action, options)
+
+            entry = self._target_result(batch_index, host_id, stack_name, outcome, started)
+            if stop_on_failure and entry["status"] == "failed":
+                stopped.set()
+            await record(entry)
+
+        seen: set[BulkTarget] = set()
+        for batch_index, batch in enumerate(ordered, start=1):
+            unique = [target for target in batch if target not in seen]
+            seen.update(unique)
+            if stopped.is_set():
+                for host_id, stack_name in unique:
+                    await record(self._skipped(batch_index, host_id, stack_name))
+                continue
+            await asyncio.gather(
+                *(run_target(batch_index, host_id, stack_name) for host_id, stack_name in unique)
+            )
+
+        summary = {
+            status: sum(1 for entry in results if entry["status"] == status)
+            for status in ("succeeded", "failed", "skipped")
+        }
+        summary["total"] = len(results)
+
+        self.logger.info(
+            "Bulk stack operation completed",
+            action=action,
+            batches=len(ordered),
+            stopped_early=stopped.is_set(),
+            **summary,
+        )
+
+        return {
+            "success": summary["failed"] == 0 and summary["skipped"] == 0,
+            "action": action,
+            "batches": len(ordered),
+            "stopped_early": stopped.is_set(),
+            "summary": summary,
+            "results": results,
+        }
+
+    async def _manage_target(
+        self, host_id: str, stack_name: str, action: str, options: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        try:
+            return await self.stack_tools.manage_stack(
+                host_id, stack_name, action, dict(options or {})
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def _target_result(
+        self,
+        batch_index: int,
+        host_id: str,
+        stack_name: str,
+        outcome: dict[str, Any],
+        started: float,
+    ) -> dict[str, Any]:
+        succeeded = bool(outcome.get("success"))
+        entry: dict[str, Any] = {
+            "host_id": host_id,
+            "stack_name": stack_name,
+            "batch": batch_index,
+            "status": "succeeded" if succeeded else "failed",
+            "duration_seconds": round(time.monotonic() - started, 2),
+        }
+        if not succeeded:
+            entry["error"] = outcome.get("error") or outcome.get("output") or "unknown error"
+        return entry
+
+    def _skipped(self, batch_index: int, host_id: str, stack_name: str) -> dict[str, Any]:
+        return {
+            "host_id": host_id,
+            "stack_name": stack_name,
+            "batch": batch_index,
+            "status": "skipped",
+            "error": "Skipped after an earlier failure (stop_on_failure)",
+        }
@@ -0,0 +1,198 @@
+"""
+Fleet Stack Index Module
+
+Keeps an in-memory map of stack name to the hosts that run it (with compose file
+and status), so locating a stack or spotting a duplicate stack name is a memory
+lookup instead of a stack listing on every host. Hosts are re-listed in the
+background with bounded concurrency, each host's entries are replaced as soon as
+its own listing returns, and status changes seen by the stack state cache are
+applied between refreshes.
+"""
+
+import asyncio
+import fnmatch
+import os
+import time
+from datetime import datetime
+from typing import Any
+
+import structlog
+
+from ...core.config_loader import DockerMCPConfig
+from ...tools.stacks import StackTools
+from .state_cache import StackStateCache
+
+# Interval between background re-listings of every enabled host
+FLEET_INDEX_REFRESH_SECONDS = float(os.getenv("FLEET_INDEX_REFRESH_SECONDS", "60"))
+# Hosts listed concurrently during a refresh
+FLEET_INDEX_MAX_PARALLEL = int(os.getenv("FLEET_INDEX_MAX_PARALLEL", "4"))
+# How long a query waits for the first refresh before answering with what it has
+FLEET_INDEX_WAIT_SECONDS = float(os.getenv("FLEET_INDEX_WAIT_SECONDS", "15"))
+
+
+class FleetStackIndex:
+    """Stack name to hosts index across every enabled host."""
+
+    def __init__(
+        self, config: DockerMCPConfig, stack_tools: StackTools, state_cache: StackStateCache
+    ):
+        self.config = config
+        self.stack_tools = stack_tools
+        self.logger = structlog.get_logger()
+        # stack name -> host_id -> entry
+        self._stacks: dict[str, dict[str, dict[str, Any]]] = {}
+        self._hosts: dict[str, dict[str, Any]] = {}
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        state_cache.add_listener(self._on_status_change)
+
+    def ensure_refreshing(self) -> None:
+        """Start the background refresh loop if it is not running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def hosts_for(self, stack_name: str) -> list[str]:
+        """Hosts currently known to run ``stack_name`` (memory only, never blocks)."""
+        return sorted(self._stacks.get(stack_name, {}))
+
+    def record(
+        self,
+        host_id: str,
+        stack_name: str,
+        compose_file: str | None = None,
+        status: str | None = None,
+    ) -> None:
+        """Record a stack on a host right away, e.g. after a deploy."""
+        entry = self._stacks.setdefault(stack_name, {}).setdefault(
+            host_id, {"host_id": host_id, "compose_file": None, "status": "unknown", "services": []}
+        )
+        if compose_file:
+            entry["compose_file"] = compose_file
+        if status:
+            entry["status"] = status
+
+    def forget(self, host_id: str, stack_name: str) -> None:
+        """Remove a stack from a host right away, e.g. after ``down`` or a migration."""
+        hosts = self._stacks.get(stack_name)
+        if hosts is None:
+            return
+        hosts.pop(host_id, None)
+        if not hosts:
+            del self._stacks[stack_name]
+
+    async def find(self, stack_name: str = "", pattern: str | None = None) -> dict[str, Any]:
+        """Look up stacks by exact name, glob pattern, or list the whole index.
+
+        Waits up to FLEET_INDEX_WAIT_SECONDS for the first refresh; after that the
+        answer covers the hosts refreshed so far and ``complete`` is False.
+
+        Returns:
+            Matching stacks with their hosts, names deployed on more than one host,
+            and per-host refresh state
+        """
+        self.ensure_refreshing()
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=FLEET_INDEX_WAIT_SECONDS)
+        except TimeoutError:
+            pass
+
+        if stack_name:
+            names = [stack_name] if stack_name in self._stacks else []
+        elif pattern:
+            names = [name for name in self._stacks if fnmatch.fnmatchcase(name, pattern)]
+        else:
+            names = list(self._stacks)
+
+        stacks = {
+            name: [dict(self._stacks[name][host_id]) for host_id in sorted(self._stacks[name])]
+            for name in sorted(names)
+        }
+        return {
+            "success": True,
+            "stacks": stacks,
+            "duplicates": sorted(name for name, hosts in stacks.items() if len(hosts) > 1),
+            "hosts": {host_id: dict(state) for host_id, state in sorted(self._hosts.items())},
+            "complete": self._ready.is_set(),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    async def refresh(self) -> None:
+        """Re-list every enabled host, at most FLEET_INDEX_MAX_PARALLEL at a time."""
+        started = time.monotonic()
+        host_ids = [host_id for host_id, host in self.config.hosts.items() if host.enabled]
+        limit = asyncio.Semaphore(FLEET_INDEX_MAX_PARALLEL)
+
+        async def refresh_one(host_id: str) -> None:
+            async with limit:
+                await self.refresh_host(host_id)
+
+        await asyncio.gather(*(refresh_one(host_id) for host_id in host_ids))
+
+        # Forget hosts that were removed or disabled since the last refresh
+        for host_id in set(self._hosts) - set(host_ids):
+            self._drop_host(host_id)
+            del self._hosts[host_id]
+
+        self._ready.set()
+        self.logger.debug(
+            "Fleet stack index refreshed",
+            hosts=len(host_ids),
+            stacks=len(self._stacks),
+            duration_seconds=round(time.monotonic() - started, 2),
+        )
+
+    async def refresh_host(self, host_id: str) -> None:
+        """Replace one host's entries from a fresh stack listing.
+
+        On failure the host keeps its previous entries and the error is recorded.
+        """
+        result = await self.stack_tools.list_stacks(host_id)
+        state = self._hosts.setdefault(host_id, {"refreshed_at": None, "stacks": 0})
+        if not result.get("success"):
+            state["error"] = result.get("error", "stack listing failed")
+            self.logger.debug("Fleet index host refresh failed", host_id=host_id, **state)
+            return
+
+        self._drop_host(host_id)
+        for stack in result.get("stacks", []):
+            self._stacks.setdefault(stack["name"], {})[host_id] = {
+                "host_id": host_id,
+                "compose_file": stack.get("compose_file"),
+                "status": stack.get("status", "unknown"),
+                "services": stack.get("services", []),
+            }
+        state.update(
+            refreshed_at=datetime.now().isoformat(),
+            stacks=len(result.get("stacks", [])),
+            error=None,
+        )
+
+    def _drop_host(self, host_id: str) -> None:
+        for name in list(self._stacks):
+            self._stacks[name].pop(host_id, None)
+            if not self._stacks[name]:
+                del self._stacks[name]
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning("Fleet stack index refresh failed", error=str(e))
+            await asyncio.sleep(FLEET_INDEX_REFRESH_SECONDS)
+
+    async def _on_status_change(
+        self, host_id: str, stack_name: str, old_status: str | None, new_status: str | None
+    ) -> None:
+        """Apply a status change seen on a host's event stream (None: stack removed)."""
+        if new_status is None:
+            self.forget(host_id, stack_name)
+        else:
+            self.record(host_id, stack_name, status=new_status)
@@ -19,6 +19,7 @@ from ...core.backup import BackupInfo, BackupManager
 from ...core.config_loader import DockerHost, DockerMCPConfig
 from ...core.docker_context import DockerContextManager
 from ...core.migration.manager import MigrationManager
+from ...core.progress import emit_progress
 from ...tools.stacks import StackTools
 from ...utils import build_ssh_command
 
@@ -53,29 +54,18 @@ class StackMigrationExecutor:
                 host_id, stack_name
             )
 
-            # Build SSH command for source
-            source_host = self.config.hosts[host_id]
-            ssh_cmd_source = build_ssh_command(source_host)
-
-            # Read compose file
-            read_cmd = ssh_cmd_source + [f"cat {shlex.quote(compose_file_path)}"]
+            # Read compose file (cached per host and path, validated by remote stat)
             try:
-                result = await asyncio.to_thread(
-                    subprocess.run,  # nosec B603
-                    read_cmd,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=30,
+                compose_content = await self.stack_tools.compose_manager.read_compose_file(
+                    host_id, compose_file_path
                 )
             except subprocess.TimeoutExpired:
                 self.logger.error("Compose read timed out", host_id=host_id, stack_name=stack_name)
                 return False, "", compose_file_path
-
-            if result.returncode != 0:
+            except FileNotFoundError:
                 return False, "", compose_file_path
 
-            return True, result.stdout, compose_file_path
+            return True, compose_content, compose_file_path
 
         except Exception as e:
             self.logger.error(
@@ -452,6 +442,15 @@ class StackMigrationExecutor:
                 progress=f"{migration_context['completed_steps']}/{migration_context['total_steps']}"
             )
 
+            emit_progress(
+                "step",
+                f"{step_name}: {status}",
+                step=step_name,
+                status=status,
+                completed_steps=migration_context["completed_steps"],
+                total_steps=migration_context["total_steps"],
+            )
+
             # Call progress callback if provided
             if progress_callback:
                 try:
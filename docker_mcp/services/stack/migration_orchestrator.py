@@ -13,7 +13,9 @@ from structlog.stdlib import BoundLogger
 if TYPE_CHECKING:
     from docker_mcp.core.docker_context import DockerContextManager
 
+from ...core.compose_model import get_compose_model
 from ...core.config_loader import DockerHost, DockerMCPConfig
+from ...core.progress import emit_progress
 from ...utils import format_size
 from .migration_executor import StackMigrationExecutor
 from .network import StackNetwork
@@ -22,6 +24,12 @@ from .validation import StackValidation
 from .volume_utils import StackVolumeUtils
 
 
+def _record_step(migration_steps: list[str], step: str) -> None:
+    """Add a step to the migration log and report it as a progress event."""
+    _record_step(migration_steps, step)
+    emit_progress("step", step, step_number=len(migration_steps))
+
+
 class StackMigrationOrchestrator:
     """Orchestrates stack migrations between Docker hosts.
 
@@ -80,7 +88,7 @@ class StackMigrationOrchestrator:
         Returns:
             ToolResult with migration status and detailed results
         """
-        migration_steps = []
+        migration_steps: list[str] = []
         migration_data = {
             "source_host_id": source_host_id,
             "target_host_id": target_host_id,
@@ -184,7 +192,7 @@ class StackMigrationOrchestrator:
 
         source_host = self.config.hosts[source_host_id]
         target_host = self.config.hosts[target_host_id]
-        migration_steps.append("✅ Host validation completed")
+        _record_step(migration_steps, "✅ Host validation completed")
         return source_host, target_host
 
     async def _retrieve_and_validate_compose(
@@ -195,7 +203,7 @@ class StackMigrationOrchestrator:
         migration_data: dict[str, Any],
     ) -> ToolResult | tuple[str, str]:
         """Retrieve and validate compose file."""
-        migration_steps.append("📋 Retrieving compose configuration...")
+        _record_step(migration_steps, "📋 Retrieving compose configuration...")
         success, compose_content, compose_path = await self.executor.retrieve_compose_file(
             source_host_id, stack_name
         )
@@ -211,7 +219,7 @@ class StackMigrationOrchestrator:
             return self._create_error_result(f"Compose validation failed: {issues}", migration_data)
 
         services_found = validation_details.get("services_found", "unknown")
-        migration_steps.append(f"✅ Compose file validated ({services_found} services)")
+        _record_step(migration_steps, f"✅ Compose file validated ({services_found} services)")
         migration_data["compose_validation"] = validation_details
         return compose_content, compose_path
 
@@ -226,7 +234,7 @@ class StackMigrationOrchestrator:
         dry_run: bool,
     ) -> ToolResult | tuple[list[str], int]:
         """Run pre-flight checks including disk space and tool availability."""
-        migration_steps.append("🔍 Running pre-flight checks...")
+        _record_step(migration_steps, "🔍 Running pre-flight checks...")
 
         # Extract volumes and estimate data size
         expected_mounts = self.volume_utils.extract_expected_mounts(
@@ -239,7 +247,7 @@ class StackMigrationOrchestrator:
         has_space, space_message, space_details = await self.validation.check_disk_space(
             target_host, estimated_data_size
         )
-        migration_steps.append(f"💾 {space_message}")
+        _record_step(migration_steps, f"💾 {space_message}")
         migration_data["disk_space_check"] = space_details
 
         if not has_space and not dry_run:
@@ -254,9 +262,9 @@ class StackMigrationOrchestrator:
         ) = await self.validation.check_tool_availability(target_host, required_tools)
 
         if tools_available:
-            migration_steps.append("🛠️  All required tools available")
+            _record_step(migration_steps, "🛠️  All required tools available")
         else:
-            migration_steps.append(f"⚠️  Missing tools: {', '.join(missing_tools)}")
+            _record_step(migration_steps, f"⚠️  Missing tools: {', '.join(missing_tools)}")
             if not dry_run:
                 return self._create_error_result(
                     f"Missing required tools: {missing_tools}", migration_data
@@ -275,13 +283,13 @@ class StackMigrationOrchestrator:
         dry_run: bool,
     ) -> ToolResult | bool:
         """Test network connectivity between hosts."""
-        migration_steps.append("🌐 Testing network connectivity...")
+        _record_step(migration_steps, "🌐 Testing network connectivity...")
         connectivity_ok, network_details = await self.network.test_network_connectivity(
             source_host, target_host
         )
 
         if connectivity_ok:
-            migration_steps.append("✅ Network connectivity verified")
+            _record_step(migration_steps, "✅ Network connectivity verified")
 
             # Estimate transfer time if speed test successful
             speed_test = network_details.get("tests", {}).get("network_speed", {})
@@ -294,10 +302,10 @@ class StackMigrationOrchestrator:
                     .get("actual_network", {})
                     .get("time_human", "unknown")
                 )
-                migration_steps.append(f"⏱️  Estimated transfer time: {actual_time}")
+                _record_step(migration_steps, f"⏱️  Estimated transfer time: {actual_time}")
                 migration_data["transfer_estimates"] = transfer_estimates
         else:
-            migration_steps.append("⚠️  Network connectivity issues detected")
+            _record_step(migration_steps, "⚠️  Network connectivity issues detected")
             if not dry_run:
                 return self._create_error_result("Network connectivity test failed", migration_data)
 
@@ -313,7 +321,7 @@ class StackMigrationOrchestrator:
         migration_data: dict[str, Any],
     ) -> dict[str, Any]:
         """Assess migration risks."""
-        migration_steps.append("🎯 Assessing migration risks...")
+        _record_step(migration_steps, "🎯 Assessing migration risks...")
         risks = self.risk_assessment.assess_migration_risks(
             stack_name=stack_name,
             data_size_bytes=estimated_data_size,
@@ -323,11 +331,13 @@ class StackMigrationOrchestrator:
         )
 
         risk_score = self.risk_assessment.calculate_risk_score(risks)
-        migration_steps.append(f"📊 Risk level: {risks['overall_risk']} (score: {risk_score}/100)")
+        _record_step(
+            migration_steps, f"📊 Risk level: {risks['overall_risk']} (score: {risk_score}/100)"
+        )
 
         if risks["warnings"]:
             for warning in risks["warnings"]:
-                migration_steps.append(f"⚠️  {warning}")
+                _record_step(migration_steps, f"⚠️  {warning}")
 
         migration_data["risk_assessment"] = risks
         return risks
@@ -349,7 +359,7 @@ class StackMigrationOrchestrator:
         migration_data: dict[str, Any],
     ) -> ToolResult | bool | dict[str, Any]:
         """Execute the actual migration process."""
-        migration_steps.append("🚀 Starting migration execution...")
+        _record_step(migration_steps, "🚀 Starting migration execution...")
 
         # Execute migration phases
         await self._stop_source_stack(source_host_id, stack_name, skip_stop_source, migration_steps)
@@ -434,9 +444,9 @@ class StackMigrationOrchestrator:
                 source_host_id, stack_name, "down", None
             )
             if stop_result["success"]:
-                migration_steps.append("⏹️  Source stack stopped")
+                _record_step(migration_steps, "⏹️  Source stack stopped")
             else:
-                migration_steps.append("⚠️  Failed to stop source stack")
+                _record_step(migration_steps, "⚠️  Failed to stop source stack")
 
     def _prepare_path_mappings(
         self, target_host: DockerHost, stack_name: str, expected_mounts: list[str]
@@ -499,7 +509,7 @@ class StackMigrationOrchestrator:
         migration_data["port_check"] = details
 
         if all_available:
-            migration_steps.append("🔌 Target host ports available")
+            _record_step(migration_steps, "🔌 Target host ports available")
             return compose_content
 
         # Handle port conflicts by remapping
@@ -512,7 +522,7 @@ class StackMigrationOrchestrator:
         target_host: DockerHost, compose_content: str
     ) -> str:
         """Handle the case where no host ports are exposed."""
-        migration_steps.append("🔌 No host ports exposed; skipping port reassignment")
+        _record_step(migration_steps, "🔌 No host ports exposed; skipping port reassignment")
         migration_data["port_check"] = {
             "host": target_host.hostname,
             "ports_checked": [],
@@ -528,11 +538,11 @@ class StackMigrationOrchestrator:
     ) -> ToolResult | str:
         """Handle port conflicts by remapping to available ports."""
         conflicts_set = set(conflicts)
-        migration_steps.append("⚠️  Port conflicts detected on target; remapping host ports")
+        _record_step(migration_steps, "⚠️  Port conflicts detected on target; remapping host ports")
 
-        # Parse compose file
+        # Parse compose file (a mutable copy of the shared parsed model)
         try:
-            compose_data = yaml.safe_load(compose_content)
+            compose_data = get_compose_model(compose_content).to_dict()
         except yaml.YAMLError as exc:
             details_msg = f"Failed to parse compose for port adjustment: {exc}"
             return self._create_error_result(details_msg, migration_data)
@@ -556,7 +566,7 @@ class StackMigrationOrchestrator:
             f"{item['service']}: {item['original_port']}→{item['new_port']}"
             for item in adjustments
         )
-        migration_steps.append(f"🔁 Adjusted host ports on target ({summary})")
+        _record_step(migration_steps, f"🔁 Adjusted host ports on target ({summary})")
 
         return yaml.safe_dump(updated_compose, sort_keys=False)
 
@@ -820,11 +830,11 @@ class StackMigrationOrchestrator:
         if not transfer_success:
             return self._create_error_result("Data transfer failed", migration_data)
 
-        migration_steps.append("🚚 Direct data transfer completed")
+        _record_step(migration_steps, "🚚 Direct data transfer completed")
         migration_data["transfer_type"] = transfer_results.get("transfer_type", "unknown")
 
         if migration_data["transfer_type"] == "rsync":
-            migration_steps.append("⚙️  Transfer method: direct rsync sync")
+            _record_step(migration_steps, "⚙️  Transfer method: direct rsync sync")
 
         return transfer_results
 
@@ -851,7 +861,7 @@ class StackMigrationOrchestrator:
         if not deploy_success:
             return self._create_error_result("Stack deployment failed", migration_data)
 
-        migration_steps.append("🎯 Stack deployed on target")
+        _record_step(migration_steps, "🎯 Stack deployed on target")
         return deploy_results
 
     async def _verify_and_cleanup(
@@ -883,7 +893,7 @@ class StackMigrationOrchestrator:
         )
 
         if verify_success:
-            migration_steps.append("✅ Deployment verification passed")
+            _record_step(migration_steps, "✅ Deployment verification passed")
             migration_data["overall_success"] = True
 
             if remove_source:
@@ -891,10 +901,10 @@ class StackMigrationOrchestrator:
                     source_host_id, stack_name, compose_path, remove_source, False
                 )
                 if cleanup_success:
-                    migration_steps.append("🗑️  Source cleanup completed")
+                    _record_step(migration_steps, "🗑️  Source cleanup completed")
                 migration_data["source_cleanup"] = cleanup_results
         else:
-            migration_steps.append("❌ Deployment verification failed")
+            _record_step(migration_steps, "❌ Deployment verification failed")
 
         return verify_results
 
@@ -906,14 +916,13 @@ class StackMigrationOrchestrator:
         migration_data: dict[str, Any],
     ) -> None:
         """Handle dry run summary."""
-        migration_steps.extend(
-            [
-                "🧪 Dry run completed - no actual changes made",
-                f"✅ Migration feasibility: {risks['overall_risk']} risk",
-                f"📊 Estimated data size: {format_size(estimated_data_size)}",
-                "⏱️  Estimated downtime: 5-15 minutes",
-            ]
-        )
+        for step in (
+            "🧪 Dry run completed - no actual changes made",
+            f"✅ Migration feasibility: {risks['overall_risk']} risk",
+            f"📊 Estimated data size: {format_size(estimated_data_size)}",
+            "⏱️  Estimated downtime: 5-15 minutes",
+        ):
+            _record_step(migration_steps, step)
         migration_data.setdefault("success", True)
 
     def _create_final_result(
@@ -62,9 +62,18 @@ class StackOperations:
                 host_id, stack_name, compose_content, environment, pull_images, recreate
             )
 
+            if result.get("up_to_date"):
+                return self._up_to_date_result(result, stack_name, host_id)
+
             if result["success"]:
                 # Deployment succeeded, but verify individual services
-                await self._verify_service_status(host_id, stack_name, service_results)
+                plan = result.get("deploy_plan") or {}
+                await self._verify_service_status(
+                    host_id,
+                    stack_name,
+                    service_results,
+                    plan.get("targets") if plan.get("mode") == "incremental" else None,
+                )
 
                 if service_results["failed_services"]:
                     service_results["partial_success"] = True
@@ -129,6 +138,7 @@ class StackOperations:
         environment: dict[str, str] | None = None,
         pull_images: bool = True,
         recreate: bool = False,
+        force: bool = False,
     ) -> ToolResult:
         """Deploy a Docker Compose stack to a remote host."""
         try:
@@ -141,9 +151,12 @@ class StackOperations:
 
             # Use stack tools to deploy
             result = await self.stack_tools.deploy_stack(
-                host_id, stack_name, compose_content, environment, pull_images, recreate
+                host_id, stack_name, compose_content, environment, pull_images, recreate, force
             )
 
+            if result.get("up_to_date"):
+                return self._up_to_date_result(result, stack_name, host_id)
+
             if result["success"]:
                 # Briefly wait for the project to become visible in list_stacks
                 try:
@@ -400,6 +413,21 @@ class StackOperations:
 
         return summary_lines
 
+    def _up_to_date_result(
+        self, result: dict[str, Any], stack_name: str, host_id: str
+    ) -> ToolResult:
+        """Build the result for a deploy skipped because nothing changed."""
+        formatted_text = (
+            f"✅ Stack '{stack_name}' on {host_id} is already up to date "
+            "(compose content and environment unchanged; use force=true to redeploy)"
+        )
+        structured = dict(result)
+        structured["formatted_output"] = formatted_text
+        return ToolResult(
+            content=[TextContent(type="text", text=formatted_text)],
+            structured_content=structured,
+        )
+
     def _format_deploy_result(self, result: dict[str, Any], stack_name: str, host_id: str) -> list[str]:
         """Format deployment result with service-level progress visualization."""
         lines = []
@@ -482,6 +510,49 @@ class StackOperations:
         if compose_path := result.get("compose_path"):
             lines.append(f"📁 Deployed to: {compose_path}")
 
+        if plan := result.get("deploy_plan"):
+            self._add_deploy_plan_info(lines, plan)
+
+        if image_pull := result.get("image_pull"):
+            self._add_image_pull_info(lines, image_pull)
+
+        if (duration := result.get("duration_seconds")) is not None:
+            lines.append(f"⏱️  Duration: {duration:.2f}s")
+
+    def _add_deploy_plan_info(self, lines: list[str], plan: dict[str, Any]) -> None:
+        """Add the deploy plan (mode and, unless full, what changed)."""
+        targets = plan.get("targets", [])
+        lines.append(
+            f"🧩 Plan: {plan.get('mode', 'full')} "
+            f"({len(targets)}/{plan.get('services_total', len(targets))} services"
+            f" — {plan.get('reason', '')})"
+        )
+        if plan.get("mode", "full") != "full":
+            for label in ("changed", "added", "dependents", "removed"):
+                if names := plan.get(label):
+                    lines.append(f"   {label.title()}: {', '.join(names)}")
+
+    def _add_image_pull_info(self, lines: list[str], image_pull: dict[str, Any]) -> None:
+        """Add the image pre-pull summary with per-image results."""
+        if image_pull.get("images"):
+            lines.append(
+                f"📦 Images: {image_pull.get('pulled', 0)} pulled, "
+                f"{image_pull.get('up_to_date', 0)} up to date, "
+                f"{image_pull.get('failed', 0)} failed "
+                f"({self._format_bytes(image_pull.get('bytes_downloaded', 0))} "
+                f"in {image_pull.get('duration_seconds', 0):.2f}s)"
+            )
+            for image in image_pull["images"]:
+                if image["status"] == "pulled":
+                    lines.append(
+                        f"   {image['image']}: {self._format_bytes(image['bytes_downloaded'])}"
+                        f" in {image['duration_seconds']:.2f}s"
+                    )
+                elif image["status"] == "failed":
+                    lines.append(f"   {image['image']}: failed ({image.get('error', '')})")
+        if fallback := image_pull.get("compose_pull_services"):
+            lines.append(f"   Pulled by compose: {', '.join(fallback)}")
+
     def _format_ps_result(self, result: dict[str, Any], stack_name: str) -> list[str]:
         """Format ps action result with enhanced health status indicators."""
         summary_lines: list[str] = [f"Stack Services: {stack_name}"]
@@ -564,14 +635,26 @@ class StackOperations:
         else:
             summary_lines.append(f"Summary: {total_services} services")
 
-    async def _verify_service_status(self, host_id: str, stack_name: str, service_results: dict) -> None:
-        """Verify the status of individual services after deployment."""
+    async def _verify_service_status(
+        self,
+        host_id: str,
+        stack_name: str,
+        service_results: dict,
+        only_services: list[str] | None = None,
+    ) -> None:
+        """Verify the status of individual services after deployment.
+
+        ``only_services`` limits the check to the compose services an incremental
+        deploy touched.
+        """
         try:
             # Get stack services status
             ps_result = await self.stack_tools.manage_stack(host_id, stack_name, "ps")
 
             if ps_result.get("success") and ps_result.get("data", {}).get("services"):
                 services = ps_result["data"]["services"]
+                if only_services is not None:
+                    services = [s for s in services if s.get("Service") in only_services]
 
                 for service in services:
                     service_name = service.get("Name", "Unknown")
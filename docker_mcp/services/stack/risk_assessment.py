@@ -7,6 +7,7 @@ Evaluates data size, downtime, critical files, and service complexity.
 
 import structlog
 
+from ...core.compose_model import ComposeModel, ComposeService, get_compose_model
 from ...utils import format_size
 
 
@@ -22,7 +23,7 @@ class StackRiskAssessment:
         data_size_bytes: int,
         estimated_downtime: float,
         source_inventory: dict = None,
-        compose_content: str = "",
+        compose_content: str | ComposeModel = "",
     ) -> dict:
         """Assess risks associated with the migration.
 
@@ -31,7 +32,7 @@ class StackRiskAssessment:
             data_size_bytes: Size of data to migrate
             estimated_downtime: Estimated downtime in seconds
             source_inventory: Source data inventory from migration manager
-            compose_content: Docker Compose file content
+            compose_content: Docker Compose file content or parsed compose model
 
         Returns:
             Dict with risk assessment details
@@ -131,16 +132,15 @@ class StackRiskAssessment:
                 f"Many critical files ({len(critical_files)}) - increased complexity"
             )
 
-    def _assess_compose_complexity_risk(self, risks: dict, compose_content: str) -> None:
+    def _assess_compose_complexity_risk(
+        self, risks: dict, compose_content: str | ComposeModel
+    ) -> None:
         """Assess risk based on Docker Compose file complexity."""
         if not compose_content:
             return
 
         try:
-            import yaml
-
-            compose_data = yaml.safe_load(compose_content)
-            services = compose_data.get("services", {})
+            services = get_compose_model(compose_content).services
 
             # Assess different aspects of compose complexity
             self._assess_persistent_volume_risk(risks, services)
@@ -150,13 +150,11 @@ class StackRiskAssessment:
             # Skip compose analysis if parsing fails
             self.logger.debug("Failed to analyze compose content for risks", error=str(e))
 
-    def _assess_persistent_volume_risk(self, risks: dict, services: dict) -> None:
+    def _assess_persistent_volume_risk(
+        self, risks: dict, services: tuple[ComposeService, ...]
+    ) -> None:
         """Assess risk from services with persistent volumes."""
-        persistent_services = []
-        for service_name, service_config in services.items():
-            volumes = service_config.get("volumes", [])
-            if volumes:
-                persistent_services.append(service_name)
+        persistent_services = [service.name for service in services if service.volumes]
 
         if persistent_services:
             risks["risk_factors"].append("PERSISTENT_SERVICES")
@@ -167,12 +165,11 @@ class StackRiskAssessment:
                 if risks["overall_risk"] == "LOW":
                     risks["overall_risk"] = "MEDIUM"
 
-    def _assess_health_check_complexity(self, risks: dict, services: dict) -> None:
+    def _assess_health_check_complexity(
+        self, risks: dict, services: tuple[ComposeService, ...]
+    ) -> None:
         """Assess complexity from services with health checks."""
-        health_checked_services = []
-        for service_name, service_config in services.items():
-            if "healthcheck" in service_config:
-                health_checked_services.append(service_name)
+        health_checked_services = [service.name for service in services if service.has_healthcheck]
 
         if health_checked_services:
             risks["recommendations"].append(
@@ -0,0 +1,407 @@
+"""
+Stack Rolling Deploy Module
+
+Deploys one stack across several hosts in waves. Each wave is gated on every
+service having a running container whose health check (if any) reports healthy;
+a failed wave aborts the rollout and optionally rolls the deployed hosts back to
+their previous compose file. Images for the next wave are pulled while the
+current wave is being health-checked.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from ...constants import DOCKER_COMPOSE_PROJECT, DOCKER_COMPOSE_SERVICE
+from ...core.compose_model import get_compose_model
+from ...core.config_loader import DockerMCPConfig
+from ...core.progress import emit_progress
+from ...tools.stacks import StackTools
+from .state_cache import _health_from_status
+
+if TYPE_CHECKING:
+    from ...core.docker_context import DockerContextManager
+
+# Hosts deployed together per wave unless the caller sets wave_size
+ROLLING_WAVE_SIZE = int(os.getenv("ROLLING_WAVE_SIZE", "1"))
+# How long a wave may take to become healthy before the rollout is aborted
+ROLLING_HEALTH_TIMEOUT_SECONDS = int(os.getenv("ROLLING_HEALTH_TIMEOUT_SECONDS", "180"))
+ROLLING_HEALTH_POLL_SECONDS = float(os.getenv("ROLLING_HEALTH_POLL_SECONDS", "3"))
+
+WaveCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class StackRollingDeploy:
+    """Wave-by-wave deploy of one stack across hosts with health gating and rollback."""
+
+    def __init__(
+        self,
+        config: DockerMCPConfig,
+        context_manager: "DockerContextManager",
+        stack_tools: StackTools,
+    ):
+        self.config = config
+        self.context_manager = context_manager
+        self.stack_tools = stack_tools
+        self.logger = structlog.get_logger()
+
+    async def rollout(
+        self,
+        stack_name: str,
+        compose_content: str,
+        host_ids: list[str],
+        environment: dict[str, str] | None = None,
+        wave_size: int = ROLLING_WAVE_SIZE,
+        pull_images: bool = True,
+        health_timeout: int = ROLLING_HEALTH_TIMEOUT_SECONDS,
+        rollback: bool = True,
+        on_wave: WaveCallback | None = None,
+    ) -> dict[str, Any]:
+        """Deploy a stack to hosts in waves of ``wave_size``.
+
+        A wave succeeds when every host deployed and, within ``health_timeout``,
+        every service has a running container and no container is unhealthy or
+        still starting its health check. The first failed wave stops the rollout;
+        later waves are skipped. With ``rollback`` every host deployed so far
+        (including earlier, healthy waves) is returned to the compose file it ran
+        before, so the fleet is left on one version. Hosts that had no previous
+        compose file are brought down. Rollback reuses this rollout's environment.
+
+        Args:
+            stack_name: Stack to deploy
+            compose_content: Compose content deployed to every host
+            host_ids: Hosts in rollout order
+            environment: Environment variables for the stack
+            wave_size: Hosts deployed concurrently per wave
+            pull_images: Pre-pull images (next wave during the current health wait)
+            health_timeout: Seconds a wave may take to become healthy
+            rollback: Roll deployed hosts back after a failed wave
+            on_wave: Awaited with each wave's result as soon as it completes
+
+        Returns:
+            Per-wave results, rollback results and a summary
+        """
+        started = time.monotonic()
+        host_ids = list(dict.fromkeys(host_ids))
+        waves = [host_ids[i : i + wave_size] for i in range(0, len(host_ids), wave_size)]
+        services = get_compose_model(compose_content).service_names
+
+        wave_results: list[dict[str, Any]] = []
+        previous: dict[str, dict[str, Any]] = {}
+        failed_wave: int | None = None
+        prepull = self._start_prepull(waves[0], compose_content, services, pull_images)
+
+        for index, wave in enumerate(waves, start=1):
+            if failed_wave is not None:
+                wave_results.append(
+                    {
+                        "wave": index,
+                        "status": "skipped",
+                        "hosts": [{"host_id": host_id, "status": "skipped"} for host_id in wave],
+                    }
+                )
+                continue
+
+            wave_started = time.monotonic()
+            emit_progress(
+                "step",
+                f"Wave {index}/{len(waves)}: deploying to {', '.join(wave)}",
+                step="deploy_wave",
+                wave=index,
+                hosts=wave,
+            )
+            snapshots = await asyncio.gather(
+                *(self._previous_compose(host_id, stack_name) for host_id in wave)
+            )
+            previous.update(zip(wave, snapshots, strict=True))
+            image_pulls = await prepull if prepull is not None else {}
+
+            deploys = await asyncio.gather(
+                *(
+                    self._deploy_host(
+                        host_id, stack_name, compose_content, environment, pull_images
+                    )
+                    for host_id in wave
+                )
+            )
+
+            # Pull the next wave's images while this wave settles
+            next_wave = waves[index] if index < len(waves) else []
+            prepull = self._start_prepull(next_wave, compose_content, services, pull_images)
+
+            emit_progress(
+                "step",
+                f"Wave {index}/{len(waves)}: waiting for services to become healthy",
+                step="health_wait",
+                wave=index,
+            )
+            healths = await asyncio.gather(
+                *(
+                    self._wait_healthy(host_id, stack_name, services, health_timeout)
+                    if deploy["success"]
+                    else self._not_checked()
+                    for host_id, deploy in zip(wave, deploys, strict=True)
+                )
+            )
+
+            hosts = [
+                self._host_result(host_id, deploy, health, image_pulls.get(host_id))
+                for host_id, deploy, health in zip(wave, deploys, healths, strict=True)
+            ]
+
+            wave_ok = all(entry["status"] == "healthy" for entry in hosts)
+            wave_result = {
+                "wave": index,
+                "status": "healthy" if wave_ok else "failed",
+                "hosts": hosts,
+                "duration_seconds": round(time.monotonic() - wave_started, 2),
+            }
+            wave_results.append(wave_result)
+            self.logger.info(
+                "Rolling deploy wave finished",
+                stack_name=stack_name,
+                wave=index,
+                waves=len(waves),
+                status=wave_result["status"],
+                hosts=wave,
+            )
+            if on_wave is not None:
+                await on_wave(wave_result)
+            if not wave_ok:
+                failed_wave = index
+
+        if prepull is not None:
+            prepull.cancel()
+
+        rollback_results: list[dict[str, Any]] = []
+        if failed_wave is not None and rollback:
+            emit_progress(
+                "step",
+                f"Wave {failed_wave} failed: rolling back {', '.join(previous)}",
+                step="rollback",
+            )
+            rollback_results = list(
+                await asyncio.gather(
+                    *(
+                        self._rollback_host(host_id, stack_name, snapshot, environment)
+                        for host_id, snapshot in previous.items()
+                    )
+                )
+            )
+
+        summary = {
+            status: sum(
+                1 for wave in wave_results for host in wave["hosts"] if host["status"] == status
+            )
+            for status in ("healthy", "failed", "skipped")
+        }
+        summary["total"] = len(host_ids)
+        duration = round(time.monotonic() - started, 2)
+
+        self.logger.info(
+            "Rolling deploy completed",
+            stack_name=stack_name,
+            waves=len(waves),
+            failed_wave=failed_wave,
+            rolled_back=len(rollback_results),
+            duration_seconds=duration,
+            **summary,
+        )
+        return {
+            "success": failed_wave is None,
+            "stack_name": stack_name,
+            "waves": wave_results,
+            "failed_wave": failed_wave,
+            "rollback": rollback_results,
+            "summary": summary,
+            "duration_seconds": duration,
+        }
+
+    def _start_prepull(
+        self, host_ids: list[str], compose_content: str, services: list[str], pull_images: bool
+    ) -> "asyncio.Task[dict[str, dict[str, Any]]] | None":
+        """Start pulling the stack's images on ``host_ids`` in the background."""
+        if not pull_images or not host_ids:
+            return None
+
+        async def pull_all() -> dict[str, dict[str, Any]]:
+            pulls = await asyncio.gather(
+                *(
+                    self.stack_tools._prepull_stack_images(host_id, compose_content, services)
+                    for host_id in host_ids
+                )
+            )
+            return dict(zip(host_ids, pulls, strict=True))
+
+        return asyncio.create_task(pull_all())
+
+    async def _previous_compose(self, host_id: str, stack_name: str) -> dict[str, Any]:
+        """What a host runs before the rollout touches it.
+
+        Returns:
+            Dict with compose_content (None when the stack is not deployed there),
+            or error when the previous state could not be established
+        """
+        result = await self.stack_tools.get_stack_compose_content(host_id, stack_name)
+        if result.get("success"):
+            return {"compose_content": result["compose_content"]}
+        # An unreadable file only counts as "not deployed" if nothing of the stack is running
+        try:
+            running = await self.stack_tools._running_services(host_id, stack_name)
+        except Exception as e:
+            return {"error": f"could not read previous state: {e}"}
+        if running:
+            return {"error": f"could not read previous compose file: {result.get('error')}"}
+        return {"compose_content": None}
+
+    async def _deploy_host(
+        self,
+        host_id: str,
+        stack_name: str,
+        compose_content: str,
+        environment: dict[str, str] | None,
+        pull_images: bool,
+    ) -> dict[str, Any]:
+        try:
+            return await self.stack_tools.deploy_stack(
+                host_id, stack_name, compose_content, environment, pull_images
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def _host_result(
+        self,
+        host_id: str,
+        deploy: dict[str, Any],
+        health: dict[str, Any],
+        image_pull: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """One host's entry in a wave result."""
+        entry: dict[str, Any] = {
+            "host_id": host_id,
+            "status": "healthy" if deploy["success"] and health["healthy"] else "failed",
+            "up_to_date": bool(deploy.get("up_to_date")),
+            "health": health,
+        }
+        if image_pull is not None:
+            entry["image_pull"] = image_pull
+        if not deploy["success"]:
+            entry["error"] = deploy.get("error") or "deploy failed"
+        elif not health["healthy"]:
+            entry["error"] = health["error"]
+        return entry
+
+    async def _not_checked(self) -> dict[str, Any]:
+        return {"healthy": False, "error": "not checked (deploy failed)", "waited_seconds": 0}
+
+    async def _wait_healthy(
+        self, host_id: str, stack_name: str, services: list[str], timeout: int
+    ) -> dict[str, Any]:
+        """Poll the stack's containers until every service is running and healthy.
+
+        Returns early with a failure as soon as a container reports unhealthy.
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        pending = "no containers found"
+        while True:
+            try:
+                pending, unhealthy = await self._check_health(host_id, stack_name, services)
+            except Exception as e:
+                pending, unhealthy = f"health check failed: {e}", None
+            waited = round(time.monotonic() - started, 2)
+            if unhealthy:
+                return {"healthy": False, "error": unhealthy, "waited_seconds": waited}
+            if pending is None:
+                return {"healthy": True, "waited_seconds": waited}
+            if time.monotonic() >= deadline:
+                return {
+                    "healthy": False,
+                    "error": f"not healthy after {timeout}s: {pending}",
+                    "waited_seconds": waited,
+                }
+            await asyncio.sleep(ROLLING_HEALTH_POLL_SECONDS)
+
+    async def _check_health(
+        self, host_id: str, stack_name: str, services: list[str]
+    ) -> tuple[str | None, str | None]:
+        """One health probe.
+
+        Returns:
+            (reason the wave is still pending or None, reason it failed or None)
+        """
+        client = await self.context_manager.get_client(host_id)
+        if client is None:
+            return f"could not connect to Docker on host {host_id}", None
+        containers = await asyncio.to_thread(
+            client.containers.list,
+            all=True,
+            sparse=True,
+            filters={"label": f"{DOCKER_COMPOSE_PROJECT}={stack_name}"},
+        )
+
+        running: set[str] = set()
+        starting: list[str] = []
+        for container in containers:
+            labels = container.attrs.get("Labels") or {}
+            service = labels.get(DOCKER_COMPOSE_SERVICE) or container.id[:12]
+            if str(container.attrs.get("State") or "").lower() != "running":
+                continue
+            health = _health_from_status(str(container.attrs.get("Status") or ""))
+            if health == "unhealthy":
+                return None, f"service {service} is unhealthy"
+            if health == "starting":
+                starting.append(service)
+            else:
+                running.add(service)
+
+        if starting:
+            return f"waiting for health checks: {', '.join(sorted(set(starting)))}", None
+        if missing := [service for service in services if service not in running]:
+            return f"services not running: {', '.join(missing)}", None
+        return None, None
+
+    async def _rollback_host(
+        self,
+        host_id: str,
+        stack_name: str,
+        snapshot: dict[str, Any],
+        environment: dict[str, str] | None,
+    ) -> dict[str, Any]:
+        """Return a host to its previous compose file, or take the stack down if it had none."""
+        if "error" in snapshot:
+            self.logger.warning(
+                "Rolling deploy host not rolled back",
+                stack_name=stack_name,
+                host_id=host_id,
+                error=snapshot["error"],
+            )
+            return {
+                "host_id": host_id,
+                "action": "none",
+                "success": False,
+                "error": f"not rolled back, {snapshot['error']}",
+            }
+
+        compose_content = snapshot["compose_content"]
+        try:
+            if compose_content is None:
+                result = await self.stack_tools.manage_stack(host_id, stack_name, "down", {})
+                action = "down"
+            else:
+                result = await self.stack_tools.deploy_stack(
+                    host_id, stack_name, compose_content, environment, pull_images=False
+                )
+                action = "redeploy"
+        except Exception as e:
+            result, action = {"success": False, "error": str(e)}, "redeploy"
+
+        entry = {"host_id": host_id, "action": action, "success": bool(result.get("success"))}
+        if not entry["success"]:
+            entry["error"] = result.get("error") or "rollback failed"
+        self.logger.info("Rolling deploy host rolled back", stack_name=stack_name, **entry)
+        return entry
@@ -0,0 +1,392 @@
+"""
+Stack State Cache Module
+
+Keeps a per-host model of compose stacks (services, container states, health)
+up to date from the Docker event stream, so stack status reads are served from
+memory and listeners hear about a stack as soon as its aggregate status changes.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from ...constants import DOCKER_COMPOSE_PROJECT, DOCKER_COMPOSE_SERVICE
+from ...core.config_loader import DockerMCPConfig
+from ...tools.stacks import StackTools
+
+if TYPE_CHECKING:
+    from ...core.docker_context import DockerContextManager
+
+# How long a read waits for the initial snapshot before falling back to a live listing
+STACK_STATE_SNAPSHOT_WAIT_SECONDS = float(os.getenv("STACK_STATE_SNAPSHOT_WAIT_SECONDS", "10"))
+# Delay before re-syncing a host after its event stream drops (doubles up to the max)
+STACK_STATE_RETRY_SECONDS = float(os.getenv("STACK_STATE_RETRY_SECONDS", "5"))
+STACK_STATE_RETRY_MAX_SECONDS = float(os.getenv("STACK_STATE_RETRY_MAX_SECONDS", "60"))
+
+# Container event actions and the state they leave the container in
+_EVENT_STATES = {
+    "create": "created",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",
+    "stop": "exited",
+}
+
+StatusListener = Callable[[str, str, str | None, str | None], Awaitable[None]]
+
+
+def _health_from_status(status_text: str) -> str | None:
+    """Extract health from a container list Status such as "Up 5 minutes (healthy)"."""
+    for health in ("unhealthy", "healthy", "health: starting"):
+        if f"({health})" in status_text:
+            return "starting" if health == "health: starting" else health
+    return None
+
+
+class _HostStackState:
+    """Stacks and compose containers on one host, as of the last applied event."""
+
+    def __init__(self) -> None:
+        self.stacks: dict[str, dict[str, Any]] = {}
+        self.containers: dict[str, dict[str, Any]] = {}
+        self.statuses: dict[str, str] = {}
+        # Stacks compose ls reported without any containers; kept even with no members
+        self.containerless: set[str] = set()
+        self.ready = asyncio.Event()
+        self.synced_at: str | None = None
+        # Why the last sync failed; cleared once a snapshot succeeds
+        self.sync_error: str | None = None
+        self.task: asyncio.Task | None = None
+        self.stream: Any = None
+
+
+class StackStateCache:
+    """Event-sourced stack status per host with change notifications."""
+
+    def __init__(
+        self,
+        config: DockerMCPConfig,
+        context_manager: "DockerContextManager",
+        stack_tools: StackTools,
+    ):
+        self.config = config
+        self.context_manager = context_manager
+        self.stack_tools = stack_tools
+        self.logger = structlog.get_logger()
+        self._hosts: dict[str, _HostStackState] = {}
+        self._listeners: list[StatusListener] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def add_listener(self, listener: StatusListener) -> None:
+        """Register ``listener(host_id, stack_name, old_status, new_status)``."""
+        self._listeners.append(listener)
+
+    def ensure_watching(self, host_id: str) -> _HostStackState:
+        """Start tracking a host if it is not tracked yet."""
+        state = self._hosts.get(host_id)
+        if state is None:
+            state = self._hosts[host_id] = _HostStackState()
+        if state.task is None or state.task.done():
+            self._loop = asyncio.get_running_loop()
+            state.task = asyncio.create_task(self._watch_host(host_id, state))
+        return state
+
+    async def get_stacks(self, host_id: str) -> dict[str, Any]:
+        """Return the stack listing for a host from memory.
+
+        Falls back to a live listing if the host's first snapshot is not ready in time.
+
+        Returns:
+            The list_stacks payload plus ``source`` ("cache" or "live") and ``synced_at``
+        """
+        if host_id not in self.config.hosts:
+            return await self.stack_tools.list_stacks(host_id)
+
+        state = self.ensure_watching(host_id)
+        if not state.ready.is_set() and state.sync_error is not None:
+            # The watcher is backing off after a failed sync; don't wait for it
+            result = await self.stack_tools.list_stacks(host_id)
+            return {**result, "source": "live"}
+        try:
+            await asyncio.wait_for(state.ready.wait(), timeout=STACK_STATE_SNAPSHOT_WAIT_SECONDS)
+        except TimeoutError:
+            result = await self.stack_tools.list_stacks(host_id)
+            return {**result, "source": "live"}
+
+        return {
+            "success": True,
+            "stacks": [self._stack_view(state, name) for name in sorted(state.stacks)],
+            "host_id": host_id,
+            "timestamp": datetime.now().isoformat(),
+            "source": "cache",
+            "synced_at": state.synced_at,
+        }
+
+    def get_stack_state(self, host_id: str, stack_name: str) -> dict[str, Any] | None:
+        """Return one stack's cached state, or None if the host is not synced."""
+        state = self._hosts.get(host_id)
+        if state is None or not state.ready.is_set() or stack_name not in state.stacks:
+            return None
+        return self._stack_view(state, stack_name)
+
+    async def stop(self) -> None:
+        """Stop every event stream and watcher."""
+        for state in self._hosts.values():
+            if state.stream is not None:
+                state.stream.close()
+            if state.task is not None:
+                state.task.cancel()
+        self._hosts.clear()
+
+    def reload(self, config: DockerMCPConfig) -> None:
+        """Switch to a new configuration and restart the event streams.
+
+        Every stream is closed and hosts that are still configured are watched
+        again from a fresh snapshot. Safe to call from another thread: the
+        restart is scheduled on the loop the watchers run on.
+        """
+        self.config = config
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        watched = [host_id for host_id in self._hosts if host_id in config.hosts]
+
+        async def restart() -> None:
+            await self.stop()
+            for host_id in watched:
+                self.ensure_watching(host_id)
+
+        asyncio.run_coroutine_threadsafe(restart(), loop)
+
+    def _stack_view(self, state: _HostStackState, stack_name: str) -> dict[str, Any]:
+        members = [c for c in state.containers.values() if c["project"] == stack_name]
+        health: dict[str, int] = {}
+        for member in members:
+            if member["health"]:
+                health[member["health"]] = health.get(member["health"], 0) + 1
+        return {
+            **state.stacks[stack_name],
+            "services": sorted({m["service"] for m in members if m["service"]})
+            or state.stacks[stack_name].get("services", []),
+            "status": state.statuses.get(stack_name, "unknown"),
+            "containers": [
+                {key: member[key] for key in ("id", "service", "state", "health")}
+                for member in sorted(members, key=lambda m: (m["service"] or "", m["id"]))
+            ],
+            "health": health,
+        }
+
+    async def _watch_host(self, host_id: str, state: _HostStackState) -> None:
+        """Snapshot the host, then apply its container events until the stream ends."""
+        retry = STACK_STATE_RETRY_SECONDS
+        while True:
+            try:
+                await self._sync_host(host_id, state)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                state.sync_error = str(e)
+                self.logger.warning(
+                    "Stack state stream lost, resyncing", host_id=host_id, error=str(e)
+                )
+            if state.ready.is_set():
+                # The host was synced, so this is a fresh outage rather than a repeat failure
+                retry = STACK_STATE_RETRY_SECONDS
+            state.ready.clear()
+            await asyncio.sleep(retry)
+            retry = min(retry * 2, STACK_STATE_RETRY_MAX_SECONDS)
+
+    async def _sync_host(self, host_id: str, state: _HostStackState) -> None:
+        client = await self.context_manager.get_client(host_id)
+        if client is None:
+            raise ConnectionError(f"Could not connect to Docker on host {host_id}")
+
+        # Events since this point are replayed, so nothing between snapshot and stream is lost
+        since = int(time.time())
+        listing, containers = await asyncio.gather(
+            self.stack_tools.list_stacks(host_id),
+            asyncio.to_thread(
+                client.containers.list,
+                all=True,
+                sparse=True,
+                filters={"label": DOCKER_COMPOSE_PROJECT},
+            ),
+        )
+        if not listing.get("success"):
+            raise RuntimeError(listing.get("error", "stack listing failed"))
+
+        state.stacks = {stack["name"]: stack for stack in listing.get("stacks", [])}
+        state.containers = {}
+        for container in containers:
+            labels = container.attrs.get("Labels") or {}
+            state.containers[container.id] = {
+                "id": container.id[:12],
+                "project": labels.get(DOCKER_COMPOSE_PROJECT),
+                "service": labels.get(DOCKER_COMPOSE_SERVICE),
+                "state": str(container.attrs.get("State") or "").lower(),
+                "health": _health_from_status(str(container.attrs.get("Status") or "")),
+            }
+        projects = {c["project"] for c in state.containers.values()}
+        state.containerless = set(state.stacks) - projects
+        changed = [self._recompute(state, name) for name in list(state.stacks)]
+        # Stacks that were removed while the stream was down
+        changed += [
+            (name, state.statuses.pop(name), None)
+            for name in set(state.statuses) - set(state.stacks)
+        ]
+        state.synced_at = datetime.now().isoformat()
+        state.sync_error = None
+        state.ready.set()
+        self.logger.info("Stack state synced", host_id=host_id, stacks=len(state.stacks))
+        # After a resync, report stacks that changed while the stream was down
+        for stack_name, old_status, new_status in filter(None, changed):
+            if old_status is not None:
+                await self._notify(host_id, stack_name, old_status, new_status)
+
+        await self._consume_events(host_id, state, client, since)
+
+    async def _consume_events(
+        self, host_id: str, state: _HostStackState, client: Any, since: int
+    ) -> None:
+        """Pump the blocking event stream from a daemon thread into this loop."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[dict[str, Any] | BaseException | None] = asyncio.Queue()
+        state.stream = client.events(
+            decode=True,
+            since=since,
+            filters={"type": "container", "label": DOCKER_COMPOSE_PROJECT},
+        )
+
+        def post(item: dict[str, Any] | BaseException | None) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                pass  # loop already closed during shutdown
+
+        def pump() -> None:
+            try:
+                for event in state.stream:
+                    post(event)
+                post(None)
+            except Exception as e:
+                post(e)
+
+        # Daemon thread: a blocked event stream must not hold up interpreter exit
+        threading.Thread(target=pump, daemon=True, name=f"docker-events-{host_id}").start()
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    raise ConnectionError("Docker event stream closed")
+                if isinstance(event, BaseException):
+                    raise event
+                if change := self._apply_event(host_id, state, event):
+                    await self._notify(host_id, *change)
+        finally:
+            state.stream.close()
+            state.stream = None
+
+    def _apply_event(
+        self, host_id: str, state: _HostStackState, event: dict[str, Any]
+    ) -> tuple[str, str | None, str | None] | None:
+        """Apply one container event; return (stack, old, new) if the stack status changed."""
+        action = str(event.get("Action") or event.get("status") or "")
+        actor = event.get("Actor") or {}
+        container_id = actor.get("ID") or event.get("id")
+        attributes = actor.get("Attributes") or {}
+        stack_name = attributes.get(DOCKER_COMPOSE_PROJECT)
+        if not container_id or not stack_name:
+            return None
+
+        if action == "destroy":
+            if state.containers.pop(container_id, None) is None:
+                return None
+            if self._drop_if_gone(state, stack_name):
+                return stack_name, state.statuses.pop(stack_name, None), None
+        else:
+            container = state.containers.setdefault(
+                container_id,
+                {
+                    "id": container_id[:12],
+                    "project": stack_name,
+                    "service": attributes.get(DOCKER_COMPOSE_SERVICE),
+                    "state": "created",
+                    "health": None,
+                },
+            )
+            # Once it has containers, the stack is gone again when they are all removed
+            state.containerless.discard(stack_name)
+            if action.startswith("health_status"):
+                container["health"] = action.partition(":")[2].strip() or None
+            elif action in _EVENT_STATES:
+                container["state"] = _EVENT_STATES[action]
+                if container["state"] != "running":
+                    container["health"] = None
+            else:
+                return None
+
+        if stack_name not in state.stacks:
+            state.stacks[stack_name] = {
+                "name": stack_name,
+                "host_id": host_id,
+                "services": [],
+                "status": "unknown",
+                "created": None,
+                "updated": None,
+                "compose_file": attributes.get("com.docker.compose.project.config_files"),
+            }
+        return self._recompute(state, stack_name)
+
+    def _drop_if_gone(self, state: _HostStackState, stack_name: str) -> bool:
+        """Forget a stack whose last container was removed (e.g. by ``compose down``).
+
+        Stacks that compose ls reported without containers stay, like the live listing.
+        """
+        if stack_name in state.containerless:
+            return False
+        if any(c["project"] == stack_name for c in state.containers.values()):
+            return False
+        state.stacks.pop(stack_name, None)
+        return True
+
+    def _recompute(
+        self, state: _HostStackState, stack_name: str
+    ) -> tuple[str, str | None, str | None] | None:
+        """Recompute a stack's aggregate status; return the change if there was one."""
+        members = [c for c in state.containers.values() if c["project"] == stack_name]
+        if members:
+            status = self.stack_tools._aggregate_stack_status([m["state"] for m in members], {})
+            if status == "running" and any(m["health"] == "unhealthy" for m in members):
+                status = "unhealthy"
+        else:
+            status = "stopped"
+
+        old_status = state.statuses.get(stack_name)
+        if old_status == status:
+            return None
+        state.statuses[stack_name] = status
+        return stack_name, old_status, status
+
+    async def _notify(
+        self, host_id: str, stack_name: str, old_status: str | None, new_status: str | None
+    ) -> None:
+        self.logger.debug(
+            "Stack status changed",
+            host_id=host_id,
+            stack_name=stack_name,
+            old_status=old_status,
+            new_status=new_status,
+        )
+        for listener in list(self._listeners):
+            try:
+                await listener(host_id, stack_name, old_status, new_status)
+            except Exception as e:
+                self.logger.warning("Stack status listener failed", error=str(e))
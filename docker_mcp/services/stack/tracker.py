@@ -0,0 +1,186 @@
+"""
+Stack Operation Tracker Module
+
+Long-running operations (deploy, migrate, rollout, bulk, image pull) run as tracked
+operations: each gets an operation ID, keeps a bounded history of progress
+events (step transitions, image pull layers, compose output, bytes
+transferred) and forwards them to listeners such as MCP progress
+notifications. The work runs in its own task, so a client that times out or
+disconnects can pick the operation up again through the status action.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+import structlog
+
+from ...core.progress import progress_scope
+
+# Progress events kept per operation for the status action
+OPERATION_EVENT_HISTORY = int(os.getenv("OPERATION_EVENT_HISTORY", "500"))
+# How long finished operations stay queryable
+OPERATION_RETENTION_SECONDS = float(os.getenv("OPERATION_RETENTION_SECONDS", "3600"))
+
+ProgressListener = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class StackOperation:
+    """One tracked operation and its progress events."""
+
+    task: "asyncio.Task[dict[str, Any]]"
+
+    def __init__(self, kind: str, **details: Any) -> None:
+        self.operation_id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.details = details
+        self.status = "running"
+        self.step: str | None = None
+        self.started_at = datetime.now().isoformat()
+        self.finished_at: str | None = None
+        self.result: dict[str, Any] | None = None
+        self.events: deque[dict[str, Any]] = deque(maxlen=OPERATION_EVENT_HISTORY)
+        self.listeners: list[ProgressListener] = []
+        self._seq = 0
+        self._started = time.monotonic()
+        self._finished: float | None = None
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    def emit(self, event_type: str, message: str, **data: Any) -> None:
+        """Record a progress event (safe to call from worker threads)."""
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._record(event_type, message, data)
+        else:
+            self._loop.call_soon_threadsafe(self._record, event_type, message, data)
+
+    def _record(self, event_type: str, message: str, data: dict[str, Any]) -> None:
+        self._seq += 1
+        if event_type == "step":
+            self.step = message
+        event = {
+            "seq": self._seq,
+            "operation_id": self.operation_id,
+            "type": event_type,
+            "message": message,
+            "timestamp": datetime.now().isoformat(),
+            **data,
+        }
+        self.events.append(event)
+        self._queue.put_nowait(event)
+
+    async def _dispatch(self) -> None:
+        while (event := await self._queue.get()) is not None:
+            for listener in list(self.listeners):
+                try:
+                    await listener(event)
+                except Exception as e:
+                    # A gone client must not stall or fail the operation
+                    structlog.get_logger().debug("Progress listener dropped", error=str(e))
+                    self.listeners.remove(listener)
+
+    def finish(self, result: dict[str, Any]) -> None:
+        self.result = result
+        self.status = "succeeded" if result.get("success") else "failed"
+        self.finished_at = datetime.now().isoformat()
+        self._finished = time.monotonic()
+        self._record("finished", f"{self.kind} {self.status}", {"status": self.status})
+        self._queue.put_nowait(None)
+
+    def snapshot(self, since_event: int | None = 0) -> dict[str, Any]:
+        """Operation state plus the events after ``since_event`` and the result.
+
+        With ``since_event=None`` only the summary fields are returned.
+        """
+        end = self._finished if self._finished is not None else time.monotonic()
+        snapshot: dict[str, Any] = {
+            "operation_id": self.operation_id,
+            "kind": self.kind,
+            **self.details,
+            "status": self.status,
+            "step": self.step,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_seconds": round(end - self._started, 2),
+            "last_event": self._seq,
+        }
+        if since_event is None:
+            return snapshot
+        snapshot["events"] = [event for event in self.events if event["seq"] > since_event]
+        if self.result is not None:
+            snapshot["result"] = self.result
+        return snapshot
+
+
+class StackOperationTracker:
+    """Registry of tracked operations."""
+
+    def __init__(self) -> None:
+        self._operations: dict[str, StackOperation] = {}
+        self.logger = structlog.get_logger()
+
+    def start(self, kind: str, **details: Any) -> StackOperation:
+        self._prune()
+        operation = StackOperation(kind, **details)
+        self._operations[operation.operation_id] = operation
+        self.logger.info(
+            "Operation started", operation_id=operation.operation_id, kind=kind, **details
+        )
+        return operation
+
+    async def run(
+        self,
+        operation: StackOperation,
+        work: Callable[[], Awaitable[dict[str, Any]]],
+        listener: ProgressListener | None = None,
+    ) -> dict[str, Any]:
+        """Run ``work`` as the operation and return its result with the operation_id.
+
+        The work runs in its own task with the operation's emitter installed, and
+        is shielded: if the caller is cancelled the operation keeps running and
+        stays available to the status action.
+        """
+        if listener is not None:
+            operation.listeners.append(listener)
+
+        async def execute() -> dict[str, Any]:
+            with progress_scope(operation.emit):
+                try:
+                    result = await work()
+                except Exception as e:
+                    result = {"success": False, "error": str(e)}
+            result = {**result, "operation_id": operation.operation_id}
+            operation.finish(result)
+            self.logger.info(
+                "Operation finished",
+                operation_id=operation.operation_id,
+                kind=operation.kind,
+                status=operation.status,
+            )
+            return result
+
+        operation.task = asyncio.create_task(execute())
+        return await asyncio.shield(operation.task)
+
+    def get(self, operation_id: str) -> StackOperation | None:
+        return self._operations.get(operation_id)
+
+    def list(self) -> list[StackOperation]:
+        self._prune()
+        return sorted(self._operations.values(), key=lambda op: op.started_at, reverse=True)
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - OPERATION_RETENTION_SECONDS
+        for operation_id, operation in list(self._operations.items()):
+            if operation._finished is not None and operation._finished < cutoff:
+                del self._operations[operation_id]
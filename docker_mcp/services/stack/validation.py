@@ -9,10 +9,13 @@ import asyncio
 import re
 import shlex
 import subprocess
+from collections.abc import Mapping
 from typing import Any
 
 import structlog
+import yaml
 
+from ...core.compose_model import ComposeModel, get_compose_model, parse_port_string
 from ...core.config_loader import DockerHost
 from ...utils import build_ssh_command, format_size
 
@@ -24,12 +27,12 @@ class StackValidation:
         self.logger = structlog.get_logger()
 
     def validate_compose_syntax(
-        self, compose_content: str, stack_name: str
+        self, compose_content: str | ComposeModel, stack_name: str
     ) -> tuple[bool, list[str], dict]:
         """Validate Docker Compose file syntax and configuration.
 
         Args:
-            compose_content: Docker Compose YAML content
+            compose_content: Docker Compose YAML content or parsed compose model
             stack_name: Name of the stack
 
         Returns:
@@ -74,13 +77,11 @@ class StackValidation:
             return False, issues, details
 
     def _validate_yaml_syntax(
-        self, compose_content: str, issues: list[str], details: dict
+        self, compose_content: str | ComposeModel, issues: list[str], details: dict
     ) -> Any | None:
         """Validate YAML syntax and return parsed data."""
-        import yaml
-
         try:
-            compose_data = yaml.safe_load(compose_content)
+            compose_data = get_compose_model(compose_content).document
             details["syntax_valid"] = True
             details["validation_checks"]["yaml_syntax"] = {"passed": True}
             return compose_data
@@ -94,7 +95,7 @@ class StackValidation:
         self, compose_data: Any, issues: list[str], details: dict[str, Any]
     ) -> bool:
         """Validate basic compose file structure."""
-        if not isinstance(compose_data, dict):
+        if not isinstance(compose_data, Mapping):
             issues.append("Compose file must be a YAML object")
             details["validation_checks"]["structure"] = {
                 "passed": False,
@@ -113,7 +114,7 @@ class StackValidation:
             return False
 
         services = compose_data["services"]
-        if not isinstance(services, dict) or len(services) == 0:
+        if not isinstance(services, Mapping) or len(services) == 0:
             issues.append("'services' section is empty or invalid")
             details["validation_checks"]["services_section"] = {
                 "passed": False,
@@ -128,12 +129,12 @@ class StackValidation:
         }
         return True
 
-    def _validate_services(self, services: dict, issues: list[str], details: dict) -> None:
+    def _validate_services(self, services: Mapping, issues: list[str], details: dict) -> None:
         """Validate individual services configuration."""
         service_issues = []
 
         for service_name, service_config in services.items():
-            if not isinstance(service_config, dict):
+            if not isinstance(service_config, Mapping):
                 service_issues.append(
                     f"Service '{service_name}': Invalid configuration (not an object)"
                 )
@@ -161,7 +162,7 @@ class StackValidation:
         self, service_name: str, ports: Any, service_issues: list[str]
     ) -> None:
         """Validate service port specifications."""
-        if ports is None or not isinstance(ports, list):
+        if ports is None or not isinstance(ports, list | tuple):
             return
 
         for port_spec in ports:
@@ -169,11 +170,11 @@ class StackValidation:
                 # Allow container-only form like "80" (no host port); validate others via shared parser
                 if ":" not in port_spec:
                     continue
-                if self._parse_port_string(port_spec) is None:
+                if parse_port_string(port_spec) is None:
                     service_issues.append(
                         f"Service '{service_name}': Invalid port specification '{port_spec}'"
                     )
-            elif isinstance(port_spec, dict):
+            elif isinstance(port_spec, Mapping):
                 if "target" not in port_spec:
                     service_issues.append(
                         f"Service '{service_name}': Port object missing 'target' field"
@@ -183,7 +184,7 @@ class StackValidation:
         self, service_name: str, volumes: Any, service_issues: list[str]
     ) -> None:
         """Validate service volume specifications."""
-        if volumes is None or not isinstance(volumes, list):
+        if volumes is None or not isinstance(volumes, list | tuple):
             return
 
         for volume_spec in volumes:
@@ -343,130 +344,22 @@ class StackValidation:
 
         return all_available, missing_tools, details
 
-    def extract_ports_from_compose(self, compose_content: str) -> list[int]:
+    def extract_ports_from_compose(self, compose_content: str | ComposeModel) -> list[int]:
         """Extract exposed ports from compose file.
 
         Args:
-            compose_content: Docker Compose YAML content
+            compose_content: Docker Compose YAML content or parsed compose model
 
         Returns:
             List of port numbers that will be exposed
         """
         try:
-            import yaml
-
-            compose_data = yaml.safe_load(compose_content)
-            if not compose_data:
-                return []
-
-            exposed_ports = []
-            services = compose_data.get("services", {})
-
-            for _service_name, service_config in services.items():
-                service_ports = self._extract_service_ports(service_config)
-                exposed_ports.extend(service_ports)
-
-            return sorted(list(set(exposed_ports)))  # Remove duplicates and sort
+            return get_compose_model(compose_content).host_ports
 
         except Exception as e:
             self.logger.warning("Failed to parse ports from compose file", error=str(e))
             return []
 
-    def _extract_service_ports(self, service_config: dict) -> list[int]:
-        """Extract ports from a single service configuration."""
-        ports = service_config.get("ports", [])
-        service_ports = []
-
-        for port_spec in ports:
-            parsed_port = self._parse_port_specification(port_spec)
-            if parsed_port is not None:
-                service_ports.append(parsed_port)
-
-        return service_ports
-
-    def _parse_port_specification(self, port_spec) -> int | None:
-        """Parse a single port specification into a port number."""
-        if isinstance(port_spec, str):
-            return self._parse_port_string(port_spec)
-        elif isinstance(port_spec, int):
-            return port_spec
-        elif isinstance(port_spec, dict):
-            return self._parse_port_dict(port_spec)
-        else:
-            return None
-
-    def _parse_port_string(self, port_spec: str) -> int | None:
-        """Parse string format ports and extract the published host port.
-
-        Returns the host port (int) for published ports, or None for container-only ports.
-
-        Extracts host port from formats:
-        - 'host_port:container_port' -> host_port
-        - 'ip:host_port:container_port' -> host_port
-        - 'ip:host_port:container_port/proto' -> host_port
-        - '[::1]:host_port:container_port' -> host_port (IPv6)
-
-        Returns None for container-only formats:
-        - 'port' or 'container_port' -> None (no host mapping)
-        """
-        try:
-            # Remove protocol suffix if present (e.g., /tcp, /udp)
-            if "/" in port_spec:
-                port_spec = port_spec.split("/")[0]
-
-            # Handle IPv6 format [ip]:host:container
-            if port_spec.startswith("[") and "]:" in port_spec:
-                # Extract everything after the IPv6 part: [::1]:8080:80 -> 8080:80
-                _, port_part = port_spec.split("]", 1)
-                if port_part.startswith(":"):
-                    port_part = port_part[1:]  # Remove leading colon
-                port_spec = port_part
-
-            # Split on colons to handle different formats
-            parts = port_spec.split(":")
-
-            if len(parts) == 1:
-                # Simple format: just 'port' (container-only port, no host mapping)
-                return None
-            elif len(parts) == 2:
-                # Format: 'host_port:container_port'
-                return int(parts[0])
-            elif len(parts) == 3:
-                # Format: 'ip:host_port:container_port' - use middle part as host port
-                return int(parts[1])
-            elif len(parts) >= 4:
-                # Complex format like host:ip:hostport:containerport - use second-to-last as host port
-                return int(parts[-2])
-            else:
-                return None
-
-        except (ValueError, IndexError):
-            return None
-
-    def _parse_port_dict(self, port_spec: dict) -> int | None:
-        """Parse dictionary format ports with robust field handling.
-
-        Handles formats like:
-        - {target: 80, published: 8080}
-        - {target: 80, published: "8080"}
-        - {containerPort: 80, hostPort: 8080}
-        """
-        # Try different field names for published/host port
-        for field_name in ["published", "hostPort", "host_port", "external"]:
-            port_value = port_spec.get(field_name)
-            if port_value is not None:
-                try:
-                    if isinstance(port_value, str):
-                        # Handle string values that might be complex port specs
-                        parsed = self._parse_port_string(port_value)
-                        if parsed is not None:
-                            return parsed
-                    else:
-                        return int(port_value)
-                except (ValueError, TypeError):
-                    continue
-        return None
-
     async def check_port_conflicts(
         self, host: DockerHost, ports: list[int]
     ) -> tuple[bool, list[int], dict]:
@@ -581,31 +474,20 @@ class StackValidation:
             f"Unable to find available port after probing {max_attempts} candidates starting at {starting_port}"
         )
 
-    def extract_names_from_compose(self, compose_content: str) -> tuple[list[str], list[str]]:
+    def extract_names_from_compose(
+        self, compose_content: str | ComposeModel
+    ) -> tuple[list[str], list[str]]:
         """Extract service and network names from compose file.
 
         Args:
-            compose_content: Docker Compose YAML content
+            compose_content: Docker Compose YAML content or parsed compose model
 
         Returns:
             Tuple of (service_names: list[str], network_names: list[str])
         """
         try:
-            import yaml
-
-            compose_data = yaml.safe_load(compose_content)
-            service_names = []
-            network_names = []
-
-            # Extract service names
-            services = compose_data.get("services", {})
-            service_names = list(services.keys())
-
-            # Extract network names
-            networks = compose_data.get("networks", {})
-            network_names = list(networks.keys())
-
-            return service_names, network_names
+            compose_model = get_compose_model(compose_content)
+            return compose_model.service_names, list(compose_model.network_names)
 
         except Exception as e:
             self.logger.warning("Failed to parse names from compose file", error=str(e))
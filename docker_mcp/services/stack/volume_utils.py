@@ -5,11 +5,14 @@ Volume and mount handling utilities for Docker Compose stacks.
 Handles volume path normalization, mount extraction, and volume configuration.
 """
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+from ...core.compose_model import ComposeModel, get_compose_model
+
 
 class StackVolumeUtils:
     """Volume and mount handling utilities for stack operations."""
@@ -45,7 +48,7 @@ class StackVolumeUtils:
 
                 return f"{source_path}:{container_path}"
 
-        elif isinstance(volume, dict) and volume.get("type") == "bind":
+        elif isinstance(volume, Mapping) and volume.get("type") == "bind":
             source = volume.get("source", "")
             target = volume.get("target", "")
             if source and target:
@@ -56,12 +59,12 @@ class StackVolumeUtils:
         return None
 
     def extract_expected_mounts(
-        self, compose_content: str, target_appdata: str, stack_name: str
+        self, compose_content: str | ComposeModel, target_appdata: str, stack_name: str
     ) -> list[str]:
         """Extract expected volume mounts from compose file content.
 
         Args:
-            compose_content: Docker Compose YAML content
+            compose_content: Docker Compose YAML content or parsed compose model
             target_appdata: Target appdata path
             stack_name: Stack name
 
@@ -69,16 +72,12 @@ class StackVolumeUtils:
             List of expected mount strings in format "source:destination"
         """
         try:
-            import yaml
-
-            compose_data = yaml.safe_load(compose_content)
+            compose_model = get_compose_model(compose_content)
             expected_mounts = []
 
             # Parse services for volume mounts
-            services = compose_data.get("services", {})
-            for _service_name, service_config in services.items():
-                volumes = service_config.get("volumes", [])
-                for volume in volumes:
+            for service in compose_model.services:
+                for volume in service.volumes:
                     mount = self.normalize_volume_entry(volume, target_appdata, stack_name)
                     if mount and mount not in expected_mounts:
                         expected_mounts.append(mount)
@@ -135,92 +134,33 @@ class StackVolumeUtils:
 
         return resolved_paths
 
-    def extract_named_volumes(self, compose_content: str) -> list[str]:
+    def extract_named_volumes(self, compose_content: str | ComposeModel) -> list[str]:
         """Extract named volumes from compose file.
 
         Args:
-            compose_content: Docker Compose YAML content
+            compose_content: Docker Compose YAML content or parsed compose model
 
         Returns:
             List of named volume names
         """
         try:
-            import yaml
-
-            compose_data = yaml.safe_load(compose_content)
-            named_volumes = []
-
-            # Extract from top-level volumes section
-            if "volumes" in compose_data:
-                named_volumes.extend(list(compose_data["volumes"].keys()))
-
-            # Extract named volumes used in services
-            services = compose_data.get("services", {})
-            for _service_name, service_config in services.items():
-                volumes = service_config.get("volumes", [])
-                for volume in volumes:
-                    if isinstance(volume, str) and ":" in volume:
-                        source = volume.split(":")[0]
-                        if not source.startswith("/") and not source.startswith("."):
-                            # This is likely a named volume
-                            if source not in named_volumes:
-                                named_volumes.append(source)
-                    elif isinstance(volume, dict) and volume.get("type") == "volume":
-                        vol_name = volume.get("source")
-                        if vol_name and vol_name not in named_volumes:
-                            named_volumes.append(vol_name)
-
-            return named_volumes
+            return get_compose_model(compose_content).named_volumes
 
         except Exception as e:
             self.logger.warning("Failed to extract named volumes", error=str(e))
             return []
 
-    def extract_bind_mounts(self, compose_content: str) -> list[dict]:
+    def extract_bind_mounts(self, compose_content: str | ComposeModel) -> list[dict]:
         """Extract bind mount configurations from compose file.
 
         Args:
-            compose_content: Docker Compose YAML content
+            compose_content: Docker Compose YAML content or parsed compose model
 
         Returns:
             List of bind mount dictionaries with source, target, and options
         """
         try:
-            import yaml
-
-            compose_data = yaml.safe_load(compose_content)
-            bind_mounts = []
-
-            services = compose_data.get("services", {})
-            for service_name, service_config in services.items():
-                volumes = service_config.get("volumes", [])
-                for volume in volumes:
-                    bind_mount = None
-
-                    if isinstance(volume, str) and ":" in volume:
-                        parts = volume.split(":", 2)
-                        if len(parts) >= 2 and parts[0].startswith("/"):
-                            # This is a bind mount (absolute path)
-                            bind_mount = {
-                                "service": service_name,
-                                "source": parts[0],
-                                "target": parts[1],
-                                "options": parts[2] if len(parts) > 2 else None,
-                                "type": "bind",
-                            }
-                    elif isinstance(volume, dict) and volume.get("type") == "bind":
-                        bind_mount = {
-                            "service": service_name,
-                            "source": volume.get("source", ""),
-                            "target": volume.get("target", ""),
-                            "options": volume.get("bind", {}).get("propagation"),
-                            "type": "bind",
-                        }
-
-                    if bind_mount:
-                        bind_mounts.append(bind_mount)
-
-            return bind_mounts
+            return [mount.to_dict() for mount in get_compose_model(compose_content).bind_mounts]
 
         except Exception as e:
             self.logger.warning("Failed to extract bind mounts", error=str(e))
@@ -271,11 +211,11 @@ class StackVolumeUtils:
 
         return results
 
-    def suggest_volume_optimizations(self, compose_content: str) -> list[str]:
+    def suggest_volume_optimizations(self, compose_content: str | ComposeModel) -> list[str]:
         """Suggest optimizations for volume configuration.
 
         Args:
-            compose_content: Docker Compose YAML content
+            compose_content: Docker Compose YAML content or parsed compose model
 
         Returns:
             List of optimization suggestions
@@ -283,11 +223,9 @@ class StackVolumeUtils:
         suggestions = []
 
         try:
-            import yaml
-
-            compose_data = yaml.safe_load(compose_content)
-            bind_mounts = self.extract_bind_mounts(compose_content)
-            named_volumes = self.extract_named_volumes(compose_content)
+            compose_model = get_compose_model(compose_content)
+            bind_mounts = self.extract_bind_mounts(compose_model)
+            named_volumes = self.extract_named_volumes(compose_model)
 
             # Check for excessive bind mounts
             if len(bind_mounts) > 5:
@@ -297,9 +235,8 @@ class StackVolumeUtils:
                 )
 
             # Check for missing named volume definitions
-            volume_section = compose_data.get("volumes", {})
             for vol_name in named_volumes:
-                if vol_name not in volume_section:
+                if vol_name not in compose_model.volume_names:
                     suggestions.append(
                         f"Named volume '{vol_name}' is used but not defined in volumes section"
                     )
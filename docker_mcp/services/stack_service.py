@@ -19,9 +19,15 @@ from fastmcp.tools.tool import ToolResult
 from docker_mcp.models.enums import ComposeAction
 
 from ..core.config_loader import DockerMCPConfig
+from ..core.progress import emit_progress
 from .logs import LogsService
+from .stack.bulk import BULK_MAX_PARALLEL, BULK_PER_HOST_PARALLEL, StackBulkOperations
+from .stack.fleet_index import FleetStackIndex
 from .stack.migration_orchestrator import StackMigrationOrchestrator
 from .stack.operations import StackOperations
+from .stack.rolling import ROLLING_HEALTH_TIMEOUT_SECONDS, ROLLING_WAVE_SIZE, StackRollingDeploy
+from .stack.state_cache import StackStateCache
+from .stack.tracker import StackOperationTracker
 from .stack.validation import StackValidation
 
 
@@ -33,6 +39,7 @@ class StackService:
         config: DockerMCPConfig,
         context_manager: "DockerContextManager",
         logs_service: LogsService,
+        tracker: StackOperationTracker | None = None,
     ):
         self.config = config
         self.context_manager = context_manager
@@ -42,8 +49,18 @@ class StackService:
         self.operations = StackOperations(config, context_manager)
         self.migration_orchestrator = StackMigrationOrchestrator(config, context_manager)
         self.validation = StackValidation()
+        self.bulk = StackBulkOperations(config, self.operations.stack_tools)
+        self.state_cache = StackStateCache(config, context_manager, self.operations.stack_tools)
+        self.rolling = StackRollingDeploy(config, context_manager, self.operations.stack_tools)
+        self.fleet_index = FleetStackIndex(config, self.operations.stack_tools, self.state_cache)
+        self.tracker = tracker or StackOperationTracker()
         self.logs_service = logs_service
 
+    async def stop(self) -> None:
+        """Stop background work: fleet index refresh and stack event streams."""
+        await self.fleet_index.stop()
+        await self.state_cache.stop()
+
     def _validate_host(self, host_id: str) -> tuple[bool, str]:
         """Validate host exists in configuration."""
         if host_id not in self.config.hosts:
@@ -88,22 +105,35 @@ class StackService:
         environment: dict[str, str] | None = None,
         pull_images: bool = True,
         recreate: bool = False,
+        force: bool = False,
     ) -> ToolResult:
         """Deploy a Docker Compose stack to a remote host."""
         return await self.operations.deploy_stack(
-            host_id, stack_name, compose_content, environment, pull_images, recreate
+            host_id, stack_name, compose_content, environment, pull_images, recreate, force
         )
 
     async def manage_stack(
         self, host_id: str, stack_name: str, action: str, options: dict[str, Any] | None = None
     ) -> ToolResult:
         """Unified stack lifecycle management."""
-        return await self.operations.manage_stack(host_id, stack_name, action, options)
+        result = await self.operations.manage_stack(host_id, stack_name, action, options)
+        if action == "down" and (result.structured_content or {}).get("success"):
+            self.fleet_index.forget(host_id, stack_name)
+        return result
 
     async def list_stacks(self, host_id: str) -> ToolResult:
         """List Docker Compose stacks on a host."""
         return await self.operations.list_stacks(host_id)
 
+    async def list_stacks_cached(self, host_id: str) -> dict[str, Any]:
+        """List stacks from the event-maintained state cache (live listing until synced)."""
+        result = await self.state_cache.get_stacks(host_id)
+        if result.get("success"):
+            result["formatted_output"] = "\n".join(
+                self.operations._format_stacks_list(result, host_id)
+            )
+        return result
+
     async def get_stack_compose_file(self, host_id: str, stack_name: str) -> ToolResult:
         """Get the docker-compose.yml content for a specific stack."""
         return await self.operations.get_stack_compose_file(host_id, stack_name)
@@ -280,7 +310,7 @@ class StackService:
             }
 
         try:
-            # Create temporary files and perform validation
+            # Stream compose content to the remote host and validate it
             return await self._perform_remote_compose_validation(host_id, compose_content, environment)
         except Exception as e:
             return {
@@ -290,110 +320,47 @@ class StackService:
             }
 
     async def _perform_remote_compose_validation(self, host_id: str, compose_content: str, environment: dict[str, str] | None) -> dict[str, Any]:
-        """Perform compose validation on remote host."""
-        host = self.config.hosts[host_id]
-
-        # Create temporary files for compose content and environment
-        temp_files = await self._create_temp_files(compose_content, environment)
-
-        try:
-            # Transfer files to remote host and validate
-            remote_paths = await self._transfer_files_to_remote_host(host, temp_files)
-            validation_result = await self._execute_remote_validation(host, remote_paths)
-            await self._cleanup_remote_files(host, remote_paths)
-
-            return validation_result
-        finally:
-            # Clean up local temporary files
-            self._cleanup_local_temp_files(temp_files)
-
-    async def _create_temp_files(self, compose_content: str, environment: dict[str, str] | None) -> dict[str, str]:
-        """Create temporary files for compose content and environment."""
-        import tempfile
-
-        temp_files = {}
-
-        # Create compose file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as compose_file:
-            compose_file.write(compose_content)
-            temp_files['compose'] = compose_file.name
-
-        # Create environment file if needed
-        if environment:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as env_file:
-                for key, value in environment.items():
-                    env_file.write(f"{key}={value}\n")
-                temp_files['env'] = env_file.name
-
-        return temp_files
-
-    async def _transfer_files_to_remote_host(self, host, temp_files: dict[str, str]) -> dict[str, str]:
-        """Transfer temporary files to remote host for validation."""
-        import os
-
-        remote_paths = {
-            'compose': f"/tmp/docker-mcp-validate-{os.path.basename(temp_files['compose'])}"  # noqa: S108 - Using /tmp with unique identifiers for compose validation only
-        }
-
-        if 'env' in temp_files:
-            remote_paths['env'] = f"/tmp/docker-mcp-validate-{os.path.basename(temp_files['env'])}"  # noqa: S108 - Using /tmp with unique identifiers for compose validation only
+        """Perform compose validation on remote host.
 
-        # Copy compose file to remote host
-        copy_result = await self._copy_file_to_remote(host, temp_files['compose'], remote_paths['compose'])
-        if not copy_result['success']:
-            raise Exception(f"Failed to copy compose file: {copy_result['error']}")
-
-        # Copy environment file if exists
-        if 'env' in temp_files:
-            await self._copy_file_to_remote(host, temp_files['env'], remote_paths['env'])
-
-        return remote_paths
-
-    async def _copy_file_to_remote(self, host, local_path: str, remote_path: str) -> dict[str, Any]:
-        """Copy a single file to remote host via SCP."""
+        Runs ``docker compose -f - config --quiet`` in one SSH exec with the compose
+        content on stdin, so no temp files are created locally or remotely. Environment
+        variables are sent ahead of the content (one KEY=value per line, ended by an
+        empty line) and exported by the remote shell before compose reads the rest.
+        """
         import asyncio
 
-        copy_cmd = ["scp"]
-        if host.port != 22:
-            copy_cmd.extend(["-P", str(host.port)])
-        if host.identity_file:
-            copy_cmd.extend(["-i", host.identity_file])
-        copy_cmd.extend([local_path, f"{host.user}@{host.hostname}:{remote_path}"])
+        from ..utils import build_ssh_command
 
-        copy_process = await asyncio.create_subprocess_exec(
-            *copy_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        _, copy_stderr = await copy_process.communicate()
+        host = self.config.hosts[host_id]
+        environment = environment or {}
 
-        if copy_process.returncode != 0:
+        multiline = [key for key, value in environment.items() if "\n" in str(value)]
+        if multiline:
             return {
-                "success": False,
-                "error": copy_stderr.decode().strip()
+                "valid": False,
+                "errors": [f"Environment values cannot contain newlines: {', '.join(multiline)}"],
+                "details": {"invalid_environment_keys": multiline},
             }
 
-        return {"success": True}
-
-    async def _execute_remote_validation(self, host, remote_paths: dict[str, str]) -> dict[str, Any]:
-        """Execute docker compose config validation on remote host."""
-        import asyncio
-
-        from ..utils import build_ssh_command
-
-        # Build validation command
-        ssh_cmd = build_ssh_command(host)
-        validate_cmd = ssh_cmd + [
-            f"cd /tmp && docker compose -f {remote_paths['compose']}"
-        ]
-
-        if 'env' in remote_paths:
-            validate_cmd.extend(["--env-file", remote_paths['env']])
-        validate_cmd.extend(["config", "--quiet"])
+        remote_script = "cd /tmp"
+        stdin_payload = ""
+        if environment:
+            remote_script += (
+                '; while IFS= read -r line && [ -n "$line" ]; do export "$line"; done'
+            )
+            stdin_payload = "".join(f"{key}={value}\n" for key, value in environment.items())
+            stdin_payload += "\n"
+        remote_script += "; docker compose -f - config --quiet"
+        stdin_payload += compose_content
 
-        # Execute validation
         validate_process = await asyncio.create_subprocess_exec(
-            *validate_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            *build_ssh_command(host),
+            remote_script,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await validate_process.communicate()
+        _, stderr = await validate_process.communicate(stdin_payload.encode("utf-8"))
 
         if validate_process.returncode == 0:
             return {
@@ -413,33 +380,6 @@ class StackService:
                 }
             }
 
-    async def _cleanup_remote_files(self, host, remote_paths: dict[str, str]) -> None:
-        """Clean up temporary files on remote host."""
-        import asyncio
-
-        from ..utils import build_ssh_command
-
-        ssh_cmd = build_ssh_command(host)
-        cleanup_cmd = ssh_cmd + [f"rm -f {remote_paths['compose']}"]
-
-        if 'env' in remote_paths:
-            cleanup_cmd.extend([f"; rm -f {remote_paths['env']}"])
-
-        cleanup_process = await asyncio.create_subprocess_exec(
-            *cleanup_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        await cleanup_process.communicate()
-
-    def _cleanup_local_temp_files(self, temp_files: dict[str, str]) -> None:
-        """Clean up local temporary files."""
-        import os
-
-        for file_path in temp_files.values():
-            try:
-                os.unlink(file_path)
-            except OSError:
-                pass  # Files may have already been cleaned up
-
     def _parse_compose_validation_errors(self, error_output: str) -> list[str]:
         """Parse docker compose validation errors into user-friendly messages."""
         if not error_output:
@@ -538,12 +478,17 @@ class StackService:
         """Dispatch action to appropriate handler method."""
         # Normalize strings to enum when possible
         normalized_action = self._normalize_action(action)
+        # Keep the fleet index warm so duplicate-name checks are memory lookups
+        self.fleet_index.ensure_refreshing()
 
         # Create dispatch mapping
         dispatch_map: dict[ComposeAction, Callable[..., Awaitable[dict[str, Any]]]] = {
             ComposeAction.LIST: self._handle_list_action,
             ComposeAction.VIEW: self._handle_view_action,
             ComposeAction.DEPLOY: self._handle_deploy_action,
+            ComposeAction.ROLLOUT: self._handle_rollout_action,
+            ComposeAction.FIND: self._handle_find_action,
+            ComposeAction.STATUS: self._handle_status_action,
             ComposeAction.LOGS: self._handle_logs_action,
             ComposeAction.DISCOVER: self._handle_discover_action,
             ComposeAction.MIGRATE: self._handle_migrate_action,
@@ -624,6 +569,7 @@ class StackService:
         environment = params.get("environment", {})
         pull_images = params.get("pull_images", True)
         recreate = params.get("recreate", False)
+        force = params.get("force", False)
 
         if not host_id:
             return self._error_response("host_id is required for deploy action")
@@ -632,22 +578,177 @@ class StackService:
         if not compose_content:
             return self._error_response("compose_content is required for deploy action")
 
+        if name_error := self._deploy_stack_name_error(stack_name):
+            return self._error_response(name_error)
+
+        # Unchanged content + environment: answer before validating or invoking compose
+        if not (force or recreate):
+            up_to_date = await self.operations.stack_tools.check_deploy_up_to_date(
+                host_id, stack_name, compose_content, environment
+            )
+            if up_to_date is not None:
+                return self._note_duplicate_hosts(
+                    self._unwrap(
+                        self.operations._up_to_date_result(up_to_date, stack_name, host_id)
+                    ),
+                    stack_name,
+                    host_id,
+                )
+
+        # Validate compose file syntax before deployment
+        validation_result = await self._validate_compose_file_syntax(host_id, compose_content, environment)
+        if not validation_result["valid"]:
+            return {
+                "success": False,
+                "error": "Compose file validation failed",
+                "validation_errors": validation_result["errors"],
+                "validation_details": validation_result.get("details", {}),
+                "formatted_output": "❌ Compose file validation failed",
+            }
+
+        # The up-to-date check already ran above, so deploy without repeating it
+        async def deploy() -> dict[str, Any]:
+            result = await self.deploy_stack(
+                host_id, stack_name, compose_content, environment, pull_images, recreate, force=True
+            )
+            return self._unwrap(result)
+
+        operation = self.tracker.start("deploy", stack_name=stack_name, host_id=host_id)
+        response = await self.tracker.run(operation, deploy, params.get("progress_listener"))
+        response = self._note_duplicate_hosts(response, stack_name, host_id)
+        if response.get("success"):
+            self.fleet_index.record(host_id, stack_name, response.get("compose_file"), "running")
+        return response
+
+    def _deploy_stack_name_error(self, stack_name: str) -> str | None:
+        """Return why ``stack_name`` cannot be deployed, or None if it is valid."""
         # Validate stack name format (allow underscores per IMPLEMENT_ME.md)
         if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9_-]*$", stack_name):
-            return self._error_response(
-                "stack_name must contain only letters, numbers, underscores, and hyphens, starting with alphanumeric"
-            )
+            return "stack_name must contain only letters, numbers, underscores, and hyphens, starting with alphanumeric"
 
         # Validate stack name length and reserved names
         if len(stack_name) > 63:
-            return self._error_response("stack_name must be 63 characters or fewer")
+            return "stack_name must be 63 characters or fewer"
 
         reserved_names = {"docker", "compose", "system", "network", "volume"}
         if stack_name.lower() in reserved_names:
-            return self._error_response(f"stack_name '{stack_name}' is reserved")
+            return f"stack_name '{stack_name}' is reserved"
+        return None
 
-        # Validate compose file syntax before deployment
-        validation_result = await self._validate_compose_file_syntax(host_id, compose_content, environment)
+    def _note_duplicate_hosts(
+        self, response: dict[str, Any], stack_name: str, host_id: str
+    ) -> dict[str, Any]:
+        """Flag other hosts the fleet index knows to run a stack of the same name."""
+        others = [h for h in self.fleet_index.hosts_for(stack_name) if h != host_id]
+        if not others:
+            return response
+        response = {**response, "duplicate_hosts": others}
+        warning = f"⚠️  Stack name '{stack_name}' is also deployed on: {', '.join(others)}"
+        if response.get("formatted_output"):
+            response["formatted_output"] += f"\n{warning}"
+        self.logger.warning(
+            "Stack name deployed on several hosts",
+            stack_name=stack_name,
+            host_id=host_id,
+            duplicate_hosts=others,
+        )
+        return response
+
+    async def _handle_status_action(self, **params) -> dict[str, Any]:
+        """Handle STATUS action: progress of a tracked operation by operation_id."""
+        operation_id = params.get("operation_id", "")
+        icons = {"running": "🔄", "succeeded": "✅", "failed": "❌"}
+
+        if not operation_id:
+            operations = [operation.snapshot(None) for operation in self.tracker.list()]
+            plural = "s" if len(operations) != 1 else ""
+            lines = [f"📋 {len(operations)} tracked operation{plural}"]
+            for entry in operations:
+                lines.append(
+                    f"  {icons[entry['status']]} {entry['operation_id']} {entry['kind']} "
+                    f"{entry['stack_name']}: {entry['status']} ({entry['duration_seconds']}s)"
+                )
+            return {
+                "success": True,
+                "operations": operations,
+                "formatted_output": "\n".join(lines),
+            }
+
+        operation = self.tracker.get(operation_id)
+        if operation is None:
+            return self._error_response(f"Operation '{operation_id}' not found (or expired)")
+
+        snapshot = operation.snapshot(params.get("since_event") or 0)
+        lines = [
+            f"{icons[snapshot['status']]} {snapshot['kind']} {snapshot['stack_name']}: "
+            f"{snapshot['status']} ({snapshot['duration_seconds']}s)"
+        ]
+        if snapshot["step"]:
+            lines.append(f"  Step: {snapshot['step']}")
+        for event in snapshot["events"][-20:]:
+            lines.append(f"  #{event['seq']} [{event['type']}] {event['message']}")
+        if snapshot["status"] == "running":
+            lines.append(f"  Continue with since_event={snapshot['last_event']}")
+        return {"success": True, **snapshot, "formatted_output": "\n".join(lines)}
+
+    async def _handle_find_action(self, **params) -> dict[str, Any]:
+        """Handle FIND action: locate stacks across all hosts from the fleet index."""
+        stack_name = params.get("stack_name", "")
+        stack_pattern = params.get("stack_pattern")
+        result = await self.fleet_index.find(stack_name, stack_pattern)
+
+        stacks = result["stacks"]
+        if stack_name and not stacks:
+            lines = [f"🔎 Stack '{stack_name}' not found on any host"]
+        else:
+            host_count = len({entry["host_id"] for hosts in stacks.values() for entry in hosts})
+            lines = [
+                f"🔎 {len(stacks)} stack{'s' if len(stacks) != 1 else ''} "
+                f"on {host_count} host{'s' if host_count != 1 else ''}"
+            ]
+            for name, hosts in stacks.items():
+                marker = " ⚠️ duplicate" if name in result["duplicates"] else ""
+                lines.append(f"  {name}{marker}")
+                for entry in hosts:
+                    line = f"    {entry['host_id']}: {entry['status']}"
+                    if entry.get("compose_file"):
+                        line += f" ({entry['compose_file']})"
+                    lines.append(line)
+
+        failed_hosts = [h for h, state in result["hosts"].items() if state.get("error")]
+        if failed_hosts:
+            lines.append(f"⚠️  Stale (last refresh failed): {', '.join(failed_hosts)}")
+        if not result["complete"]:
+            lines.append("⏳ Index still loading; results cover hosts refreshed so far")
+        result["formatted_output"] = "\n".join(lines)
+        return result
+
+    async def _handle_rollout_action(self, **params) -> dict[str, Any]:
+        """Handle ROLLOUT action: deploy one stack across hosts in health-gated waves."""
+        stack_name = params.get("stack_name", "")
+        compose_content = params.get("compose_content", "")
+        environment = params.get("environment", {})
+        host_ids = [
+            h.strip() for h in (params.get("selected_hosts") or "").split(",") if h.strip()
+        ]
+
+        if not stack_name:
+            return self._error_response("stack_name is required for rollout action")
+        if not compose_content:
+            return self._error_response("compose_content is required for rollout action")
+        if not host_ids:
+            return self._error_response("selected_hosts is required for rollout action")
+        if not self.operations.stack_tools._validate_stack_name(stack_name):
+            return self._error_response(f"Invalid stack name: {stack_name}")
+        for host_id in host_ids:
+            is_valid, error_msg = self._validate_host(host_id)
+            if not is_valid:
+                return self._error_response(error_msg)
+
+        # Same content goes to every host, so validating on the first one is enough
+        validation_result = await self._validate_compose_file_syntax(
+            host_ids[0], compose_content, environment
+        )
         if not validation_result["valid"]:
             return {
                 "success": False,
@@ -657,10 +758,59 @@ class StackService:
                 "formatted_output": "❌ Compose file validation failed",
             }
 
-        result = await self.deploy_stack(
-            host_id, stack_name, compose_content, environment, pull_images, recreate
-        )
-        return self._unwrap(result)
+        async def rollout() -> dict[str, Any]:
+            return await self.rolling.rollout(
+                stack_name,
+                compose_content,
+                host_ids,
+                environment,
+                wave_size=params.get("wave_size") or ROLLING_WAVE_SIZE,
+                pull_images=params.get("pull_images", True),
+                health_timeout=params.get("health_timeout") or ROLLING_HEALTH_TIMEOUT_SECONDS,
+                rollback=params.get("rollback", True),
+            )
+
+        operation = self.tracker.start("rollout", stack_name=stack_name, hosts=host_ids)
+        result = await self.tracker.run(operation, rollout, params.get("progress_listener"))
+        if "waves" not in result:
+            return self._error_response(result.get("error", "Rollout failed"), **result)
+        result["formatted_output"] = "\n".join(self._format_rollout_result(result))
+        return result
+
+    def _format_rollout_result(self, result: dict[str, Any]) -> list[str]:
+        summary = result["summary"]
+        waves = len(result["waves"])
+        icon = "✅" if result["success"] else "❌"
+        lines = [
+            f"{icon} Rollout of {result['stack_name']}: {summary['healthy']}/{summary['total']} "
+            f"hosts healthy in {waves} wave{'s' if waves != 1 else ''} "
+            f"({result['duration_seconds']}s)"
+        ]
+        status_icons = {"healthy": "✅", "failed": "❌", "skipped": "⏭️"}
+        for wave in result["waves"]:
+            header = f"  Wave {wave['wave']}: {wave['status']}"
+            if "duration_seconds" in wave:
+                header += f" ({wave['duration_seconds']}s)"
+            lines.append(header)
+            for host in wave["hosts"]:
+                line = f"    {status_icons[host['status']]} {host['host_id']}"
+                if host.get("up_to_date"):
+                    line += " (already up to date)"
+                elif host["status"] == "healthy":
+                    line += f" (healthy after {host['health']['waited_seconds']}s)"
+                if host.get("error"):
+                    line += f": {host['error']}"
+                lines.append(line)
+
+        if result["rollback"]:
+            lines.append("↩️  Rollback:")
+            for entry in result["rollback"]:
+                status_icon = "✅" if entry["success"] else "❌"
+                line = f"  {status_icon} {entry['host_id']}: {entry['action']}"
+                if entry.get("error"):
+                    line += f" ({entry['error']})"
+                lines.append(line)
+        return lines
 
     async def _handle_manage_action(self, action: ComposeAction | str, **params) -> dict[str, Any]:
         """Handle string-based manage actions."""
@@ -685,6 +835,7 @@ class StackService:
         stack_name = params.get("stack_name", "")
         follow = params.get("follow", False)
         lines = params.get("lines", 100)
+        since = params.get("since")
 
         if not host_id:
             return self._error_response("host_id is required for logs action")
@@ -697,38 +848,154 @@ class StackService:
             if host_id not in self.config.hosts:
                 return {"success": False, "error": f"Host {host_id} not found"}
 
-            logs_options = {"tail": str(lines), "follow": follow}
-            result = await self.manage_stack(host_id, stack_name, "logs", logs_options)
-
-            logs_data = self._unwrap(result)
-            if logs_data.get("success", False):
-                if "output" in logs_data:
-                    logs_lines = logs_data["output"].split("\n") if logs_data["output"] else []
-                    header = f"Stack Logs: {stack_name} on {host_id} ({len(logs_lines)} lines)"
-                    formatted_lines = [header]
-                    if logs_lines:
-                        formatted_lines.append("")
-                        formatted_lines.extend(logs_lines)
-                    formatted_text = "\n".join(formatted_lines)
-                    return {
-                        "success": True,
-                        "host_id": host_id,
-                        "stack_name": stack_name,
-                        "logs": logs_lines,
-                        "lines_requested": lines,
-                        "lines_returned": len(logs_lines),
-                        "follow": follow,
-                        "formatted_output": formatted_text,
-                    }
-                logs_data.setdefault("formatted_output", "❌ Failed to retrieve stack logs")
-                return logs_data
-            return self._error_response("Failed to retrieve stack logs")
+            log_filters = {key: params.get(key) for key in ("grep", "level", "regex")}
+            summarize = params.get("summarize", False)
+            service_name = params.get("service_name") or None
+            if not follow:
+                merged = await self._get_merged_stack_logs(
+                    host_id, stack_name, lines, since, log_filters, summarize, service_name
+                )
+                if merged is not None:
+                    return merged
+
+            # Follow mode, or no containers visible via labels: defer to compose itself
+            return await self._get_compose_stack_logs(
+                host_id, stack_name, lines, follow, since, summarize, service_name
+            )
         except Exception as e:
             self.logger.error(
                 "stack logs error", host_id=host_id, stack_name=stack_name, error=str(e)
             )
             return self._error_response(f"Failed to get stack logs: {str(e)}")
 
+    async def _get_compose_stack_logs(
+        self,
+        host_id: str,
+        stack_name: str,
+        lines: int,
+        follow: bool,
+        since: str | None,
+        summarize: bool,
+        service_name: str | None,
+    ) -> dict[str, Any]:
+        """Get stack logs through ``docker compose logs`` on the host."""
+        logs_options = {
+            "tail": str(lines),
+            "follow": follow,
+            "since": since,
+            "services": service_name,
+        }
+        result = await self.manage_stack(host_id, stack_name, "logs", logs_options)
+
+        logs_data = self._unwrap(result)
+        if logs_data.get("success", False):
+            if "output" in logs_data:
+                logs_lines = logs_data["output"].split("\n") if logs_data["output"] else []
+                header = f"Stack Logs: {stack_name} on {host_id} ({len(logs_lines)} lines)"
+                formatted_lines = [header]
+                response = {
+                    "success": True,
+                    "host_id": host_id,
+                    "stack_name": stack_name,
+                    "logs": logs_lines,
+                    "lines_requested": lines,
+                    "lines_returned": len(logs_lines),
+                    "follow": follow,
+                }
+                if summarize:
+                    self._summarize_stack_logs(response, formatted_lines)
+                elif logs_lines:
+                    formatted_lines.append("")
+                    formatted_lines.extend(logs_lines)
+                response["formatted_output"] = "\n".join(formatted_lines)
+                return response
+            logs_data.setdefault("formatted_output", "❌ Failed to retrieve stack logs")
+            return logs_data
+        return self._error_response("Failed to retrieve stack logs")
+
+    async def _get_merged_stack_logs(
+        self,
+        host_id: str,
+        stack_name: str,
+        lines: int,
+        since: str | None,
+        log_filters: dict[str, str | None] | None = None,
+        summarize: bool = False,
+        service_name: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Get stack logs merged across containers by timestamp, or None if unavailable.
+
+        With ``service_name`` only that service's replicas are merged.
+        """
+        filters = log_filters or {}
+        if service_name:
+            result = await self.logs_service.get_service_logs(
+                host_id=host_id,
+                service_name=service_name,
+                lines=lines,
+                since=since,
+                timestamps=True,
+                stack_name=stack_name,
+                grep=filters.get("grep"),
+                level=filters.get("level"),
+                regex=filters.get("regex"),
+            )
+        else:
+            result = await self.logs_service.get_aggregated_logs(
+                host_id=host_id,
+                stack_name=stack_name,
+                lines=lines,
+                since=since,
+                grep=filters.get("grep"),
+                level=filters.get("level"),
+                regex=filters.get("regex"),
+            )
+        if not result.get("success"):
+            if any(filters.values()):
+                # Compose CLI fallback cannot apply filters; surface the error instead
+                return self._error_response(
+                    result.get("error", "Failed to get stack logs"),
+                    host_id=host_id,
+                    stack_name=stack_name,
+                )
+            return None
+
+        data = result.get("data", {})
+        logs_lines = data.get("logs", [])
+        target = f"{stack_name}/{service_name}" if service_name else stack_name
+        header = f"Stack Logs: {target} on {host_id} ({len(logs_lines)} lines)"
+        formatted_lines = [header]
+        if data.get("truncated"):
+            formatted_lines.append(f"⚠️  Truncated by {data.get('truncated_by')} budget")
+        response = {
+            "success": True,
+            "host_id": host_id,
+            "stack_name": stack_name,
+            "logs": logs_lines,
+            "sources": data.get("sources", data.get("replicas", [])),
+            "lines_requested": lines,
+            "lines_returned": len(logs_lines),
+            "truncated": data.get("truncated", False),
+            "truncated_by": data.get("truncated_by"),
+            "since": since,
+            "follow": False,
+        }
+        if summarize:
+            self._summarize_stack_logs(response, formatted_lines)
+        elif logs_lines:
+            formatted_lines.append("")
+            formatted_lines.extend(logs_lines)
+        response["formatted_output"] = "\n".join(formatted_lines)
+        return response
+
+    def _summarize_stack_logs(self, response: dict[str, Any], formatted_lines: list[str]) -> None:
+        """Replace raw stack log lines in a response with a template summary."""
+        summary = self.logs_service.summarize_logs(response.pop("logs"))
+        response["summary"] = summary
+        formatted_lines.append(
+            self.logs_service.format_log_summary(summary, "Stack log summary")
+        )
+
     async def _handle_discover_action(self, **params) -> dict[str, Any]:
         """Handle DISCOVER action."""
         host_id = params.get("host_id", "")
@@ -765,22 +1032,34 @@ class StackService:
         if not stack_name:
             return {"success": False, "error": "stack_name is required for migrate action"}
 
-        result = await self.migrate_stack(
-            source_host_id=host_id,
-            target_host_id=target_host_id,
-            stack_name=stack_name,
-            skip_stop_source=skip_stop_source,
-            start_target=start_target,
-            remove_source=remove_source,
-            dry_run=dry_run,
+        async def migrate() -> dict[str, Any]:
+            result = await self.migrate_stack(
+                source_host_id=host_id,
+                target_host_id=target_host_id,
+                stack_name=stack_name,
+                skip_stop_source=skip_stop_source,
+                start_target=start_target,
+                remove_source=remove_source,
+                dry_run=dry_run,
+            )
+            return self._unwrap(result)
+
+        operation = self.tracker.start(
+            "migrate", stack_name=stack_name, host_id=host_id, target_host_id=target_host_id
         )
+        result = await self.tracker.run(operation, migrate, params.get("progress_listener"))
 
-        migration_result = self._unwrap(result)
+        # Flags the target too if it already runs a stack of this name
+        migration_result = self._note_duplicate_hosts(result, stack_name, host_id)
         if migration_result.get("success", False):
             # Create a copy to avoid modifying the original
             migration_result = migration_result.copy()
             if "overall_success" in migration_result:
                 migration_result["success"] = migration_result["overall_success"]
+            if migration_result["success"] and not dry_run:
+                self.fleet_index.record(target_host_id, stack_name)
+                if remove_source:
+                    self.fleet_index.forget(host_id, stack_name)
             return migration_result
         return migration_result
 
@@ -790,6 +1069,9 @@ class StackService:
         stack_name = params.get("stack_name", "")
         options = params.get("options", {})
 
+        if params.get("targets") or params.get("batches") or params.get("stack_pattern"):
+            return await self._handle_bulk_lifecycle_action(action, **params)
+
         if not host_id:
             return {"success": False, "error": "host_id is required for stack lifecycle actions"}
         if not stack_name:
@@ -799,3 +1081,88 @@ class StackService:
             host_id=host_id, stack_name=stack_name, action=action.value, options=options
         )
         return self._unwrap(result)
+
+    async def _handle_bulk_lifecycle_action(self, action, **params) -> dict[str, Any]:
+        """Run a lifecycle action across targets, batches or a stack_pattern selection.
+
+        The run is a tracked operation: each target's result is reported as a
+        progress event as soon as it completes.
+        """
+        try:
+            batches = await self._resolve_bulk_batches(params.get("host_id", ""), params)
+        except ValueError as e:
+            return self._error_response(str(e))
+
+        if not any(batches):
+            return self._error_response("No stacks matched the bulk selection")
+
+        async def report_result(entry: dict[str, Any]) -> None:
+            self.logger.info("Bulk stack target finished", action=action.value, **entry)
+            if action == ComposeAction.DOWN and entry["status"] == "succeeded":
+                self.fleet_index.forget(entry["host_id"], entry["stack_name"])
+            emit_progress(
+                "target", f"{entry['host_id']}/{entry['stack_name']} {entry['status']}", **entry
+            )
+
+        async def run_bulk() -> dict[str, Any]:
+            try:
+                return await self.bulk.run(
+                    action.value,
+                    batches,
+                    options=params.get("options") or {},
+                    max_parallel=params.get("max_parallel") or BULK_MAX_PARALLEL,
+                    per_host_parallel=params.get("per_host_parallel") or BULK_PER_HOST_PARALLEL,
+                    stop_on_failure=params.get("stop_on_failure", False),
+                    on_result=report_result,
+                )
+            except ValueError as e:
+                return self._error_response(str(e))
+
+        operation = self.tracker.start(
+            "bulk", action=action.value, targets=sum(len(batch) for batch in batches)
+        )
+        result = await self.tracker.run(operation, run_bulk, params.get("progress_listener"))
+        if "summary" not in result:
+            return result
+        result["formatted_output"] = "\n".join(self._format_bulk_result(action.value, result))
+        return result
+
+    async def _resolve_bulk_batches(
+        self, host_id: str, params: dict[str, Any]
+    ) -> list[list[tuple[str, str]]]:
+        """Build dependency-ordered target batches from batches, targets or stack_pattern.
+
+        Raises:
+            ValueError: If a target is invalid or a host cannot be listed
+        """
+        if params.get("batches"):
+            return [self.bulk.parse_targets(batch, host_id) for batch in params["batches"]]
+        if params.get("targets"):
+            return [self.bulk.parse_targets(params["targets"], host_id)]
+        if host_id:
+            is_valid, error_msg = self._validate_host(host_id)
+            if not is_valid:
+                raise ValueError(error_msg)
+            host_ids = [host_id]
+        else:
+            host_ids = [hid for hid, host in self.config.hosts.items() if host.enabled]
+        return [await self.bulk.resolve_selector(params["stack_pattern"], host_ids)]
+
+    def _format_bulk_result(self, action: str, result: dict[str, Any]) -> list[str]:
+        """Format a bulk run summary with one line per target."""
+        summary = result["summary"]
+        icon = "✅" if result["success"] else "❌"
+        formatted_lines = [
+            f"{icon} Bulk {action}: {summary['succeeded']}/{summary['total']} succeeded, "
+            f"{summary['failed']} failed, {summary['skipped']} skipped "
+            f"({result['batches']} batch{'es' if result['batches'] != 1 else ''})"
+        ]
+        status_icons = {"succeeded": "✅", "failed": "❌", "skipped": "⏭️"}
+        for entry in result["results"]:
+            line = f"  {status_icons[entry['status']]} {entry['host_id']}/{entry['stack_name']}"
+            if "duration_seconds" in entry:
+                line += f" (batch {entry['batch']}, {entry['duration_seconds']}s)"
+            if entry.get("error"):
+                line += f": {entry['error']}"
+            formatted_lines.append(line)
+        return formatted_lines
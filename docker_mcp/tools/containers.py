@@ -1,6 +1,9 @@
 """Container management MCP tools."""
 
 import asyncio
+import heapq
+import time
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
@@ -17,6 +20,7 @@ from ..core.config_loader import DockerMCPConfig
 from ..core.docker_context import DockerContextManager
 from ..core.error_response import DockerMCPErrorResponse, create_success_response
 from ..core.exceptions import DockerCommandError, DockerContextError
+from ..core.image_pull import ProgressCallback, pull_image
 from ..models.container import (
     ContainerStats,
     PortConflict,
@@ -27,6 +31,20 @@ from .stacks import StackTools
 
 logger = structlog.get_logger()
 
+# Cached cpu_stats older than this are not used as the CPU% baseline
+CPU_SAMPLE_MAX_AGE_SECONDS = 30.0
+
+# Concurrent stats requests per host during fleet-wide queries
+FLEET_STATS_PER_HOST_CONCURRENCY = 8
+
+# Sort keys for fleet-wide top-N queries
+_FLEET_SORT_KEYS = {
+    "cpu": lambda s: s.get("cpu_percentage") or 0.0,
+    "memory": lambda s: s.get("memory_usage") or 0,
+    "network": lambda s: (s.get("network_rx") or 0) + (s.get("network_tx") or 0),
+    "block_io": lambda s: (s.get("block_read") or 0) + (s.get("block_write") or 0),
+}
+
 
 class ContainerTools:
     """Container management tools for MCP."""
@@ -35,6 +53,10 @@ class ContainerTools:
         self.config = config
         self.context_manager = context_manager
         self.stack_tools = StackTools(config, context_manager)
+        # (host_id, full container id) -> (monotonic timestamp, raw cpu_stats)
+        self._cpu_samples: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        # Hosts whose engine or SDK rejected one-shot stats
+        self._one_shot_unsupported: set[str] = set()
 
     def _build_error_response(
         self, host_id: str, operation: str, error_message: str, container_id: str | None = None
@@ -555,55 +577,11 @@ class ContainerTools:
             # Get container and retrieve stats using Docker SDK
             container = await asyncio.to_thread(client.containers.get, container_id)
 
-            # Docker SDK returns a single snapshot dict when stream=False
-            stats_raw = await asyncio.to_thread(lambda: container.stats(stream=False))
-
-            # Parse stats data from Docker SDK format (different from CLI format)
-            cpu_stats = stats_raw.get("cpu_stats", {})
-            memory_stats = stats_raw.get("memory_stats", {})
-            networks = stats_raw.get("networks", {})
-            blkio_stats = stats_raw.get("blkio_stats", {})
-            pids_stats = stats_raw.get("pids_stats", {})
-
-            # Calculate CPU percentage from Docker SDK data
-            cpu_percent = self._calculate_cpu_percentage(
-                cpu_stats, stats_raw.get("precpu_stats", {})
-            )
-
-            # Memory stats
-            memory_usage = memory_stats.get("usage", 0)
-            memory_limit = memory_stats.get("limit", 0)
-            memory_percent = (memory_usage / memory_limit * 100) if memory_limit > 0 else 0
-
-            # Network stats (sum all interfaces)
-            net_rx = sum(net.get("rx_bytes", 0) for net in networks.values())
-            net_tx = sum(net.get("tx_bytes", 0) for net in networks.values())
-
-            # Block I/O stats
-            blk_read = sum(
-                stat.get("value", 0)
-                for stat in blkio_stats.get("io_service_bytes_recursive", [])
-                if stat.get("op") == "read"
-            )
-            blk_write = sum(
-                stat.get("value", 0)
-                for stat in blkio_stats.get("io_service_bytes_recursive", [])
-                if stat.get("op") == "write"
-            )
+            # One round trip when a fresh cached sample exists, otherwise a full
+            # sampling-interval snapshot that carries its own precpu_stats
+            stats_raw, cpu_percent = await self._sample_container_stats(host_id, container)
 
-            stats = ContainerStats(
-                container_id=container_id,
-                host_id=host_id,
-                cpu_percentage=cpu_percent,
-                memory_usage=memory_usage,
-                memory_limit=memory_limit,
-                memory_percentage=memory_percent,
-                network_rx=net_rx,
-                network_tx=net_tx,
-                block_read=blk_read,
-                block_write=blk_write,
-                pids=pids_stats.get("current", 0),
-            )
+            stats = self._build_container_stats(host_id, container_id, stats_raw, cpu_percent)
 
             logger.debug("Retrieved container stats", host_id=host_id, container_id=container_id)
 
@@ -651,6 +629,228 @@ class ContainerTools:
                 },
             )
 
+    async def get_fleet_top_containers(
+        self, sort_by: str = "cpu", limit: int = 10, host_timeout: float = 10.0
+    ) -> dict[str, Any]:
+        """Get the top-N resource consumers across all enabled hosts.
+
+        Stats are collected from every enabled host in parallel; each host must finish
+        within ``host_timeout`` seconds. A host that misses the deadline contributes the
+        containers sampled so far and is reported as partial (or timed out if nothing was
+        sampled); failed hosts are reported instead of failing the whole query.
+
+        Args:
+            sort_by: Ranking metric - cpu, memory, network or block_io
+            limit: Number of containers to return
+            host_timeout: Per-host deadline in seconds
+
+        Returns:
+            Top containers with host attribution and sample age
+        """
+        sort_key = _FLEET_SORT_KEYS.get(sort_by)
+        if sort_key is None:
+            return DockerMCPErrorResponse.generic_error(
+                f"Invalid sort_by '{sort_by}'. Valid options: {', '.join(_FLEET_SORT_KEYS)}",
+                {"operation": "get_fleet_top_containers", "sort_by": sort_by},
+            )
+
+        host_ids = [host_id for host_id, host in self.config.hosts.items() if host.enabled]
+        started = time.monotonic()
+        collected: dict[str, dict[str, Any]] = {
+            host_id: {"containers": 0, "samples": []} for host_id in host_ids
+        }
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self._collect_host_stats(host_id, collected[host_id]), timeout=host_timeout
+                )
+                for host_id in host_ids
+            ),
+            return_exceptions=True,
+        )
+
+        samples: list[dict[str, Any]] = []
+        timed_out_hosts: list[str] = []
+        partial_hosts: dict[str, dict[str, int]] = {}
+        failed_hosts: dict[str, str] = {}
+        for host_id, outcome in zip(host_ids, outcomes, strict=True):
+            host_samples = collected[host_id]["samples"]
+            if isinstance(outcome, TimeoutError):
+                if host_samples:
+                    # Keep what was sampled before the deadline
+                    samples.extend(host_samples)
+                    partial_hosts[host_id] = {
+                        "sampled": len(host_samples),
+                        "containers": collected[host_id]["containers"],
+                    }
+                else:
+                    timed_out_hosts.append(host_id)
+            elif isinstance(outcome, BaseException):
+                failed_hosts[host_id] = str(outcome) or type(outcome).__name__
+            else:
+                samples.extend(host_samples)
+
+        top = heapq.nlargest(limit, samples, key=sort_key)
+        now = time.monotonic()
+        for entry in top:
+            entry["sample_age_seconds"] = round(now - entry.pop("_sampled_monotonic"), 3)
+
+        logger.info(
+            "Fleet stats collected",
+            hosts_queried=len(host_ids),
+            containers_sampled=len(samples),
+            timed_out_hosts=timed_out_hosts,
+            partial_hosts=list(partial_hosts),
+            failed_hosts=list(failed_hosts),
+            duration_seconds=round(now - started, 3),
+        )
+
+        return create_success_response(
+            message=f"Top {len(top)} containers by {sort_by} across {len(host_ids)} hosts",
+            data={
+                "sort_by": sort_by,
+                "limit": limit,
+                "containers": top,
+                "hosts_queried": host_ids,
+                "hosts_responded": len(host_ids) - len(timed_out_hosts) - len(failed_hosts),
+                "timed_out_hosts": timed_out_hosts,
+                "partial_hosts": partial_hosts,
+                "failed_hosts": failed_hosts,
+                "containers_sampled": len(samples),
+                "host_timeout": host_timeout,
+            },
+            context={"operation": "get_fleet_top_containers"},
+        )
+
+    async def _collect_host_stats(self, host_id: str, collected: dict[str, Any]) -> None:
+        """Sample stats for every running container on one host.
+
+        Each sample is appended to ``collected["samples"]`` as soon as it is taken, so a
+        caller that cancels at its deadline still has every sample finished by then.
+        """
+        client = await self.context_manager.get_client(host_id)
+        if client is None:
+            raise DockerContextError(f"Could not connect to Docker on host {host_id}")
+
+        containers = await asyncio.to_thread(client.containers.list)
+        collected["containers"] = len(containers)
+        semaphore = asyncio.Semaphore(FLEET_STATS_PER_HOST_CONCURRENCY)
+
+        async def sample(container: "docker.models.containers.Container") -> None:
+            async with semaphore:
+                try:
+                    stats_raw, cpu_percent = await self._sample_container_stats(host_id, container)
+                except (docker.errors.NotFound, docker.errors.APIError) as e:
+                    # Container went away or stopped mid-query; skip it
+                    logger.debug(
+                        "Skipping container stats",
+                        host_id=host_id,
+                        container_id=container.id[:12],
+                        error=str(e),
+                    )
+                    return
+            stats = self._build_container_stats(host_id, container.id[:12], stats_raw, cpu_percent)
+            entry = stats.model_dump()
+            entry["name"] = container.name
+            entry["sampled_at"] = datetime.now(UTC).isoformat()
+            entry["_sampled_monotonic"] = time.monotonic()
+            collected["samples"].append(entry)
+
+        await asyncio.gather(*(sample(c) for c in containers))
+
+    def _build_container_stats(
+        self, host_id: str, container_id: str, stats_raw: dict[str, Any], cpu_percent: float
+    ) -> ContainerStats:
+        """Build a ContainerStats model from a raw Docker SDK stats snapshot."""
+        # Parse stats data from Docker SDK format (different from CLI format)
+        memory_stats = stats_raw.get("memory_stats", {})
+        networks = stats_raw.get("networks", {})
+        blkio_stats = stats_raw.get("blkio_stats", {})
+        pids_stats = stats_raw.get("pids_stats", {})
+
+        # Memory stats
+        memory_usage = memory_stats.get("usage", 0)
+        memory_limit = memory_stats.get("limit", 0)
+        memory_percent = (memory_usage / memory_limit * 100) if memory_limit > 0 else 0
+
+        # Network stats (sum all interfaces)
+        net_rx = sum(net.get("rx_bytes", 0) for net in networks.values())
+        net_tx = sum(net.get("tx_bytes", 0) for net in networks.values())
+
+        # Block I/O stats
+        io_entries = blkio_stats.get("io_service_bytes_recursive") or []
+        blk_read = sum(stat.get("value", 0) for stat in io_entries if stat.get("op") == "read")
+        blk_write = sum(stat.get("value", 0) for stat in io_entries if stat.get("op") == "write")
+
+        return ContainerStats(
+            container_id=container_id,
+            host_id=host_id,
+            cpu_percentage=cpu_percent,
+            memory_usage=memory_usage,
+            memory_limit=memory_limit,
+            memory_percentage=memory_percent,
+            network_rx=net_rx,
+            network_tx=net_tx,
+            block_read=blk_read,
+            block_write=blk_write,
+            pids=pids_stats.get("current", 0),
+        )
+
+    async def _sample_container_stats(
+        self, host_id: str, container: "docker.models.containers.Container"
+    ) -> tuple[dict[str, Any], float]:
+        """Fetch a stats snapshot and compute CPU% without the daemon's sampling wait.
+
+        Uses one-shot stats (no precpu sampling on the engine side) and computes CPU%
+        against the last cpu_stats cached for this container. Falls back to a regular
+        ``stream=False`` snapshot when there is no usable cached sample (first call,
+        stale sample) or the engine/SDK does not support one-shot mode.
+        """
+        key = (host_id, container.id)
+        cached = self._cpu_samples.get(key)
+        now = time.monotonic()
+        has_baseline = cached is not None and now - cached[0] <= CPU_SAMPLE_MAX_AGE_SECONDS
+
+        one_shot_raw: dict[str, Any] | None = None
+        if has_baseline and host_id not in self._one_shot_unsupported:
+            try:
+                one_shot_raw = await asyncio.to_thread(
+                    lambda: container.stats(stream=False, one_shot=True)
+                )
+            except (TypeError, docker.errors.InvalidVersion) as e:
+                # Older docker SDK (no one_shot kwarg) or API < 1.41
+                self._one_shot_unsupported.add(host_id)
+                logger.debug("One-shot stats unsupported", host_id=host_id, error=str(e))
+
+        if one_shot_raw is not None and cached is not None:
+            stats_raw = one_shot_raw
+            cpu_stats = stats_raw.get("cpu_stats", {})
+            cpu_percent = self._calculate_cpu_percentage(cpu_stats, cached[1])
+        else:
+            # Docker SDK returns a single snapshot dict when stream=False
+            stats_raw = await asyncio.to_thread(lambda: container.stats(stream=False))
+            cpu_stats = stats_raw.get("cpu_stats", {})
+            cpu_percent = self._calculate_cpu_percentage(
+                cpu_stats, stats_raw.get("precpu_stats", {})
+            )
+
+        self._store_cpu_sample(key, now, cpu_stats)
+        return stats_raw, cpu_percent
+
+    def _store_cpu_sample(
+        self, key: tuple[str, str], timestamp: float, cpu_stats: dict[str, Any]
+    ) -> None:
+        """Cache raw cpu_stats as the baseline for the next CPU% calculation."""
+        if not cpu_stats.get("system_cpu_usage"):
+            # Stopped containers report no system usage; nothing useful to compare against
+            self._cpu_samples.pop(key, None)
+            return
+        self._cpu_samples[key] = (timestamp, cpu_stats)
+        # Drop stale baselines so removed containers don't accumulate
+        cutoff = timestamp - CPU_SAMPLE_MAX_AGE_SECONDS
+        for stale_key in [k for k, (ts, _) in self._cpu_samples.items() if ts < cutoff]:
+            del self._cpu_samples[stale_key]
+
     def _parse_ports_summary(self, ports_str: str) -> list[str]:
         """Parse Docker ports string into simplified format."""
         if not ports_str:
@@ -888,12 +1088,21 @@ class ContainerTools:
                 }
             )
 
-    async def pull_image(self, host_id: str, image_name: str) -> dict[str, Any]:
+    async def pull_image(
+        self,
+        host_id: str,
+        image_name: str,
+        on_progress: ProgressCallback | None = None,
+    ) -> dict[str, Any]:
         """Pull a Docker image on a remote host.
 
+        A pull of the same image already running on the host is joined rather
+        than started again.
+
         Args:
             host_id: ID of the Docker host
             image_name: Name of the Docker image to pull (e.g., nginx:latest, ubuntu:20.04)
+            on_progress: Awaited with layer progress events (bytes and percentage)
 
         Returns:
             Operation result
@@ -904,53 +1113,116 @@ class ContainerTools:
                 return self._build_error_response(
                     host_id, "pull_image", f"Could not connect to Docker on host {host_id}"
                 )
-
-            # Pull image using Docker SDK
-            image = await asyncio.to_thread(client.images.pull, image_name)
-
-            logger.info(
-                "Image pull completed",
-                host_id=host_id,
-                image_name=image_name,
-                image_id=image.id[:12],
-            )
-
-            return create_success_response(
-                message=f"Successfully pulled image {image_name}",
-                data={
-                    "image_name": image_name,
-                    "image_id": image.id[:12],
-                    "host_id": host_id,
-                },
-                context={"host_id": host_id, "operation": "pull_image"},
-            )
-
-        except docker.errors.ImageNotFound:
-            logger.error("Image not found", host_id=host_id, image_name=image_name)
-            return self._build_error_response(
-                host_id, "pull_image", f"Image {image_name} not found"
-            )
-        except docker.errors.APIError as e:
+        except (DockerCommandError, DockerContextError) as e:
             logger.error(
-                "Docker API error pulling image",
+                "Failed to pull image",
                 host_id=host_id,
                 image_name=image_name,
                 error=str(e),
             )
             return self._build_error_response(
-                host_id, "pull_image", f"Failed to pull image: {str(e)}"
+                host_id, "pull_image", f"Failed to pull image {image_name}: {str(e)}"
             )
+
+        result = await pull_image(host_id, client, image_name, on_progress=on_progress)
+        return self._pull_response(host_id, image_name, result)
+
+    async def pull_images(
+        self,
+        host_id: str,
+        image_names: list[str],
+        on_progress: ProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        """Pull several images on a host concurrently (bounded per host).
+
+        Args:
+            host_id: ID of the Docker host
+            image_names: Image references to pull
+            on_progress: Awaited with layer progress events from every pull
+
+        Returns:
+            Operation result with one entry per image and a summary
+        """
+        try:
+            client = await self.context_manager.get_client(host_id)
+            if client is None:
+                return self._build_error_response(
+                    host_id, "pull_images", f"Could not connect to Docker on host {host_id}"
+                )
         except (DockerCommandError, DockerContextError) as e:
-            logger.error(
-                "Failed to pull image",
-                host_id=host_id,
-                image_name=image_name,
-                error=str(e),
+            return self._build_error_response(
+                host_id, "pull_images", f"Failed to pull images: {str(e)}"
+            )
+
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(
+                pull_image(host_id, client, image_name, on_progress=on_progress)
+                for image_name in dict.fromkeys(image_names)
             )
+        )
+        summary = {
+            status: sum(1 for result in results if result["status"] == status)
+            for status in ("pulled", "up_to_date", "failed")
+        }
+        summary["bytes_downloaded"] = sum(result["bytes_downloaded"] for result in results)
+        summary["duration_seconds"] = round(time.monotonic() - started, 2)
+
+        logger.info("Multi-image pull completed", host_id=host_id, images=len(results), **summary)
+
+        if summary["failed"] == len(results):
+            response = self._build_error_response(
+                host_id, "pull_images", f"Failed to pull all {len(results)} images"
+            )
+            response["data"] = {"host_id": host_id, "images": list(results), **summary}
+            return response
+        return create_success_response(
+            message=(
+                f"Pulled {summary['pulled']}, up to date {summary['up_to_date']}, "
+                f"failed {summary['failed']} of {len(results)} images"
+            ),
+            data={"host_id": host_id, "images": list(results), **summary},
+            context={"host_id": host_id, "operation": "pull_images"},
+        )
+
+    def _pull_response(
+        self, host_id: str, image_name: str, result: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Convert a core pull result into the tool's success or error response."""
+        if result["status"] == "failed":
             return self._build_error_response(
-                host_id, "pull_image", f"Failed to pull image {image_name}: {str(e)}"
+                host_id, "pull_image", f"Failed to pull image {image_name}: {result['error']}"
             )
 
+        logger.info(
+            "Image pull completed",
+            host_id=host_id,
+            image_name=image_name,
+            status=result["status"],
+            joined=result["joined"],
+            bytes_downloaded=result["bytes_downloaded"],
+            duration_seconds=result["duration_seconds"],
+        )
+        return create_success_response(
+            message=(
+                f"Image {image_name} is already up to date"
+                if result["status"] == "up_to_date"
+                else f"Successfully pulled image {image_name}"
+            ),
+            data={
+                "image_name": image_name,
+                "image_id": (result.get("image_id") or "")[:12],
+                "host_id": host_id,
+                "status": result["status"],
+                "digest": result.get("digest", ""),
+                "layers": result.get("layers", 0),
+                "bytes_downloaded": result["bytes_downloaded"],
+                "duration_seconds": result["duration_seconds"],
+                "joined": result["joined"],
+            },
+            context={"host_id": host_id, "operation": "pull_image"},
+        )
+
     def _build_container_command(
         self, action: str, container_id: str, force: bool, timeout: int
     ) -> str:
@@ -1,14 +1,27 @@
 """Log streaming MCP tools."""
 
 import asyncio
+import codecs
+import contextlib
+import heapq
+import itertools
+import multiprocessing
+import os
 import re
+import threading
+import time
 import uuid
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import UTC, datetime
 from typing import Any
 
 import docker
 import structlog
 
+from ..constants import DOCKER_COMPOSE_PROJECT, DOCKER_COMPOSE_SERVICE
 from ..core.config_loader import DockerMCPConfig
 from ..core.docker_context import DockerContextManager
 from ..core.error_response import DockerMCPErrorResponse, create_success_response
@@ -17,6 +30,442 @@ from ..models.container import ContainerLogs, LogStreamRequest
 
 logger = structlog.get_logger()
 
+# Follow-mode streaming limits
+LOG_STREAM_QUEUE_SIZE = int(os.getenv("LOG_STREAM_QUEUE_SIZE", "256"))
+LOG_STREAM_IDLE_TIMEOUT = float(os.getenv("LOG_STREAM_IDLE_TIMEOUT", "300"))
+LOG_STREAM_MAX_PER_HOST = int(os.getenv("LOG_STREAM_MAX_PER_HOST", "4"))
+# Registered streams that are never connected to expire after this many seconds
+LOG_STREAM_CLAIM_TTL = 60.0
+
+# Sentinel pushed by the producer thread when the Docker log stream ends
+_STREAM_END = object()
+
+# Global byte budget for merged multi-container log output
+AGGREGATED_LOGS_MAX_BYTES = 1024 * 1024
+
+# Default byte budget for a single container's logs, and the longest line kept
+# before it is clipped (multi-KB JSON lines would otherwise dominate the budget)
+CONTAINER_LOGS_MAX_BYTES = int(os.getenv("CONTAINER_LOGS_MAX_BYTES", str(4 * 1024 * 1024)))
+LOG_LINE_MAX_BYTES = int(os.getenv("LOG_LINE_MAX_BYTES", "16384"))
+
+# Payloads at or above either threshold are sanitized in chunks on a process
+# pool so the event loop keeps serving other requests; smaller ones stay inline
+# where IPC would cost more than it saves (0 workers disables the pool)
+SANITIZE_POOL_MIN_LINES = int(os.getenv("SANITIZE_POOL_MIN_LINES", "5000"))
+SANITIZE_POOL_MIN_BYTES = int(os.getenv("SANITIZE_POOL_MIN_BYTES", str(2 * 1024 * 1024)))
+SANITIZE_POOL_CHUNK_LINES = 2500
+SANITIZE_POOL_WORKERS = int(
+    os.getenv("SANITIZE_POOL_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+# Memory bound for cached, sanitized container log tails (0 disables the cache)
+LOG_TAIL_CACHE_MAX_BYTES = int(os.getenv("LOG_TAIL_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Filtered log retrieval: lines scanned from the tail when no `since` is given,
+# and the hard cap on lines scanned when reading forward from `since`
+LOG_FILTER_SCAN_LINES = 10000
+LOG_FILTER_MAX_SCAN = 100000
+
+# Severity ranks for the `level` filter (a line matches at or above the rank)
+_LOG_LEVEL_RANKS = {
+    "trace": 0,
+    "debug": 1,
+    "info": 2,
+    "notice": 2,
+    "warn": 3,
+    "warning": 3,
+    "err": 4,
+    "error": 4,
+    "crit": 5,
+    "critical": 5,
+    "fatal": 5,
+    "panic": 5,
+}
+_LOG_LEVEL_TOKEN = re.compile(
+    r"\b(trace|debug|info|notice|warn(?:ing)?|err(?:or)?|crit(?:ical)?|fatal|panic)\b",
+    re.IGNORECASE,
+)
+
+# Leading RFC3339 timestamp added by `docker logs --timestamps`
+_LOG_TIMESTAMP = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?(Z|[+-]\d{2}:\d{2})?\s"
+)
+
+
+def _timestamp_key(match: re.Match[str]) -> str:
+    """Sortable key for a log timestamp (fractional seconds padded to nanoseconds)."""
+    return f"{match.group(1)}.{(match.group(2) or '').ljust(9, '0')}"
+
+
+# Sanitization rules are compiled once at import and shared by every LogTools
+# instance (including those recreated on configuration reload). Each rule's
+# prefilter is a cheap necessary condition for its pattern to match, so lines
+# that cannot contain a secret skip the regex entirely.
+_DIGIT_RUN = re.compile(r"\d{4}")
+
+_SANITIZATION_RULES: tuple[dict[str, Any], ...] = (
+    # API Keys and tokens
+    {
+        "pattern": re.compile(r'\b[Aa]pi[_-]?[Kk]ey["\s]*[:=]["\s]*([a-zA-Z0-9\-_]{16,})', re.IGNORECASE),
+        "replacement": r'api_key="[REDACTED_API_KEY]"',
+        "description": "API keys",
+        "prefilter": lambda line, lowered: "api" in lowered,
+    },
+    {
+        "pattern": re.compile(r'\b[Tt]oken["\s]*[:=]["\s]*([a-zA-Z0-9\-_\.]{20,})', re.IGNORECASE),
+        "replacement": r'token="[REDACTED_TOKEN]"',
+        "description": "Authentication tokens",
+        "prefilter": lambda line, lowered: "token" in lowered,
+    },
+    {
+        "pattern": re.compile(r'\b[Bb]earer\s+([a-zA-Z0-9\-_\.]{20,})', re.IGNORECASE),
+        "replacement": r'Bearer [REDACTED_BEARER_TOKEN]',
+        "description": "Bearer tokens",
+        "prefilter": lambda line, lowered: "bearer" in lowered,
+    },
+    # Password patterns
+    {
+        "pattern": re.compile(r'\b[Pp]assword["\s]*[:=]["\s]*([^\s"\']{6,})', re.IGNORECASE),
+        "replacement": r'password="[REDACTED_PASSWORD]"',
+        "description": "Passwords",
+        "prefilter": lambda line, lowered: "password" in lowered,
+    },
+    {
+        "pattern": re.compile(r'\b[Pp]asswd["\s]*[:=]["\s]*([^\s"\']{6,})', re.IGNORECASE),
+        "replacement": r'passwd="[REDACTED_PASSWORD]"',
+        "description": "Password abbreviations",
+        "prefilter": lambda line, lowered: "passwd" in lowered,
+    },
+    # Secret patterns
+    {
+        "pattern": re.compile(r'\b[Ss]ecret["\s]*[:=]["\s]*([^\s"\']{8,})', re.IGNORECASE),
+        "replacement": r'secret="[REDACTED_SECRET]"',
+        "description": "Secrets",
+        "prefilter": lambda line, lowered: "secret" in lowered,
+    },
+    # Database connection strings
+    {
+        "pattern": re.compile(r'([a-zA-Z]+://[^:]+:)([^@]+)(@[^\s]+)', re.IGNORECASE),
+        "replacement": r'\1[REDACTED_DB_PASSWORD]\3',
+        "description": "Database connection strings",
+        "prefilter": lambda line, lowered: "://" in line and "@" in line,
+    },
+    # Private keys (basic detection)
+    {
+        "pattern": re.compile(r'-----BEGIN\s+(?:RSA\s+)?PRIVATE\s+KEY-----.*?-----END\s+(?:RSA\s+)?PRIVATE\s+KEY-----', re.DOTALL | re.IGNORECASE),
+        "replacement": '[REDACTED_PRIVATE_KEY]',
+        "description": "Private keys",
+        "prefilter": lambda line, lowered: "-----" in line,
+    },
+    # AWS/Cloud credentials
+    {
+        "pattern": re.compile(r'\bAKIA[0-9A-Z]{16}\b', re.IGNORECASE),
+        "replacement": '[REDACTED_AWS_ACCESS_KEY]',
+        "description": "AWS access keys",
+        "prefilter": lambda line, lowered: "akia" in lowered,
+    },
+    {
+        "pattern": re.compile(r'\b[0-9a-zA-Z/+]{40}\b'),
+        "replacement": '[REDACTED_AWS_SECRET_KEY]',
+        "description": "AWS secret keys",
+        "prefilter": lambda line, lowered: len(line) >= 40,
+    },
+    # Personal information patterns (basic)
+    {
+        "pattern": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+        "replacement": '[REDACTED_EMAIL]',
+        "description": "Email addresses",
+        "prefilter": lambda line, lowered: "@" in line,
+    },
+    # Credit card numbers (basic detection)
+    {
+        "pattern": re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b'),
+        "replacement": '[REDACTED_CARD_NUMBER]',
+        "description": "Credit card numbers",
+        "prefilter": lambda line, lowered: _DIGIT_RUN.search(line) is not None,
+    },
+    # JWT tokens
+    {
+        "pattern": re.compile(r'\beyJ[a-zA-Z0-9\-_\.]{20,}\b'),
+        "replacement": '[REDACTED_JWT_TOKEN]',
+        "description": "JWT tokens",
+        "prefilter": lambda line, lowered: "eyJ" in line,
+    }
+)
+
+
+def sanitize_log_lines(log_content: list[str]) -> tuple[list[str], dict[str, int], int]:
+    """Redact sensitive values from log lines in a single pass per line.
+
+    Rules are applied in order, exactly as sequential ``pattern.sub`` calls would,
+    but only when their prefilter passes, and ``subn`` yields the redaction count
+    from the same scan. Prefilters compare against a lowercased copy, which is
+    only exact for ASCII, so non-ASCII lines run every rule.
+
+    Args:
+        log_content: Log lines to sanitize
+
+    Returns:
+        Tuple of (sanitized lines, redaction counts by rule description, modified line count)
+    """
+    sanitized_logs: list[str] = []
+    redactions: dict[str, int] = {}
+    modified_lines = 0
+
+    for line in log_content:
+        if not line or not isinstance(line, str):
+            sanitized_logs.append(line)
+            continue
+
+        sanitized_line = line
+        substituted = False
+        filtered = line.isascii()
+        lowered = line.lower() if filtered else ""
+
+        for rule in _SANITIZATION_RULES:
+            if filtered and not rule["prefilter"](sanitized_line, lowered):
+                continue
+            sanitized_line, count = rule["pattern"].subn(rule["replacement"], sanitized_line)
+            if count:
+                substituted = True
+                redactions[rule["description"]] = redactions.get(rule["description"], 0) + count
+                if filtered:
+                    lowered = sanitized_line.lower()
+
+        if substituted and sanitized_line != line:
+            modified_lines += 1
+        sanitized_logs.append(sanitized_line)
+
+    return sanitized_logs, redactions, modified_lines
+
+
+class _SanitizePool:
+    """Lazily created process pool shared by every LogTools instance."""
+
+    def __init__(self) -> None:
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> ProcessPoolExecutor | None:
+        """Return the pool, creating it on first use.
+
+        Workers are spawned rather than forked: forking a process that is running an
+        event loop and SDK threads can deadlock the child.
+        """
+        if SANITIZE_POOL_WORKERS < 1:
+            return None
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=SANITIZE_POOL_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def discard(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool so the next large payload starts a fresh one."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+_sanitize_pool = _SanitizePool()
+
+
+# Variable tokens masked when grouping log lines into templates, as one
+# alternation so each line is scanned once. Order matters: earlier
+# alternatives win (a UUID must not be consumed as hex runs and numbers).
+_TEMPLATE_TOKENS = re.compile(
+    r"(?P<TS>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+    r"|\b\d{2}:\d{2}:\d{2}(?:[.,]\d+)?\b)"
+    r"|(?P<UUID>\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b)"
+    r"|(?P<IP>\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b)"
+    r"|(?P<HEX>\b(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{8,}\b)"
+    r"|(?P<NUM>\d+(?:\.\d+)?)"
+)
+
+# Templates beyond this many are folded into an "other" count
+LOG_SUMMARY_MAX_TEMPLATES = 50
+LOG_SUMMARY_EXEMPLAR_CHARS = 300
+
+
+def _mask_template_token(match: re.Match[str]) -> str:
+    return f"<{match.lastgroup}>"
+
+
+def summarize_log_lines(
+    log_lines: list[str], max_templates: int = LOG_SUMMARY_MAX_TEMPLATES
+) -> dict[str, Any]:
+    """Group log lines by normalized template in a single pass.
+
+    Timestamps, UUIDs, IPs, hex IDs and numbers are masked to form the template.
+    Lines may carry a Docker timestamp, optionally behind a ``source | `` prefix
+    as produced by aggregated logs; that timestamp is used for first/last
+    occurrence, falling back to line numbers when absent.
+
+    Args:
+        log_lines: Log lines (already sanitized)
+        max_templates: Maximum number of templates to return, most frequent first
+
+    Returns:
+        Summary with templates (count, first/last occurrence, exemplar) and totals
+    """
+    groups: dict[str, dict[str, Any]] = {}
+
+    for index, line in enumerate(log_lines, start=1):
+        source = ""
+        message = line
+        separator = line.find(" | ")
+        if separator > 0 and " " not in line[:separator]:
+            source, message = line[: separator + 3], line[separator + 3 :]
+
+        seen: str | int = index
+        if match := _LOG_TIMESTAMP.match(message):
+            seen = match.group(0).rstrip()
+            message = message[match.end() :]
+
+        template = source + _TEMPLATE_TOKENS.sub(_mask_template_token, message.rstrip())
+        group = groups.get(template)
+        if group is None:
+            groups[template] = {
+                "template": template,
+                "count": 1,
+                "first_seen": seen,
+                "last_seen": seen,
+                "exemplar": line[:LOG_SUMMARY_EXEMPLAR_CHARS],
+            }
+        else:
+            group["count"] += 1
+            group["last_seen"] = seen
+
+    ranked = sorted(groups.values(), key=lambda group: group["count"], reverse=True)
+    shown = ranked[:max_templates]
+    return {
+        "lines_total": len(log_lines),
+        "templates_total": len(ranked),
+        "templates": shown,
+        "other_lines": sum(group["count"] for group in ranked[max_templates:]),
+    }
+
+
+class _LogStreamReader:
+    """Line splitting and budget bookkeeping behind ``LogTools._read_log_stream``."""
+
+    def __init__(
+        self,
+        max_lines: int,
+        max_bytes: int,
+        line_filter: Callable[[str], bool] | None,
+        stop_at_limit: bool,
+        timestamps: bool,
+    ) -> None:
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.line_filter = line_filter
+        self.stop_at_limit = stop_at_limit
+        self.timestamps = timestamps
+        self.kept: deque[tuple[str, int]] = deque()
+        self.stats: dict[str, Any] = {
+            "lines_scanned": 0,
+            "lines_matched": 0,
+            "lines_dropped": 0,
+            "lines_clipped": 0,
+            "bytes_read": 0,
+            "bytes_returned": 0,
+            "truncated_by": None,
+            "complete": True,
+        }
+        self.buffer = bytearray()
+        self.overflow = 0
+
+    def lines(self) -> list[str]:
+        return [line for line, _ in self.kept]
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume a chunk; return False (and mark the read incomplete) to stop reading."""
+        self.stats["bytes_read"] += len(chunk)
+        *complete_lines, tail = chunk.split(b"\n")
+        for piece in complete_lines:
+            self._absorb(piece)
+            if not self._emit():
+                self.stats["complete"] = False
+                return False
+        self._absorb(tail)
+        return True
+
+    def finish(self) -> None:
+        """Emit a trailing line that had no newline."""
+        if (self.buffer or self.overflow) and not self._emit():
+            self.stats["complete"] = False
+
+    def _absorb(self, piece: bytes) -> None:
+        """Append to the current line, discarding bytes past the line limit."""
+        room = LOG_LINE_MAX_BYTES - len(self.buffer)
+        if len(piece) <= room:
+            self.buffer.extend(piece)
+        else:
+            self.buffer.extend(piece[: max(room, 0)])
+            self.overflow += len(piece) - max(room, 0)
+
+    def _decode(self) -> tuple[str, int]:
+        """Decode and clear the buffered line; return it with its byte size."""
+        raw = bytes(self.buffer)
+        self.buffer.clear()
+        clipped, self.overflow = self.overflow, 0
+        self.stats["lines_scanned"] += 1
+
+        if clipped:
+            # Drop a multi-byte character cut in half by the clip
+            line = raw.decode("utf-8", errors="ignore")
+            line += f" …[{clipped} bytes truncated]"
+            self.stats["lines_clipped"] += 1
+            return line, len(line.encode("utf-8")) + 1
+        return raw.decode("utf-8", errors="replace"), len(raw) + 1
+
+    def _matches(self, line: str) -> bool:
+        if self.line_filter is None:
+            return True
+        message = line
+        if self.timestamps and (ts := _LOG_TIMESTAMP.match(line)):
+            message = line[ts.end() :]
+        return self.line_filter(message)
+
+    def _emit(self) -> bool:
+        """Consume the buffered line; return False once reading should stop."""
+        line, size = self._decode()
+        if not self._matches(line):
+            return self._within_scan_limit()
+        self.stats["lines_matched"] += 1
+
+        if self.stop_at_limit:
+            if self.stats["bytes_returned"] + size > self.max_bytes:
+                self.stats["truncated_by"] = "bytes"
+                return False
+            self.kept.append((line, size))
+            self.stats["bytes_returned"] += size
+            if len(self.kept) >= self.max_lines:
+                self.stats["truncated_by"] = "lines"
+                return False
+            return self._within_scan_limit()
+
+        self.kept.append((line, size))
+        self.stats["bytes_returned"] += size
+        while len(self.kept) > self.max_lines or self.stats["bytes_returned"] > self.max_bytes:
+            reason = "lines" if len(self.kept) > self.max_lines else "bytes"
+            _, dropped_size = self.kept.popleft()
+            self.stats["bytes_returned"] -= dropped_size
+            self.stats["lines_dropped"] += 1
+            self.stats["truncated_by"] = reason
+        return self._within_scan_limit()
+
+    def _within_scan_limit(self) -> bool:
+        """Check the cap on lines scanned for a filter (unfiltered reads are tail-bounded)."""
+        if self.line_filter is not None and self.stats["lines_scanned"] >= LOG_FILTER_MAX_SCAN:
+            self.stats["truncated_by"] = "scan_limit"
+            return False
+        return True
+
 
 class LogTools:
     """Log management tools for MCP."""
@@ -25,85 +474,18 @@ class LogTools:
         self.config = config
         self.context_manager = context_manager
         self._init_log_sanitization_patterns()
+        # stream_id -> (registration time, config) for streams awaiting a client
+        self._pending_streams: dict[str, tuple[float, LogStreamRequest]] = {}
+        # host_id -> number of streams currently being served
+        self._active_streams: dict[str, int] = {}
+        # (host_id, full container id) -> cached sanitized tail, least recently used first
+        self._tail_cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._tail_cache_bytes = 0
+        self._tail_cache_locks: dict[tuple[str, str], asyncio.Lock] = {}
 
     def _init_log_sanitization_patterns(self) -> None:
-        """Initialize regex patterns for sanitizing sensitive information from logs."""
-        self.sanitization_patterns = [
-            # API Keys and tokens
-            {
-                "pattern": re.compile(r'\b[Aa]pi[_-]?[Kk]ey["\s]*[:=]["\s]*([a-zA-Z0-9\-_]{16,})', re.IGNORECASE),
-                "replacement": r'api_key="[REDACTED_API_KEY]"',
-                "description": "API keys"
-            },
-            {
-                "pattern": re.compile(r'\b[Tt]oken["\s]*[:=]["\s]*([a-zA-Z0-9\-_\.]{20,})', re.IGNORECASE),
-                "replacement": r'token="[REDACTED_TOKEN]"',
-                "description": "Authentication tokens"
-            },
-            {
-                "pattern": re.compile(r'\b[Bb]earer\s+([a-zA-Z0-9\-_\.]{20,})', re.IGNORECASE),
-                "replacement": r'Bearer [REDACTED_BEARER_TOKEN]',
-                "description": "Bearer tokens"
-            },
-            # Password patterns
-            {
-                "pattern": re.compile(r'\b[Pp]assword["\s]*[:=]["\s]*([^\s"\']{6,})', re.IGNORECASE),
-                "replacement": r'password="[REDACTED_PASSWORD]"',
-                "description": "Passwords"
-            },
-            {
-                "pattern": re.compile(r'\b[Pp]asswd["\s]*[:=]["\s]*([^\s"\']{6,})', re.IGNORECASE),
-                "replacement": r'passwd="[REDACTED_PASSWORD]"',
-                "description": "Password abbreviations"
-            },
-            # Secret patterns
-            {
-                "pattern": re.compile(r'\b[Ss]ecret["\s]*[:=]["\s]*([^\s"\']{8,})', re.IGNORECASE),
-                "replacement": r'secret="[REDACTED_SECRET]"',
-                "description": "Secrets"
-            },
-            # Database connection strings
-            {
-                "pattern": re.compile(r'([a-zA-Z]+://[^:]+:)([^@]+)(@[^\s]+)', re.IGNORECASE),
-                "replacement": r'\1[REDACTED_DB_PASSWORD]\3',
-                "description": "Database connection strings"
-            },
-            # Private keys (basic detection)
-            {
-                "pattern": re.compile(r'-----BEGIN\s+(?:RSA\s+)?PRIVATE\s+KEY-----.*?-----END\s+(?:RSA\s+)?PRIVATE\s+KEY-----', re.DOTALL | re.IGNORECASE),
-                "replacement": '[REDACTED_PRIVATE_KEY]',
-                "description": "Private keys"
-            },
-            # AWS/Cloud credentials
-            {
-                "pattern": re.compile(r'\bAKIA[0-9A-Z]{16}\b', re.IGNORECASE),
-                "replacement": '[REDACTED_AWS_ACCESS_KEY]',
-                "description": "AWS access keys"
-            },
-            {
-                "pattern": re.compile(r'\b[0-9a-zA-Z/+]{40}\b'),
-                "replacement": '[REDACTED_AWS_SECRET_KEY]',
-                "description": "AWS secret keys"
-            },
-            # Personal information patterns (basic)
-            {
-                "pattern": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-                "replacement": '[REDACTED_EMAIL]',
-                "description": "Email addresses"
-            },
-            # Credit card numbers (basic detection)
-            {
-                "pattern": re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b'),
-                "replacement": '[REDACTED_CARD_NUMBER]',
-                "description": "Credit card numbers"
-            },
-            # JWT tokens
-            {
-                "pattern": re.compile(r'\beyJ[a-zA-Z0-9\-_\.]{20,}\b'),
-                "replacement": '[REDACTED_JWT_TOKEN]',
-                "description": "JWT tokens"
-            }
-        ]
+        """Expose the shared, pre-compiled sanitization rules on this instance."""
+        self.sanitization_patterns = _SANITIZATION_RULES
 
     def _sanitize_log_content(self, log_content: list[str]) -> list[str]:
         """Sanitize log content to remove sensitive information.
@@ -117,56 +499,67 @@ class LogTools:
         if not log_content:
             return log_content
 
-        sanitized_logs: list[str] = []
-        redaction_count = 0
+        sanitized_logs, redactions, modified_lines = sanitize_log_lines(log_content)
+        self._log_redactions(redactions, len(log_content), modified_lines)
+        return sanitized_logs
 
-        for line in log_content:
-            if not line or not isinstance(line, str):
-                sanitized_logs.append(line)
-                continue
+    async def _sanitize_log_content_async(self, log_content: list[str]) -> list[str]:
+        """Sanitize log content, offloading large payloads to the process pool.
 
-            sanitized_line = line
-            line_redactions = []
-
-            # Apply each sanitization pattern
-            for pattern_info in self.sanitization_patterns:
-                pattern = pattern_info["pattern"]
-                replacement = pattern_info["replacement"]
-                description = pattern_info["description"]
-
-                # Count matches before replacement
-                matches = pattern.findall(sanitized_line)
-                if matches:
-                    line_redactions.append(f"{len(matches)} {description}")
-                    redaction_count += len(matches)
-
-                # Apply sanitization
-                sanitized_line = pattern.sub(replacement, sanitized_line)
-
-            sanitized_logs.append(sanitized_line)
-
-            # Log redaction details (without the actual sensitive data)
-            if line_redactions:
-                logger.debug(
-                    "Log line sanitized",
-                    redactions=line_redactions,
-                    original_length=len(line),
-                    sanitized_length=len(sanitized_line)
-                )
+        Large payloads are split into SANITIZE_POOL_CHUNK_LINES chunks that are
+        sanitized in parallel; ``gather`` returns results in submission order, so
+        the reassembled lines keep their original order. Falls back to a worker
+        thread if the pool is disabled or breaks.
+        """
+        if (
+            len(log_content) < SANITIZE_POOL_MIN_LINES
+            and sum(map(len, log_content)) < SANITIZE_POOL_MIN_BYTES
+        ):
+            return self._sanitize_log_content(log_content)
+
+        pool = _sanitize_pool.get()
+        if pool is None:
+            return await asyncio.to_thread(self._sanitize_log_content, log_content)
+
+        loop = asyncio.get_running_loop()
+        chunks = [
+            log_content[start : start + SANITIZE_POOL_CHUNK_LINES]
+            for start in range(0, len(log_content), SANITIZE_POOL_CHUNK_LINES)
+        ]
+        try:
+            results = await asyncio.gather(
+                *(loop.run_in_executor(pool, sanitize_log_lines, chunk) for chunk in chunks)
+            )
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning("Sanitization pool failed, sanitizing in a thread", error=str(e))
+            _sanitize_pool.discard(pool)
+            return await asyncio.to_thread(self._sanitize_log_content, log_content)
 
-        if redaction_count > 0:
-            # Count lines that were actually modified
-            modified_lines = sum(1 for i, (original, sanitized) in enumerate(zip(log_content, sanitized_logs, strict=False)) if original != sanitized)
+        sanitized_logs: list[str] = []
+        redactions: dict[str, int] = {}
+        modified_lines = 0
+        for chunk_lines, chunk_redactions, chunk_modified in results:
+            sanitized_logs.extend(chunk_lines)
+            for description, count in chunk_redactions.items():
+                redactions[description] = redactions.get(description, 0) + count
+            modified_lines += chunk_modified
+
+        self._log_redactions(redactions, len(log_content), modified_lines)
+        return sanitized_logs
 
+    def _log_redactions(
+        self, redactions: dict[str, int], total_lines: int, modified_lines: int
+    ) -> None:
+        """Log redaction details (without the actual sensitive data)."""
+        if redactions:
             logger.info(
                 "Log content sanitized",
-                total_redactions=redaction_count,
-                total_lines=len(log_content),
-                modified_lines=modified_lines
+                total_redactions=sum(redactions.values()),
+                redactions=redactions,
+                total_lines=total_lines,
+                modified_lines=modified_lines,
             )
 
-        return sanitized_logs
-
     def _build_error_response(
         self,
         host_id: str,
@@ -215,6 +608,88 @@ class LogTools:
         else:
             return DockerMCPErrorResponse.generic_error(error_message, base_context)
 
+    async def _read_cached_tail(
+        self,
+        host_id: str,
+        container: Any,
+        container_id: str,
+        lines: int,
+        since: str | None,
+        max_bytes: int,
+        timestamps: bool,
+    ) -> tuple[list[str], dict[str, Any], str] | None:
+        """Serve a plain tail request from the tail cache, fetching only new lines.
+
+        Returns None when the request is not cacheable or the refresh fails (the
+        entry is dropped then).
+        """
+        if since is not None or LOG_TAIL_CACHE_MAX_BYTES <= 0:
+            return None
+        try:
+            return await self._get_cached_tail(host_id, container, lines, max_bytes, timestamps)
+        except Exception as cache_error:
+            logger.warning(
+                "Log tail cache refresh failed, reading logs directly",
+                error=str(cache_error),
+                host_id=host_id,
+                container_id=container_id,
+            )
+            self.invalidate_log_tail(host_id, container.id)
+            return None
+
+    async def _read_container_logs(
+        self,
+        host_id: str,
+        container: Any,
+        container_id: str,
+        lines: int,
+        since: str | None,
+        timestamps: bool,
+        max_bytes: int,
+    ) -> tuple[list[str], dict[str, Any]]:
+        """Read unsanitized log lines from the SDK stream, falling back to ``docker logs``."""
+        logs_kwargs: dict[str, Any] = {
+            "stream": True,
+            "follow": False,
+            "tail": lines,
+            "timestamps": timestamps,
+        }
+        if since:
+            logs_kwargs["since"] = self._parse_since(since)
+
+        read_stats: dict[str, Any] = {}
+        logs_data: list[str] = []
+        # Stream logs from the Docker SDK within the byte budget
+        try:
+            log_stream = await asyncio.to_thread(container.logs, **logs_kwargs)
+            logs_data, read_stats = await asyncio.to_thread(
+                self._read_log_stream, log_stream, lines, max_bytes
+            )
+        except Exception as sdk_error:
+            logger.warning(
+                "Docker SDK logs failed, will use fallback",
+                error=str(sdk_error),
+                host_id=host_id,
+                container_id=container_id,
+            )
+            logs_data = []
+
+        if logs_data and (len(logs_data) != 1 or logs_data[0]):
+            return logs_data, read_stats
+
+        # Fallback: If no logs from SDK, try direct docker command
+        logger.debug(
+            "No logs from Docker SDK, trying direct command",
+            host_id=host_id,
+            container_id=container_id,
+        )
+        logs_cmd = f"logs --tail {lines} {container_id}"
+        cmd_result = await self.context_manager.execute_docker_command(host_id, logs_cmd)
+        logs_str = cmd_result["output"].strip() if cmd_result and "output" in cmd_result else ""
+        if logs_str:
+            return self._read_log_stream([logs_str.encode("utf-8")], lines, max_bytes)
+        return logs_data, read_stats
+
     async def get_container_logs(
         self,
         host_id: str,
@@ -222,19 +697,38 @@ class LogTools:
         lines: int = 100,
         since: str | None = None,
         timestamps: bool = False,
+        grep: str | None = None,
+        level: str | None = None,
+        regex: str | None = None,
+        max_bytes: int | None = None,
     ) -> dict[str, Any]:
         """Get logs from a container.
 
+        Logs are streamed from the daemon and decoded line by line, so memory stays
+        bounded by ``max_bytes`` regardless of how large the requested tail is.
+
         Args:
             host_id: ID of the Docker host
             container_id: Container ID or name
             lines: Number of lines to retrieve (default: 100)
             since: Only logs since this timestamp (e.g., '2023-01-01T00:00:00Z')
             timestamps: Include timestamps in output
+            grep: Only lines containing this text (case-insensitive)
+            level: Only lines at or above this severity (e.g., 'warn', 'error')
+            regex: Only lines matching this regular expression
+            max_bytes: Byte budget for returned lines (default: CONTAINER_LOGS_MAX_BYTES)
 
         Returns:
             Container logs
         """
+        max_bytes = max_bytes or CONTAINER_LOGS_MAX_BYTES
+        try:
+            line_filter = self._build_line_filter(grep, level, regex)
+        except ValueError as e:
+            return self._build_error_response(
+                host_id, "get_container_logs", str(e), container_id, problem_type="generic"
+            )
+
         try:
             client = await self.context_manager.get_client(host_id)
             if client is None:
@@ -249,49 +743,34 @@ class LogTools:
             # Get container and retrieve logs using Docker SDK
             container = await asyncio.to_thread(client.containers.get, container_id)
 
-            # Build kwargs for logs method
-            logs_kwargs = {
-                "tail": lines,
-                "timestamps": timestamps,
-            }
-            if since:
-                try:
-                    dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
-                    logs_kwargs["since"] = int(dt.timestamp())
-                except Exception:
-                    logs_kwargs["since"] = since  # fallback
-
-            # Get logs using Docker SDK
-            try:
-                logs_bytes = await asyncio.to_thread(container.logs, **logs_kwargs)
-                # Parse logs (logs_bytes is bytes, need to decode)
-                logs_str = logs_bytes.decode("utf-8", errors="replace")
-                logs_data = logs_str.strip().split("\n") if logs_str.strip() else []
-            except Exception as sdk_error:
-                logger.warning(
-                    "Docker SDK logs failed, will use fallback",
-                    error=str(sdk_error),
-                    host_id=host_id,
-                    container_id=container_id
+            if line_filter is not None:
+                return await self._get_filtered_container_logs(
+                    host_id,
+                    container,
+                    container_id,
+                    lines,
+                    since,
+                    timestamps,
+                    line_filter,
+                    {"grep": grep, "level": level, "regex": regex},
+                    max_bytes,
                 )
-                logs_data = []
-
-            # Fallback: If no logs from SDK, try direct docker command
-            if not logs_data or (len(logs_data) == 1 and not logs_data[0]):
-                logger.debug(
-                    "No logs from Docker SDK, trying direct command",
-                    host_id=host_id,
-                    container_id=container_id
+
+            cache_status: str | None = None
+            cached = await self._read_cached_tail(
+                host_id, container, container_id, lines, since, max_bytes, timestamps
+            )
+            if cached is not None:
+                logs_data, read_stats, cache_status = cached
+            else:
+                logs_data, read_stats = await self._read_container_logs(
+                    host_id, container, container_id, lines, since, timestamps, max_bytes
                 )
-                # Try using docker logs command directly via context
-                logs_cmd = f"logs --tail {lines} {container_id}"
-                cmd_result = await self.context_manager.execute_docker_command(host_id, logs_cmd)
-                if cmd_result and "output" in cmd_result:
-                    logs_str = cmd_result["output"]
-                    logs_data = logs_str.strip().split("\n") if logs_str.strip() else []
 
-            # Sanitize logs before returning
-            sanitized_logs = self._sanitize_log_content(logs_data)
+            # Sanitize logs before returning (cached tails are stored sanitized)
+            sanitized_logs = (
+                logs_data if cache_status else await self._sanitize_log_content_async(logs_data)
+            )
 
             # Create logs response
             logs = ContainerLogs(
@@ -299,7 +778,9 @@ class LogTools:
                 host_id=host_id,
                 logs=sanitized_logs,
                 timestamp=datetime.now(UTC),
-                truncated=len(sanitized_logs) >= lines,
+                truncated=read_stats.get("truncated_by") is not None
+                or len(sanitized_logs) >= lines,
+                **self._read_stats_fields(read_stats),
             )
 
             logger.info(
@@ -308,16 +789,17 @@ class LogTools:
                 container_id=container_id,
                 lines_returned=len(sanitized_logs),
                 sanitization_applied=len(sanitized_logs) != len(logs_data) or any(s != o for s, o in zip(sanitized_logs, logs_data, strict=False)),
+                tail_cache=cache_status,
             )
 
-            return create_success_response(
-                data=logs.model_dump(),
-                context={
-                    "host_id": host_id,
-                    "operation": "get_container_logs",
-                    "container_id": container_id,
-                },
-            )
+            context = {
+                "host_id": host_id,
+                "operation": "get_container_logs",
+                "container_id": container_id,
+            }
+            if cache_status:
+                context["tail_cache"] = cache_status
+            return create_success_response(data=logs.model_dump(), context=context)
 
         except docker.errors.NotFound:
             logger.error("Container not found for logs", host_id=host_id, container_id=container_id)
@@ -344,6 +826,572 @@ class LogTools:
             )
             return self._build_error_response(host_id, "get_container_logs", str(e), container_id)
 
+    def _build_line_filter(
+        self, grep: str | None, level: str | None, regex: str | None
+    ) -> Callable[[str], bool] | None:
+        """Build a predicate combining the grep, level and regex filters (all must match).
+
+        Raises:
+            ValueError: If the level is unknown or the regex does not compile
+        """
+        checks: list[Callable[[str], bool]] = []
+
+        if grep:
+            needle = grep.lower()
+            checks.append(lambda line: needle in line.lower())
+
+        if level:
+            min_rank = _LOG_LEVEL_RANKS.get(level.lower())
+            if min_rank is None:
+                raise ValueError(
+                    f"Invalid level '{level}'. Valid levels: {', '.join(_LOG_LEVEL_RANKS)}"
+                )
+
+            def level_check(line: str) -> bool:
+                match = _LOG_LEVEL_TOKEN.search(line)
+                return match is not None and _LOG_LEVEL_RANKS[match.group(1).lower()] >= min_rank
+
+            checks.append(level_check)
+
+        if regex:
+            try:
+                compiled = re.compile(regex)
+            except re.error as e:
+                raise ValueError(f"Invalid regex '{regex}': {e}") from e
+            checks.append(lambda line: compiled.search(line) is not None)
+
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda line: all(check(line) for check in checks)
+
+    def _read_log_stream(
+        self,
+        log_stream: Iterable[bytes],
+        max_lines: int,
+        max_bytes: int,
+        line_filter: Callable[[str], bool] | None = None,
+        stop_at_limit: bool = False,
+        timestamps: bool = False,
+    ) -> tuple[list[str], dict[str, Any]]:
+        """Read a Docker log stream chunk by chunk within line and byte budgets.
+
+        Blocking; run in a thread. Chunks are split on raw newlines and each line is
+        decoded on its own (a UTF-8 newline byte never occurs inside a multi-byte
+        sequence), so only the current chunk, one partial line and the kept lines are
+        ever held. Lines longer than LOG_LINE_MAX_BYTES are clipped as they arrive.
+
+        With ``stop_at_limit`` the stream is closed at the first ``max_lines`` kept
+        lines or when the next line would exceed ``max_bytes``. Otherwise the newest
+        lines that fit both budgets are kept and older ones are dropped.
+
+        Returns:
+            Tuple of (kept lines, read statistics)
+        """
+        reader = _LogStreamReader(max_lines, max_bytes, line_filter, stop_at_limit, timestamps)
+        try:
+            for chunk in log_stream:
+                if not reader.feed(chunk):
+                    break
+            else:
+                reader.finish()
+            return reader.lines(), reader.stats
+        finally:
+            close = getattr(log_stream, "close", None)
+            if close is not None:
+                with contextlib.suppress(Exception):
+                    close()
+
+    async def _get_filtered_container_logs(
+        self,
+        host_id: str,
+        container: Any,
+        container_id: str,
+        lines: int,
+        since: str | None,
+        timestamps: bool,
+        line_filter: Callable[[str], bool],
+        filters: dict[str, str | None],
+        max_bytes: int,
+    ) -> dict[str, Any]:
+        """Get container logs filtered while streaming from the Docker daemon.
+
+        Without ``since`` the newest ``lines`` matches within the last
+        LOG_FILTER_SCAN_LINES lines are returned. With ``since`` the log is read
+        forward and reading stops as soon as ``lines`` matches are found or the
+        byte budget is spent. Only matching lines are decoded into the result and
+        sanitized.
+        """
+        forward = since is not None
+        logs_kwargs: dict[str, Any] = {
+            "stream": True,
+            "follow": False,
+            "timestamps": timestamps,
+            "tail": "all" if forward else LOG_FILTER_SCAN_LINES,
+        }
+        if since:
+            logs_kwargs["since"] = self._parse_since(since)
+
+        log_stream = await asyncio.to_thread(container.logs, **logs_kwargs)
+        matches, read_stats = await asyncio.to_thread(
+            self._read_log_stream,
+            log_stream,
+            lines,
+            max_bytes,
+            line_filter,
+            forward,
+            timestamps,
+        )
+        sanitized_logs = await self._sanitize_log_content_async(matches)
+        complete = read_stats["complete"]
+
+        logs = ContainerLogs(
+            container_id=container_id,
+            host_id=host_id,
+            logs=sanitized_logs,
+            timestamp=datetime.now(UTC),
+            truncated=not complete or read_stats["truncated_by"] is not None,
+            lines_scanned=read_stats["lines_scanned"],
+            lines_matched=read_stats["lines_matched"],
+            **self._read_stats_fields(read_stats),
+        )
+
+        logger.info(
+            "Retrieved filtered container logs",
+            host_id=host_id,
+            container_id=container_id,
+            lines_scanned=read_stats["lines_scanned"],
+            lines_matched=read_stats["lines_matched"],
+            lines_returned=len(sanitized_logs),
+            bytes_returned=read_stats["bytes_returned"],
+            scan_complete=complete,
+        )
+
+        return create_success_response(
+            data=logs.model_dump(),
+            context={
+                "host_id": host_id,
+                "operation": "get_container_logs",
+                "container_id": container_id,
+                "filters": {k: v for k, v in filters.items() if v},
+                "scan_complete": complete,
+            },
+        )
+
+    def _read_stats_fields(self, read_stats: dict[str, Any]) -> dict[str, Any]:
+        """Map stream reader statistics onto ContainerLogs truncation fields."""
+        return {
+            "bytes_returned": read_stats.get("bytes_returned", 0),
+            "lines_dropped": read_stats.get("lines_dropped", 0),
+            "lines_clipped": read_stats.get("lines_clipped", 0),
+            "truncated_by": read_stats.get("truncated_by"),
+        }
+
+    async def _get_cached_tail(
+        self, host_id: str, container: Any, lines: int, max_bytes: int, timestamps: bool
+    ) -> tuple[list[str], dict[str, Any], str] | None:
+        """Serve a log tail from the cache, fetching only lines newer than its cursor.
+
+        Entries hold sanitized lines with Docker timestamps and are keyed by the full
+        container ID. An entry is dropped when the container's StartedAt changes
+        (i.e. it was restarted) and is rebuilt when a larger tail is requested than
+        it holds. Returns None when there is nothing to cache so the caller falls
+        back to a direct read.
+
+        Returns:
+            Tuple of (lines, read statistics, cache status: hit, refresh or miss)
+        """
+        key = (host_id, container.id)
+        lock = self._tail_cache_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                started_at = (container.attrs.get("State") or {}).get("StartedAt")
+                entry = self._tail_cache.get(key)
+                if entry is not None and entry["started_at"] != started_at:
+                    self.invalidate_log_tail(host_id, container.id)
+                    entry = None
+
+                read_stats: dict[str, Any] = {}
+                if entry is not None and (entry["capacity"] >= lines or entry["complete"]):
+                    status = "hit"
+                    fresh, read_stats = await self._fetch_tail_since_cursor(container, entry)
+                    if fresh:
+                        status = "refresh"
+                        self._append_tail_lines(entry, fresh)
+                    self._tail_cache.move_to_end(key)
+                else:
+                    log_stream = await asyncio.to_thread(
+                        container.logs, stream=True, follow=False, tail=lines, timestamps=True
+                    )
+                    fetched, read_stats = await asyncio.to_thread(
+                        self._read_log_stream, log_stream, lines, LOG_TAIL_CACHE_MAX_BYTES
+                    )
+                    if not fetched:
+                        return None
+                    status = "miss"
+                    if entry is not None:
+                        self._tail_cache_bytes -= entry["bytes"]
+                    entry = {
+                        "name": container.name,
+                        "started_at": started_at,
+                        "capacity": lines,
+                        # Fewer lines than requested means the whole log is cached
+                        "complete": len(fetched) < lines and read_stats["truncated_by"] is None,
+                        "lines": deque(),
+                        "bytes": 0,
+                    }
+                    self._tail_cache[key] = entry
+                    self._tail_cache.move_to_end(key)
+                    self._append_tail_lines(entry, await self._sanitize_log_content_async(fetched))
+
+                selected, stats = self._select_tail_lines(entry, lines, max_bytes, timestamps)
+                stats["lines_clipped"] = read_stats.get("lines_clipped", 0)
+                self._evict_tail_cache()
+                return selected, stats, status
+        finally:
+            # Entries that were never cached or were dropped leave no lock behind
+            if key not in self._tail_cache:
+                self._drop_tail_lock(key)
+
+    async def _fetch_tail_since_cursor(
+        self, container: Any, entry: dict[str, Any]
+    ) -> tuple[list[str], dict[str, Any]]:
+        """Fetch lines logged after the entry's cursor, sanitized.
+
+        Docker's ``since`` has one-second granularity here, so the read starts at
+        the cursor's second and lines already cached (up to and including the
+        cursor timestamp) are skipped.
+        """
+        cursor = entry["cursor"]
+        since = int(datetime.fromisoformat(cursor[:19]).replace(tzinfo=UTC).timestamp())
+        log_stream = await asyncio.to_thread(
+            container.logs, stream=True, follow=False, since=since, timestamps=True
+        )
+        fetched, read_stats = await asyncio.to_thread(
+            self._read_log_stream,
+            log_stream,
+            entry["capacity"] + entry["cursor_second_lines"],
+            LOG_TAIL_CACHE_MAX_BYTES,
+        )
+
+        fresh: list[str] = []
+        skip = entry["cursor_dupes"]
+        for line in fetched:
+            if not fresh and (match := _LOG_TIMESTAMP.match(line)):
+                line_key = _timestamp_key(match)
+                if line_key < cursor:
+                    continue
+                if line_key == cursor and skip:
+                    skip -= 1
+                    continue
+            fresh.append(line)
+        return await self._sanitize_log_content_async(fresh), read_stats
+
+    def _append_tail_lines(self, entry: dict[str, Any], new_lines: list[str]) -> None:
+        """Append sanitized lines to an entry, trim it to capacity and move its cursor."""
+        cached: deque[tuple[str, int]] = entry["lines"]
+        for line in new_lines:
+            size = len(line.encode("utf-8")) + 1
+            cached.append((line, size))
+            entry["bytes"] += size
+            self._tail_cache_bytes += size
+        while len(cached) > entry["capacity"]:
+            _, size = cached.popleft()
+            entry["bytes"] -= size
+            self._tail_cache_bytes -= size
+            entry["complete"] = False
+
+        # Cursor: newest timestamp, how many cached lines share it, and how many
+        # share its second (all of which a since-read will return again)
+        entry.update(cursor="", cursor_dupes=0, cursor_second_lines=0)
+        for line, _ in reversed(cached):
+            match = _LOG_TIMESTAMP.match(line)
+            if match is None:
+                continue
+            line_key = _timestamp_key(match)
+            if not entry["cursor"]:
+                entry["cursor"] = line_key
+            if line_key[:19] != entry["cursor"][:19]:
+                break
+            entry["cursor_second_lines"] += 1
+            if line_key == entry["cursor"]:
+                entry["cursor_dupes"] += 1
+
+    def _select_tail_lines(
+        self, entry: dict[str, Any], lines: int, max_bytes: int, timestamps: bool
+    ) -> tuple[list[str], dict[str, Any]]:
+        """Take the newest cached lines within the line and byte budgets."""
+        cached: deque[tuple[str, int]] = entry["lines"]
+        wanted = min(lines, len(cached))
+        selected: list[str] = []
+        bytes_used = 0
+        for cached_line, cached_size in itertools.islice(reversed(cached), wanted):
+            line, size = cached_line, cached_size
+            if not timestamps and (match := _LOG_TIMESTAMP.match(cached_line)):
+                line = cached_line[match.end() :]
+                size = cached_size - match.end()
+            if bytes_used + size > max_bytes:
+                break
+            selected.append(line)
+            bytes_used += size
+        selected.reverse()
+
+        dropped = wanted - len(selected)
+        return selected, {
+            "bytes_returned": bytes_used,
+            "lines_dropped": dropped,
+            "truncated_by": "bytes" if dropped else None,
+        }
+
+    def _evict_tail_cache(self) -> None:
+        """Evict least recently used tails until the cache fits its byte budget."""
+        while self._tail_cache_bytes > LOG_TAIL_CACHE_MAX_BYTES and self._tail_cache:
+            key, entry = self._tail_cache.popitem(last=False)
+            self._tail_cache_bytes -= entry["bytes"]
+            self._drop_tail_lock(key)
+
+    def _drop_tail_lock(self, key: tuple[str, str]) -> None:
+        """Forget a tail entry's lock unless a refresh is holding it."""
+        lock = self._tail_cache_locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._tail_cache_locks[key]
+
+    def invalidate_log_tail(self, host_id: str, container_id: str | None = None) -> int:
+        """Drop cached log tails for a container (ID prefix or name) or a whole host.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for key, entry in list(self._tail_cache.items()):
+            cached_host, cached_id = key
+            if cached_host != host_id:
+                continue
+            if container_id and not (
+                cached_id.startswith(container_id) or entry["name"] == container_id.lstrip("/")
+            ):
+                continue
+            del self._tail_cache[key]
+            self._tail_cache_bytes -= entry["bytes"]
+            self._drop_tail_lock(key)
+            removed += 1
+        return removed
+
+    def _describe_log_target(self, stack_name: str | None, service_name: str | None) -> str:
+        """Describe what an aggregated logs request targeted, for error messages."""
+        if service_name:
+            return f"service {service_name}" + (f" in stack {stack_name}" if stack_name else "")
+        if stack_name:
+            return f"stack {stack_name}"
+        return "the requested containers"
+
+    async def get_aggregated_logs(
+        self,
+        host_id: str,
+        container_ids: list[str] | None = None,
+        stack_name: str | None = None,
+        lines: int = 100,
+        since: str | None = None,
+        max_bytes: int | None = None,
+        grep: str | None = None,
+        level: str | None = None,
+        regex: str | None = None,
+        service_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Get logs from several containers merged into one timestamp-ordered view.
+
+        Logs are fetched concurrently with timestamps enabled and combined with a
+        k-way heap merge. Each line is prefixed with its source container. The merge
+        walks backwards from the newest line so that, when the ``lines`` or
+        ``max_bytes`` budget is hit, the most recent output is what is kept.
+
+        Args:
+            host_id: ID of the Docker host
+            container_ids: Containers to aggregate (IDs or names)
+            stack_name: Compose project whose containers should be aggregated
+            lines: Maximum number of merged lines to return (also the per-container tail)
+            since: Only logs since this timestamp (e.g., '2023-01-01T00:00:00Z')
+            max_bytes: Maximum size of the merged output in bytes
+                (default: AGGREGATED_LOGS_MAX_BYTES)
+            grep: Only lines containing this text (case-insensitive)
+            level: Only lines at or above this severity (e.g., 'warn', 'error')
+            regex: Only lines matching this regular expression
+            service_name: Only containers of this compose service (its replicas)
+
+        Returns:
+            Merged logs with per-source details and truncation info
+        """
+        max_bytes = max_bytes or AGGREGATED_LOGS_MAX_BYTES
+        try:
+            self._build_line_filter(grep, level, regex)
+        except ValueError as e:
+            return self._build_error_response(
+                host_id, "get_aggregated_logs", str(e), problem_type="generic"
+            )
+
+        try:
+            sources = await self._resolve_log_sources(
+                host_id, container_ids, stack_name, service_name
+            )
+            if not sources:
+                target = self._describe_log_target(stack_name, service_name)
+                return self._build_error_response(
+                    host_id,
+                    "get_aggregated_logs",
+                    f"No containers found for {target}",
+                    problem_type="generic",
+                    stack_name=stack_name,
+                )
+
+            results = await asyncio.gather(
+                *(
+                    self.get_container_logs(
+                        host_id,
+                        container_id,
+                        lines=lines,
+                        since=since,
+                        timestamps=True,
+                        grep=grep,
+                        level=level,
+                        regex=regex,
+                        max_bytes=max_bytes,
+                    )
+                    for _, container_id in sources
+                )
+            )
+
+            source_details: list[dict[str, Any]] = []
+            per_source: list[list[tuple[str, str]]] = []
+            for (label, container_id), result in zip(sources, results, strict=True):
+                if result.get("success"):
+                    source_data = result.get("data", {})
+                    source_lines = source_data.get("logs", [])
+                    per_source.append(self._keyed_log_lines(label, source_lines))
+                    detail = {
+                        "source": label,
+                        "container_id": container_id,
+                        "lines": len(source_lines),
+                    }
+                    if "lines_scanned" in source_data:
+                        detail["lines_scanned"] = source_data["lines_scanned"]
+                        detail["lines_matched"] = source_data.get("lines_matched")
+                    if source_data.get("truncated_by"):
+                        detail["truncated_by"] = source_data["truncated_by"]
+                    source_details.append(detail)
+                else:
+                    source_details.append(
+                        {
+                            "source": label,
+                            "container_id": container_id,
+                            "error": result.get("error"),
+                        }
+                    )
+
+            merged, bytes_used, truncated_by = self._merge_log_sources(per_source, lines, max_bytes)
+
+            logger.info(
+                "Retrieved aggregated logs",
+                host_id=host_id,
+                stack_name=stack_name,
+                sources=len(sources),
+                lines_returned=len(merged),
+                truncated_by=truncated_by,
+            )
+
+            return create_success_response(
+                data={
+                    "host_id": host_id,
+                    "stack_name": stack_name,
+                    "sources": source_details,
+                    "logs": merged,
+                    "lines_returned": len(merged),
+                    "bytes_returned": bytes_used,
+                    "truncated": truncated_by is not None,
+                    "truncated_by": truncated_by,
+                    "since": since,
+                },
+                context={"host_id": host_id, "operation": "get_aggregated_logs"},
+            )
+
+        except docker.errors.APIError as e:
+            logger.error("Docker API error aggregating logs", host_id=host_id, error=str(e))
+            return self._build_error_response(
+                host_id, "get_aggregated_logs", f"Failed to get logs: {str(e)}"
+            )
+        except (DockerCommandError, DockerContextError) as e:
+            logger.error("Failed to aggregate logs", host_id=host_id, error=str(e))
+            return self._build_error_response(host_id, "get_aggregated_logs", str(e))
+
+    async def _resolve_log_sources(
+        self,
+        host_id: str,
+        container_ids: list[str] | None,
+        stack_name: str | None,
+        service_name: str | None = None,
+    ) -> list[tuple[str, str]]:
+        """Resolve (source label, container id) pairs for aggregation.
+
+        Stacks and services are resolved through compose labels, so the result does
+        not depend on the remote working directory or compose file location.
+        """
+        if not stack_name and not service_name:
+            return [(container_id, container_id) for container_id in container_ids or []]
+
+        client = await self.context_manager.get_client(host_id)
+        if client is None:
+            raise DockerContextError(f"Could not connect to Docker on host {host_id}")
+
+        label_filters = []
+        if stack_name:
+            label_filters.append(f"{DOCKER_COMPOSE_PROJECT}={stack_name}")
+        if service_name:
+            label_filters.append(f"{DOCKER_COMPOSE_SERVICE}={service_name}")
+        containers = await asyncio.to_thread(
+            client.containers.list, all=True, filters={"label": label_filters}
+        )
+        return sorted((container.name, container.id[:12]) for container in containers)
+
+    def _keyed_log_lines(self, label: str, source_lines: list[str]) -> list[tuple[str, str]]:
+        """Attach a sortable timestamp key and source prefix to each line.
+
+        Lines without a timestamp (continuations, CLI fallback output) inherit the
+        key of the previous line so they stay with it in the merged output.
+        """
+        keyed: list[tuple[str, str]] = []
+        last_key = ""
+        for line in source_lines:
+            match = _LOG_TIMESTAMP.match(line)
+            if match:
+                last_key = _timestamp_key(match)
+            keyed.append((last_key, f"{label} | {line}"))
+        return keyed
+
+    def _merge_log_sources(
+        self, per_source: list[list[tuple[str, str]]], max_lines: int, max_bytes: int
+    ) -> tuple[list[str], int, str | None]:
+        """K-way merge of time-ordered sources, newest first, within line/byte budgets."""
+        newest_first = heapq.merge(
+            *(reversed(source) for source in per_source), key=lambda item: item[0], reverse=True
+        )
+
+        selected: list[str] = []
+        bytes_used = 0
+        truncated_by: str | None = None
+        for _, line in newest_first:
+            if len(selected) >= max_lines:
+                truncated_by = "lines"
+                break
+            line_bytes = len(line.encode("utf-8")) + 1
+            if bytes_used + line_bytes > max_bytes:
+                truncated_by = "bytes"
+                break
+            selected.append(line)
+            bytes_used += line_bytes
+
+        selected.reverse()
+        return selected, bytes_used, truncated_by
+
     async def stream_container_logs_setup(
         self,
         host_id: str,
@@ -383,9 +1431,21 @@ class LogTools:
                 timestamps=timestamps,
             )
 
-            # In a real implementation, this would register the stream
-            # with FastMCP's streaming system and return an endpoint URL
+            self._expire_pending_streams()
+            if self._streams_in_use(host_id) >= LOG_STREAM_MAX_PER_HOST:
+                return self._build_error_response(
+                    host_id,
+                    "stream_container_logs_setup",
+                    f"Too many concurrent log streams on host {host_id} "
+                    f"(limit {LOG_STREAM_MAX_PER_HOST})",
+                    container_id,
+                    problem_type="generic",
+                )
+
+            # The random component makes the id an unguessable, single-use capability
+            # for the HTTP endpoint that serves the stream
             stream_id = f"{host_id}_{container_id}_{uuid.uuid4().hex}"
+            self._pending_streams[stream_id] = (time.monotonic(), stream_config)
 
             logger.info(
                 "Log stream setup created",
@@ -403,7 +1463,9 @@ class LogTools:
                     "instructions": {
                         "connect": "Connect to the streaming endpoint to receive real-time logs",
                         "format": "Server-sent events (SSE)",
-                        "reconnect": "Client should handle reconnection on connection loss",
+                        "reconnect": "Stream ids are single-use; set up a new stream to reconnect",
+                        "expires_in_seconds": LOG_STREAM_CLAIM_TTL,
+                        "idle_timeout_seconds": LOG_STREAM_IDLE_TIMEOUT,
                     },
                 },
                 context={
@@ -431,73 +1493,97 @@ class LogTools:
         lines: int = 100,
         since: str | None = None,
         timestamps: bool = False,
+        grep: str | None = None,
+        level: str | None = None,
+        regex: str | None = None,
+        stack_name: str | None = None,
+        max_bytes: int | None = None,
     ) -> dict[str, Any]:
         """Get logs from a Docker Compose service.
 
+        The service's replicas are found through the compose project/service labels
+        and their logs are fetched concurrently and merged by timestamp, instead of
+        running ``docker compose logs`` in whatever directory the remote shell
+        starts in.
+
         Args:
             host_id: ID of the Docker host
             service_name: Name of the service
             lines: Number of lines to retrieve
             since: Only logs since this timestamp
             timestamps: Include timestamps in output
+            grep: Only lines containing this text (case-insensitive)
+            level: Only lines at or above this severity (e.g., 'warn', 'error')
+            regex: Only lines matching this regular expression
+            stack_name: Compose project of the service (any project if omitted)
+            max_bytes: Byte budget for the merged output
 
         Returns:
             Service logs
         """
-        try:
-            # Build Docker Compose logs command
-            cmd = f"compose logs --tail {lines}"
-
-            if since:
-                cmd += f" --since {since}"
-
-            if timestamps:
-                cmd += " --timestamps"
-
-            cmd += f" {service_name}"
-
-            result = await self.context_manager.execute_docker_command(host_id, cmd)
-
-            # Parse logs
-            logs_data = []
-            if isinstance(result, dict) and "output" in result:
-                logs_data = result["output"].strip().split("\n")
-
-            # Sanitize service logs before returning
-            sanitized_logs = self._sanitize_log_content(logs_data)
-
-            logger.info(
-                "Retrieved service logs",
-                host_id=host_id,
-                service_name=service_name,
-                lines_returned=len(sanitized_logs),
-                sanitization_applied=len(sanitized_logs) != len(logs_data) or any(s != o for s, o in zip(sanitized_logs, logs_data, strict=False)),
-            )
-
-            return create_success_response(
-                data={
-                    "service_name": service_name,
-                    "host_id": host_id,
-                    "logs": sanitized_logs,
-                    "truncated": len(sanitized_logs) >= lines,
-                },
-                context={
-                    "host_id": host_id,
-                    "operation": "get_service_logs",
-                    "service_name": service_name,
-                },
-            )
-
-        except (DockerCommandError, DockerContextError) as e:
-            logger.error(
-                "Failed to get service logs",
-                host_id=host_id,
-                service_name=service_name,
-                error=str(e),
-            )
-            return self._build_error_response(
-                host_id, "get_service_logs", str(e), service_name=service_name
-            )
+        result = await self.get_aggregated_logs(
+            host_id,
+            stack_name=stack_name,
+            service_name=service_name,
+            lines=lines,
+            since=since,
+            max_bytes=max_bytes,
+            grep=grep,
+            level=level,
+            regex=regex,
+        )
+        if not result.get("success"):
+            return result
+
+        data = result.get("data", {})
+        replicas = data.get("sources", [])
+        logs_data = data.get("logs", [])
+        if not timestamps:
+            logs_data = [self._strip_merged_timestamp(line) for line in logs_data]
+
+        service_data: dict[str, Any] = {
+            "service_name": service_name,
+            "stack_name": stack_name,
+            "host_id": host_id,
+            "replicas": replicas,
+            "logs": logs_data,
+            "lines_returned": len(logs_data),
+            "bytes_returned": data.get("bytes_returned"),
+            "truncated": data.get("truncated", False) or len(logs_data) >= lines,
+            "truncated_by": data.get("truncated_by"),
+        }
+        if grep or level or regex:
+            service_data["lines_scanned"] = sum(r.get("lines_scanned", 0) for r in replicas)
+            service_data["lines_matched"] = sum(r.get("lines_matched", 0) for r in replicas)
+
+        logger.info(
+            "Retrieved service logs",
+            host_id=host_id,
+            service_name=service_name,
+            stack_name=stack_name,
+            replicas=len(replicas),
+            lines_returned=len(logs_data),
+        )
+
+        return create_success_response(
+            data=service_data,
+            context={
+                "host_id": host_id,
+                "operation": "get_service_logs",
+                "service_name": service_name,
+            },
+        )
+
+    def _strip_merged_timestamp(self, line: str) -> str:
+        """Remove the Docker timestamp that follows the source prefix of a merged line."""
+        separator = line.find(" | ")
+        if separator < 0:
+            return line
+        body_start = separator + 3
+        match = _LOG_TIMESTAMP.match(line[body_start:])
+        if match is None:
+            return line
+        return line[:body_start] + line[body_start + match.end() :]
 
     async def _validate_container_exists(self, host_id: str, container_id: str) -> None:
         """Validate that a container exists and is accessible."""
@@ -517,37 +1603,188 @@ class LogTools:
                 ) from e
             raise
 
-    async def _stream_logs_generator(self, stream_config: LogStreamRequest):
-        """Generator for streaming logs (used internally by FastMCP streaming)."""
-        # This would be used by FastMCP's streaming system
-        # to continuously yield log lines as they become available
+    def claim_log_stream(self, stream_id: str) -> LogStreamRequest | None:
+        """Claim a registered stream for serving; each stream id can be claimed once."""
+        self._expire_pending_streams()
+        entry = self._pending_streams.pop(stream_id, None)
+        return entry[1] if entry else None
+
+    def _expire_pending_streams(self) -> None:
+        """Drop stream registrations that no client connected to in time."""
+        cutoff = time.monotonic() - LOG_STREAM_CLAIM_TTL
+        expired = [sid for sid, (created, _) in self._pending_streams.items() if created < cutoff]
+        for stream_id in expired:
+            del self._pending_streams[stream_id]
+
+    def _streams_in_use(self, host_id: str) -> int:
+        """Count active plus not-yet-claimed streams for a host."""
+        pending = sum(1 for _, cfg in self._pending_streams.values() if cfg.host_id == host_id)
+        return self._active_streams.get(host_id, 0) + pending
+
+    def _parse_since(self, since: str) -> int | str:
+        """Convert an ISO timestamp to epoch seconds for the Docker SDK."""
+        try:
+            dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
+            return int(dt.timestamp())
+        except Exception:
+            return since  # fallback
+
+    def _pump_log_stream(
+        self,
+        log_stream: Iterator[bytes],
+        queue: asyncio.Queue,
+        loop: asyncio.AbstractEventLoop,
+        stop: threading.Event,
+    ) -> None:
+        """Read the blocking Docker log stream in a thread and feed the async queue.
+
+        ``queue.put`` blocks while the queue is full, so a slow client stops the
+        reads from the daemon socket instead of growing memory.
+        """
+
+        def put(item: Any) -> bool:
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            while not stop.is_set():
+                try:
+                    future.result(timeout=0.5)
+                    return True
+                except TimeoutError:
+                    continue
+            future.cancel()
+            return False
 
         try:
-            # Build streaming command
-            cmd = f"logs --tail {stream_config.tail}"
+            for chunk in log_stream:
+                if stop.is_set() or not put(chunk):
+                    return
+            put(_STREAM_END)
+        except Exception as e:
+            if not stop.is_set():
+                with contextlib.suppress(RuntimeError):
+                    put(e)
+
+    async def _open_log_stream(self, stream_config: LogStreamRequest) -> Any:
+        """Open a streaming Docker log iterator for the requested container."""
+        host_id = stream_config.host_id
+        client = await self.context_manager.get_client(host_id)
+        if client is None:
+            raise DockerContextError(f"Could not connect to Docker on host {host_id}")
+
+        container = await asyncio.to_thread(client.containers.get, stream_config.container_id)
+        logs_kwargs: dict[str, Any] = {
+            "stream": True,
+            "follow": stream_config.follow,
+            "tail": stream_config.tail,
+            "timestamps": stream_config.timestamps,
+        }
+        if stream_config.since:
+            logs_kwargs["since"] = self._parse_since(stream_config.since)
+        return await asyncio.to_thread(container.logs, **logs_kwargs)
+
+    async def _next_log_chunk(self, queue: asyncio.Queue) -> bytes | None:
+        """Wait for the pump thread's next chunk; None once the stream has ended.
+
+        Raises TimeoutError when nothing arrives within ``LOG_STREAM_IDLE_TIMEOUT`` and
+        re-raises errors the pump thread hit while reading.
+        """
+        item = await asyncio.wait_for(queue.get(), timeout=LOG_STREAM_IDLE_TIMEOUT)
+        if item is _STREAM_END:
+            return None
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def _split_log_chunk(
+        self, decoder: codecs.IncrementalDecoder, partial: str, chunk: bytes
+    ) -> tuple[list[str], str]:
+        """Decode a chunk and return its sanitized complete lines plus the trailing partial line."""
+        lines = (partial + decoder.decode(chunk)).split("\n")
+        partial = lines.pop()
+        return self._sanitize_log_content([line.rstrip("\r") for line in lines]), partial
+
+    def _release_stream_slot(self, host_id: str) -> None:
+        """Give back a host's concurrent stream slot."""
+        remaining = self._active_streams.get(host_id, 1) - 1
+        if remaining > 0:
+            self._active_streams[host_id] = remaining
+        else:
+            self._active_streams.pop(host_id, None)
 
-            if stream_config.follow:
-                cmd += " --follow"
+    async def _stream_logs_generator(self, stream_config: LogStreamRequest) -> AsyncIterator[str]:
+        """Stream container logs as server-sent events.
 
-            if stream_config.since:
-                cmd += f" --since {stream_config.since}"
+        The Docker log stream is read incrementally by a producer thread into a bounded
+        queue; each chunk is decoded, split into complete lines and sanitized before it
+        is sent. The stream ends when the container's log stream closes, when no output
+        arrives within ``LOG_STREAM_IDLE_TIMEOUT``, or when the client disconnects.
+        """
+        host_id = stream_config.host_id
+        container_id = stream_config.container_id
 
-            if stream_config.timestamps:
-                cmd += " --timestamps"
+        if self._active_streams.get(host_id, 0) >= LOG_STREAM_MAX_PER_HOST:
+            yield f"event: error\ndata: Too many concurrent log streams on host {host_id}\n\n"
+            return
 
-            cmd += f" {stream_config.container_id}"
+        self._active_streams[host_id] = self._active_streams.get(host_id, 0) + 1
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=LOG_STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+        log_stream = None
+        lines_sent = 0
 
-            # In a real implementation, this would use asyncio subprocess
-            # to stream logs continuously
-            logger.info(
-                "Starting log stream",
-                host_id=stream_config.host_id,
-                container_id=stream_config.container_id,
-            )
+        try:
+            log_stream = await self._open_log_stream(stream_config)
 
-            # Placeholder for actual streaming implementation
-            yield f"data: Starting log stream for {stream_config.container_id}\n\n"
+            threading.Thread(
+                target=self._pump_log_stream,
+                args=(log_stream, queue, loop, stop),
+                name=f"log-stream-{container_id[:12]}",
+                daemon=True,
+            ).start()
 
-        except Exception as e:
-            logger.error("Log streaming error", error=str(e))
-            yield f"data: Error: {str(e)}\n\n"
+            logger.info("Starting log stream", host_id=host_id, container_id=container_id)
+
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            partial = ""
+            while True:
+                try:
+                    chunk = await self._next_log_chunk(queue)
+                except TimeoutError:
+                    idle = f"No output for {LOG_STREAM_IDLE_TIMEOUT:.0f}s"
+                    yield f"event: idle-timeout\ndata: {idle}\n\n"
+                    break
+                if chunk is None:
+                    break
+
+                lines, partial = self._split_log_chunk(decoder, partial, chunk)
+                for line in lines:
+                    lines_sent += 1
+                    yield f"data: {line}\n\n"
+
+            partial += decoder.decode(b"", final=True)
+            if partial:
+                last_line = self._sanitize_log_content([partial.rstrip("\r")])[0]
+                lines_sent += 1
+                yield f"data: {last_line}\n\n"
+            yield "event: end\ndata: Log stream closed\n\n"
+
+        except docker.errors.NotFound:
+            yield f"event: error\ndata: Container {container_id} not found\n\n"
+        except (docker.errors.APIError, DockerCommandError, DockerContextError) as e:
+            logger.error(
+                "Log streaming error", host_id=host_id, container_id=container_id, error=str(e)
+            )
+            yield f"event: error\ndata: {str(e)}\n\n"
+        finally:
+            # Runs on normal completion and when the client disconnects (cancellation)
+            stop.set()
+            if log_stream is not None:
+                with contextlib.suppress(Exception):
+                    log_stream.close()
+            self._release_stream_slot(host_id)
+            logger.info(
+                "Log stream finished",
+                host_id=host_id,
+                container_id=container_id,
+                lines_sent=lines_sent,
+            )
@@ -1,10 +1,12 @@
 """Stack deployment MCP tools."""
 
 import asyncio
+import hashlib
 import json
 import shlex
 import subprocess
 import time
+from collections import Counter
 from collections.abc import Callable, Mapping
 from datetime import datetime
 from pathlib import Path
@@ -12,10 +14,18 @@ from typing import Any
 
 import structlog
 
-from ..core.compose_manager import ComposeManager
+from ..constants import (
+    DOCKER_COMPOSE_CONFIG_FILES,
+    DOCKER_COMPOSE_PROJECT,
+    DOCKER_COMPOSE_SERVICE,
+)
+from ..core.compose_manager import ComposeManager, compute_deploy_hash
+from ..core.compose_model import diff_compose_models, get_compose_model
 from ..core.config_loader import DockerHost, DockerMCPConfig
 from ..core.docker_context import DockerContextManager
 from ..core.exceptions import DockerCommandError, DockerContextError
+from ..core.image_pull import prepull_images
+from ..core.progress import current_progress, emit_progress, run_command_streaming
 from ..models.container import StackInfo
 from ..utils import build_ssh_command
 
@@ -38,9 +48,14 @@ class StackTools:
         environment: dict[str, str] | None = None,
         pull_images: bool = True,
         recreate: bool = False,
+        force: bool = False,
     ) -> dict[str, Any]:
         """Deploy a Docker Compose stack to a remote host with persistent compose files.
 
+        Unless ``force`` or ``recreate`` is set, a deploy whose compose content and
+        environment match the last successful deploy (and whose services are all
+        running) returns "already up to date" without writing, pulling or running compose.
+
         Args:
             host_id: ID of the Docker host
             stack_name: Name for the stack (used as project name)
@@ -48,6 +63,7 @@ class StackTools:
             environment: Environment variables for the stack
             pull_images: Pull latest images before deploying
             recreate: Recreate containers even if config hasn't changed
+            force: Deploy even if content and environment are unchanged
 
         Returns:
             Deployment result
@@ -62,21 +78,54 @@ class StackTools:
                     "timestamp": datetime.now().isoformat(),
                 }
 
-            # Write compose file to persistent location on remote host
-            compose_file_path = await self.compose_manager.write_compose_file(
-                host_id, stack_name, compose_content
+            deploy_hash = compute_deploy_hash(compose_content, environment)
+            deploy_state = await self.compose_manager.read_deploy_state(host_id, stack_name)
+            if not (force or recreate):
+                up_to_date = await self.check_deploy_up_to_date(
+                    host_id, stack_name, compose_content, environment, deploy_state
+                )
+                if up_to_date is not None:
+                    return up_to_date
+
+            # Plan against the deployed file before it is overwritten
+            plan = await self._plan_for_deploy(
+                host_id, stack_name, compose_content, environment, deploy_state, recreate
+            )
+
+            started = time.monotonic()
+            compose_file_path, image_pull = await self._write_compose_and_prepull(
+                host_id, stack_name, compose_content, plan["targets"], pull_images
             )
 
             # Deploy using persistent compose file
+            emit_progress("step", "Running docker compose up", step="compose_up", host_id=host_id)
             result = await self._deploy_stack_with_persistent_file(
-                host_id, stack_name, compose_file_path, environment or {}, pull_images, recreate
+                host_id,
+                stack_name,
+                compose_file_path,
+                environment or {},
+                pull_images,
+                recreate,
+                services=plan["targets"] if plan["mode"] != "full" else None,
+                remove_orphans=bool(plan["removed"]),
+                pull_services=image_pull["compose_pull_services"] if image_pull else None,
             )
+            result["deploy_plan"] = plan
+            if image_pull is not None:
+                result["image_pull"] = image_pull
+            result["duration_seconds"] = round(time.monotonic() - started, 2)
+            if result["success"]:
+                await self.compose_manager.write_deploy_hash(host_id, stack_name, deploy_hash)
 
             logger.info(
                 "Stack deployment completed",
                 host_id=host_id,
                 stack_name=stack_name,
                 success=result["success"],
+                mode=plan["mode"],
+                services_deployed=len(plan["targets"]),
+                services_total=plan["services_total"],
+                duration_seconds=result["duration_seconds"],
             )
 
             return result
@@ -93,9 +142,300 @@ class StackTools:
                 "timestamp": datetime.now().isoformat(),
             }
 
+    async def _plan_for_deploy(
+        self,
+        host_id: str,
+        stack_name: str,
+        compose_content: str,
+        environment: dict[str, str] | None,
+        deploy_state: tuple[str | None, str | None, str] | None,
+        recreate: bool,
+    ) -> dict[str, Any]:
+        """Plan the deploy (full when recreating) and report it as a progress step."""
+        if recreate:
+            plan = self._full_deploy_plan(compose_content, "recreate requested")
+        else:
+            plan = await self.plan_deploy(
+                host_id, stack_name, compose_content, environment, deploy_state
+            )
+        emit_progress(
+            "step",
+            f"Deploying {len(plan['targets'])}/{plan['services_total']} services "
+            f"({plan['mode']})",
+            step="plan",
+            host_id=host_id,
+            mode=plan["mode"],
+            targets=plan["targets"],
+        )
+        return plan
+
+    async def _write_compose_and_prepull(
+        self,
+        host_id: str,
+        stack_name: str,
+        compose_content: str,
+        targets: list[str],
+        pull_images: bool,
+    ) -> tuple[str, dict[str, Any] | None]:
+        """Upload the compose file while the target services' images are pulled.
+
+        Returns:
+            Tuple of (remote compose file path, pre-pull summary or None)
+        """
+        prepull_task = (
+            asyncio.create_task(self._prepull_stack_images(host_id, compose_content, targets))
+            if pull_images
+            else None
+        )
+
+        # Write compose file to persistent location on remote host
+        emit_progress("step", "Uploading compose file", step="write_compose", host_id=host_id)
+        try:
+            compose_file_path = await self.compose_manager.write_compose_file(
+                host_id, stack_name, compose_content
+            )
+        except BaseException:
+            if prepull_task is not None:
+                prepull_task.cancel()
+            raise
+        if prepull_task is None:
+            return compose_file_path, None
+
+        image_pull = await prepull_task
+        emit_progress(
+            "step",
+            f"Images pre-pulled: {image_pull.get('pulled', 0)} pulled, "
+            f"{image_pull.get('up_to_date', 0)} up to date, "
+            f"{image_pull.get('failed', 0)} failed",
+            step="pull",
+            host_id=host_id,
+            bytes_downloaded=image_pull.get("bytes_downloaded", 0),
+        )
+        return compose_file_path, image_pull
+
+    async def check_deploy_up_to_date(
+        self,
+        host_id: str,
+        stack_name: str,
+        compose_content: str,
+        environment: dict[str, str] | None = None,
+        deploy_state: tuple[str | None, str | None, str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Return an "already up to date" result if redeploying would change nothing.
+
+        The stack counts as current when the deploy hash recorded beside the remote
+        compose file matches this content + environment, the file on disk still has
+        this content, and every service in it has a running container. Any failure
+        to establish that returns None so the caller deploys normally.
+        """
+        try:
+            stored_hash, file_digest, compose_file_path = (
+                deploy_state or await self.compose_manager.read_deploy_state(host_id, stack_name)
+            )
+            if stored_hash != compute_deploy_hash(compose_content, environment):
+                return None
+            if file_digest != hashlib.sha256(compose_content.encode("utf-8")).hexdigest():
+                return None
+
+            running_services = await self._running_services(host_id, stack_name)
+            expected_services = set(get_compose_model(compose_content).service_names)
+            if not expected_services or not expected_services <= running_services:
+                return None
+        except Exception as e:
+            logger.debug(
+                "Deploy up-to-date check failed, deploying",
+                host_id=host_id,
+                stack_name=stack_name,
+                error=str(e),
+            )
+            return None
+
+        logger.info(
+            "Stack already up to date, skipping deploy", host_id=host_id, stack_name=stack_name
+        )
+        return {
+            "success": True,
+            "up_to_date": True,
+            "message": f"Stack {stack_name} already up to date",
+            "output": "",
+            "host_id": host_id,
+            "stack_name": stack_name,
+            "compose_file": compose_file_path,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    async def _running_services(self, host_id: str, stack_name: str) -> set[str]:
+        """Compose services of a project that have at least one running container."""
+        client = await self.context_manager.get_client(host_id)
+        if client is None:
+            raise DockerContextError(f"Could not connect to Docker on host {host_id}")
+        containers = await asyncio.to_thread(
+            client.containers.list,
+            all=True,
+            sparse=True,
+            filters={"label": f"{DOCKER_COMPOSE_PROJECT}={stack_name}"},
+        )
+        return {
+            (container.attrs.get("Labels") or {}).get(DOCKER_COMPOSE_SERVICE)
+            for container in containers
+            if str(container.attrs.get("State") or "").lower() == "running"
+        }
+
+    async def _prepull_stack_images(
+        self, host_id: str, compose_content: str, services: list[str]
+    ) -> dict[str, Any]:
+        """Pull the images of ``services`` concurrently ahead of ``compose up``.
+
+        Services with a build section, an interpolated image reference or a failed
+        pull are returned in ``compose_pull_services`` so compose pulls them itself.
+        """
+        wanted = set(services)
+        images: dict[str, list[str]] = {}
+        compose_pull_services: list[str] = []
+        for service in get_compose_model(compose_content).services:
+            if service.name not in wanted:
+                continue
+            buildable = isinstance(service.config, Mapping) and "build" in service.config
+            if buildable or not service.image or "$" in service.image:
+                compose_pull_services.append(service.name)
+            else:
+                images.setdefault(service.image, []).append(service.name)
+
+        # Captured here: layer events arrive from a pull task that may belong to another caller
+        emitter = current_progress()
+
+        async def report_layer(event: dict[str, Any]) -> None:
+            if emitter is not None:
+                emitter(
+                    "pull",
+                    f"{event['image']} {event['layer']}: {event['status']} {event['percent']}%",
+                    **event,
+                )
+
+        try:
+            client = await self.context_manager.get_client(host_id)
+            if client is None:
+                raise DockerContextError(f"Could not connect to Docker on host {host_id}")
+            summary = await prepull_images(
+                host_id,
+                client,
+                list(images),
+                on_progress=report_layer if emitter is not None else None,
+            )
+        except Exception as e:
+            logger.warning(
+                "Image pre-pull unavailable, leaving pulls to compose",
+                host_id=host_id,
+                error=str(e),
+            )
+            return {"images": [], "compose_pull_services": sorted(wanted)}
+
+        for result in summary["images"]:
+            if result["status"] == "failed":
+                compose_pull_services.extend(images[result["image"]])
+        summary["compose_pull_services"] = sorted(compose_pull_services)
+        return summary
+
+    def _full_deploy_plan(self, compose_content: str, reason: str) -> dict[str, Any]:
+        services = get_compose_model(compose_content).service_names
+        return {
+            "mode": "full",
+            "reason": reason,
+            "services_total": len(services),
+            "targets": services,
+            "changed": [],
+            "added": [],
+            "removed": [],
+            "dependents": [],
+        }
+
+    async def plan_deploy(
+        self,
+        host_id: str,
+        stack_name: str,
+        compose_content: str,
+        environment: dict[str, str] | None = None,
+        deploy_state: tuple[str | None, str | None, str] | None = None,
+    ) -> dict[str, Any]:
+        """Diff the new compose file against the deployed one and pick the services to update.
+
+        An incremental plan targets changed and added services plus everything that
+        depends on them; a remove_only plan (services were only removed) targets none
+        and just drops the removed services' containers. It falls back to a full deploy when there is no record of
+        the last deploy, the environment or on-disk file changed since then, a
+        top-level section (networks, volumes, ...) changed, no service changed, or an
+        untouched service is not running.
+        """
+        try:
+            stored_hash, _, compose_file_path = (
+                deploy_state or await self.compose_manager.read_deploy_state(host_id, stack_name)
+            )
+            if stored_hash is None:
+                return self._full_deploy_plan(compose_content, "no previous deploy recorded")
+
+            deployed_content = await self.compose_manager.read_compose_file(
+                host_id, compose_file_path
+            )
+            if compute_deploy_hash(deployed_content, environment) != stored_hash:
+                return self._full_deploy_plan(
+                    compose_content, "environment or compose file changed since last deploy"
+                )
+
+            new_model = get_compose_model(compose_content)
+            diff = diff_compose_models(get_compose_model(deployed_content), new_model)
+            if diff["top_level_changed"]:
+                return self._full_deploy_plan(
+                    compose_content,
+                    f"top-level sections changed: {', '.join(diff['top_level_changed'])}",
+                )
+            targets = sorted(set(diff["changed"]) | set(diff["added"]) | set(diff["dependents"]))
+            if not targets and not diff["removed"]:
+                return self._full_deploy_plan(compose_content, "no service changes detected")
+
+            stopped = set(diff["unchanged"]) - await self._running_services(host_id, stack_name)
+            if stopped:
+                return self._full_deploy_plan(
+                    compose_content, f"unchanged services not running: {', '.join(sorted(stopped))}"
+                )
+        except Exception as e:
+            logger.debug(
+                "Incremental deploy planning failed, deploying all services",
+                host_id=host_id,
+                stack_name=stack_name,
+                error=str(e),
+            )
+            return self._full_deploy_plan(compose_content, f"planning failed: {e}")
+
+        if not targets:
+            return {
+                "mode": "remove_only",
+                "reason": f"{len(diff['removed'])} services removed, no other changes",
+                "services_total": len(new_model.services),
+                "targets": [],
+                "changed": [],
+                "added": [],
+                "removed": diff["removed"],
+                "dependents": [],
+            }
+        return {
+            "mode": "incremental",
+            "reason": f"{len(targets)} of {len(new_model.services)} services affected",
+            "services_total": len(new_model.services),
+            "targets": targets,
+            "changed": diff["changed"],
+            "added": diff["added"],
+            "removed": diff["removed"],
+            "dependents": diff["dependents"],
+        }
+
     async def list_stacks(self, host_id: str) -> dict[str, Any]:
         """List Docker Compose stacks on a host.
 
+        Stacks are derived from a single container listing grouped by the compose
+        project label. ``docker compose ls`` runs concurrently and only supplies
+        metadata (config files, status of projects without containers); per-project
+        ``docker compose ps`` is used only if the container listing fails.
+
         Args:
             host_id: ID of the Docker host
 
@@ -112,79 +452,54 @@ class StackTools:
                     "timestamp": datetime.now().isoformat(),
                 }
 
-            compose_list_output = await self._run_ssh_command(
-                host_config,
-                "docker compose ls --all --format json",
-                timeout=30,
+            containers_result, compose_list_output = await asyncio.gather(
+                self._list_compose_containers(host_id),
+                self._run_ssh_command(
+                    host_config,
+                    "docker compose ls --all --format json",
+                    timeout=30,
+                ),
+                return_exceptions=True,
             )
+            if isinstance(compose_list_output, BaseException):
+                raise compose_list_output
 
+            projects: list[dict[str, Any]] = []
+            compose_ls_error: str | None = None
             if compose_list_output.returncode != 0:
-                error_msg = compose_list_output.stderr.strip() or compose_list_output.stdout.strip()
-                logger.error(
-                    "Failed to list compose projects",
-                    host_id=host_id,
-                    error=error_msg,
+                compose_ls_error = (
+                    compose_list_output.stderr.strip() or compose_list_output.stdout.strip()
                 )
-                return {
-                    "success": False,
-                    "error": f"docker compose ls failed: {error_msg}",
-                    "host_id": host_id,
-                    "timestamp": datetime.now().isoformat(),
-                }
-
-            projects = self._parse_compose_ls(compose_list_output.stdout)
-            stacks: list[dict[str, Any]] = []
-
-            for project in projects:
-                project_name = project.get("Name") or project.get("name")
-                if not project_name:
-                    continue
-
-                compose_files = project.get("ConfigFiles") or project.get("config_files") or ""
-                compose_file = compose_files.split(",")[0].strip() if compose_files else None
+            else:
+                projects = self._parse_compose_ls(compose_list_output.stdout)
 
-                ps_output = await self._run_ssh_command(
-                    host_config,
-                    self._build_compose_ps_command(project_name, compose_file),
-                    timeout=30,
+            if isinstance(containers_result, BaseException):
+                logger.warning(
+                    "Compose container listing failed, falling back to compose ps per project",
+                    host_id=host_id,
+                    error=str(containers_result),
                 )
-
-                if ps_output.returncode != 0:
-                    error_msg = ps_output.stderr.strip() or ps_output.stdout.strip()
+                if compose_ls_error is not None:
+                    logger.error(
+                        "Failed to list compose projects",
+                        host_id=host_id,
+                        error=compose_ls_error,
+                    )
+                    return {
+                        "success": False,
+                        "error": f"docker compose ls failed: {compose_ls_error}",
+                        "host_id": host_id,
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                stacks = await self._list_stacks_per_project(host_config, host_id, projects)
+            else:
+                if compose_ls_error is not None:
                     logger.debug(
-                        "docker compose ps failed",
+                        "docker compose ls failed, listing stacks without its metadata",
                         host_id=host_id,
-                        project=project_name,
-                        error=error_msg,
+                        error=compose_ls_error,
                     )
-                    services_info: list[dict[str, Any]] = []
-                else:
-                    services_info = self._parse_compose_ps(ps_output.stdout)
-                raw_service_names = {svc.get("Service") or svc.get("service") or svc.get("Name") for svc in services_info}
-                filtered_service_names = [name for name in raw_service_names if name]
-                service_names = sorted(filtered_service_names)
-
-                service_states = [
-                    (svc.get("State") or svc.get("state") or "").lower() for svc in services_info
-                ]
-                if service_states and all(state.startswith("running") or state.startswith("up") for state in service_states):
-                    aggregate_status = "running"
-                elif any(state.startswith("running") or state.startswith("up") for state in service_states):
-                    aggregate_status = "partial"
-                else:
-                    aggregate_status = (project.get("Status") or project.get("status") or "unknown").lower()
-
-                stack_info = StackInfo(
-                    name=project_name,
-                    host_id=host_id,
-                    services=service_names,  # Now properly typed as list[str]
-                    status=aggregate_status,
-                    created=self._parse_datetime(project.get("CreatedAt") or project.get("created")),
-                    updated=self._parse_datetime(project.get("UpdatedAt") or project.get("updated")),
-                    compose_file=compose_file,
-                ).model_dump()
-
-                stacks.append(stack_info)
+                stacks = self._build_stacks_from_containers(host_id, containers_result, projects)
 
             logger.info("Listed stacks", host_id=host_id, count=len(stacks))
             return {
@@ -203,6 +518,142 @@ class StackTools:
                 "timestamp": datetime.now().isoformat(),
             }
 
+    async def _list_compose_containers(self, host_id: str) -> list[Any]:
+        """List every container carrying a compose project label in one API call.
+
+        ``sparse`` skips the per-container inspect the SDK would otherwise make;
+        the list endpoint already returns labels and state.
+        """
+        client = await self.context_manager.get_client(host_id)
+        if client is None:
+            raise DockerContextError(f"Could not connect to Docker on host {host_id}")
+        return await asyncio.to_thread(
+            client.containers.list,
+            all=True,
+            sparse=True,
+            filters={"label": DOCKER_COMPOSE_PROJECT},
+        )
+
+    def _build_stacks_from_containers(
+        self, host_id: str, containers: list[Any], projects: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Group labelled containers into StackInfo dicts, enriched with compose ls data."""
+        project_meta: dict[str, dict[str, Any]] = {}
+        for project in projects:
+            project_name = project.get("Name") or project.get("name")
+            if project_name:
+                project_meta[project_name] = project
+
+        members: dict[str, list[dict[str, Any]]] = {name: [] for name in project_meta}
+        for container in containers:
+            labels = container.attrs.get("Labels") or {}
+            project_name = labels.get(DOCKER_COMPOSE_PROJECT)
+            if not project_name:
+                continue
+            members.setdefault(project_name, []).append(
+                {
+                    "service": labels.get(DOCKER_COMPOSE_SERVICE),
+                    "state": str(container.attrs.get("State") or "").lower(),
+                    "config_files": labels.get(DOCKER_COMPOSE_CONFIG_FILES) or "",
+                }
+            )
+
+        stacks: list[dict[str, Any]] = []
+        for project_name in sorted(members):
+            project = project_meta.get(project_name, {})
+            project_members = members[project_name]
+
+            compose_files = project.get("ConfigFiles") or project.get("config_files") or next(
+                (m["config_files"] for m in project_members if m["config_files"]), ""
+            )
+            compose_file = compose_files.split(",")[0].strip() if compose_files else None
+
+            stack_info = StackInfo(
+                name=project_name,
+                host_id=host_id,
+                services=sorted({m["service"] for m in project_members if m["service"]}),
+                status=self._aggregate_stack_status(
+                    [m["state"] for m in project_members], project
+                ),
+                created=self._parse_datetime(project.get("CreatedAt") or project.get("created")),
+                updated=self._parse_datetime(project.get("UpdatedAt") or project.get("updated")),
+                compose_file=compose_file or None,
+            ).model_dump()
+            stacks.append(stack_info)
+
+        return stacks
+
+    async def _list_stacks_per_project(
+        self, host_config: DockerHost, host_id: str, projects: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Build stack info with one ``docker compose ps`` per project (fallback path)."""
+        stacks: list[dict[str, Any]] = []
+
+        for project in projects:
+            project_name = project.get("Name") or project.get("name")
+            if not project_name:
+                continue
+
+            compose_files = project.get("ConfigFiles") or project.get("config_files") or ""
+            compose_file = compose_files.split(",")[0].strip() if compose_files else None
+
+            ps_output = await self._run_ssh_command(
+                host_config,
+                self._build_compose_ps_command(project_name, compose_file),
+                timeout=30,
+            )
+
+            if ps_output.returncode != 0:
+                error_msg = ps_output.stderr.strip() or ps_output.stdout.strip()
+                logger.debug(
+                    "docker compose ps failed",
+                    host_id=host_id,
+                    project=project_name,
+                    error=error_msg,
+                )
+                services_info: list[dict[str, Any]] = []
+            else:
+                services_info = self._parse_compose_ps(ps_output.stdout)
+            raw_service_names = {svc.get("Service") or svc.get("service") or svc.get("Name") for svc in services_info}
+            filtered_service_names = [name for name in raw_service_names if name]
+            service_names = sorted(filtered_service_names)
+
+            service_states = [
+                (svc.get("State") or svc.get("state") or "").lower() for svc in services_info
+            ]
+
+            stack_info = StackInfo(
+                name=project_name,
+                host_id=host_id,
+                services=service_names,  # Now properly typed as list[str]
+                status=self._aggregate_stack_status(service_states, project),
+                created=self._parse_datetime(project.get("CreatedAt") or project.get("created")),
+                updated=self._parse_datetime(project.get("UpdatedAt") or project.get("updated")),
+                compose_file=compose_file,
+            ).model_dump()
+
+            stacks.append(stack_info)
+
+        return stacks
+
+    def _aggregate_stack_status(self, states: list[str], project: dict[str, Any]) -> str:
+        """Derive a stack status from its container states.
+
+        All running is "running", some running is "partial"; otherwise the compose
+        ls status is used, or one built in the same "state(count)" form.
+        """
+        running = [state.startswith(("running", "up")) for state in states]
+        if running and all(running):
+            return "running"
+        if any(running):
+            return "partial"
+        project_status = project.get("Status") or project.get("status")
+        if project_status:
+            return project_status.lower()
+        if states:
+            return ", ".join(f"{state}({count})" for state, count in Counter(states).items())
+        return "unknown"
+
     async def stop_stack(self, host_id: str, stack_name: str) -> dict[str, Any]:
         """Stop a Docker Compose stack.
 
@@ -309,17 +760,34 @@ class StackTools:
         environment: dict[str, str],
         pull_images: bool,
         recreate: bool,
+        services: list[str] | None = None,
+        remove_orphans: bool = False,
+        pull_services: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Deploy stack using Docker context with persistent compose file."""
+        """Deploy stack using Docker context with persistent compose file.
+
+        With ``services`` only those services are pulled and brought up. An empty
+        list (a remove_only plan) pulls nothing but still runs ``up`` for the whole
+        project, because compose has no standalone way to remove orphans; the plan
+        only chooses this when every remaining service is unchanged and running, so
+        their ``up`` is a no-op. ``pull_services`` narrows the compose pull further,
+        e.g. to services a pre-pull could not handle.
+        """
         try:
             # Get Docker context for the host
             context_name = await self.context_manager.ensure_context(host_id)
+            service_args = list(services or [])
+            pull_args = service_args if pull_services is None else list(pull_services)
 
             # Pull images first if requested
-            if pull_images:
+            if pull_images and (pull_args or (services is None and pull_services is None)):
                 try:
                     await self._execute_compose_with_file(
-                        context_name, stack_name, compose_file_path, ["pull"], environment
+                        context_name,
+                        stack_name,
+                        compose_file_path,
+                        ["pull", *pull_args],
+                        environment,
                     )
                     logger.info(
                         "Images pulled successfully", host_id=host_id, stack_name=stack_name
@@ -336,6 +804,9 @@ class StackTools:
             up_args = ["up", "-d"]
             if recreate:
                 up_args.append("--force-recreate")
+            if remove_orphans:
+                up_args.append("--remove-orphans")
+            up_args.extend(service_args)
 
             # Deploy the stack
             result = await self._execute_compose_with_file(
@@ -436,14 +907,24 @@ class StackTools:
         )
 
         try:
-            result = await asyncio.to_thread(
-                subprocess.run,  # nosec B603
-                ssh_cmd,
-                check=False,
-                text=True,
-                capture_output=True,
-                timeout=timeout,
-            )
+            emitter = current_progress()
+            if emitter is None:
+                result = await asyncio.to_thread(
+                    subprocess.run,  # nosec B603
+                    ssh_cmd,
+                    check=False,
+                    text=True,
+                    capture_output=True,
+                    timeout=timeout,
+                )
+            else:
+                # Compose reports container and pull events on stderr as it works
+                def report_line(stream: str, line: str) -> None:
+                    emitter(
+                        "compose", line, host_id=host_id, stack_name=project_name, stream=stream
+                    )
+
+                result = await run_command_streaming(ssh_cmd, report_line, timeout)
 
             # Calculate duration and log completion
             duration = time.monotonic() - start_time
@@ -767,6 +1248,8 @@ class StackTools:
             args.append("--follow")
         if options.get("tail"):
             args.extend(["--tail", str(options["tail"])])
+        if options.get("since"):
+            args.extend(["--since", str(options["since"])])
         return args
 
     def _build_pull_args(self, options: dict[str, Any]) -> list[str]:
@@ -900,20 +1383,21 @@ class StackTools:
             # Get the compose file path
             compose_file_path = compose_info["path"]
 
-            # Read the file content via SSH using centralized command builder
+            # Read the file content via SSH (served from cache when the remote stat is unchanged)
             host = self.config.hosts[host_id]
-            ssh_cmd = build_ssh_command(host)
-            ssh_cmd.append(f"cat {shlex.quote(compose_file_path)}")
 
             try:
-                result = await asyncio.to_thread(
-                    subprocess.run,  # nosec B603
-                    ssh_cmd,
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
+                compose_content = await self.compose_manager.read_compose_file(
+                    host_id, compose_file_path
                 )
+            except FileNotFoundError as read_err:
+                return {
+                    "success": False,
+                    "error": str(read_err),
+                    "host_id": host_id,
+                    "stack_name": stack_name,
+                    "timestamp": datetime.now().isoformat(),
+                }
             except subprocess.TimeoutExpired as timeout_err:
                 # Extract SSH target from command for context
                 ssh_target = f"{host.user}@{host.hostname}"
@@ -935,23 +1419,14 @@ class StackTools:
                     "timestamp": datetime.now().isoformat(),
                 }
 
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "host_id": host_id,
-                    "stack_name": stack_name,
-                    "compose_content": result.stdout,
-                    "compose_file_path": compose_file_path,
-                    "timestamp": datetime.now().isoformat(),
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Failed to read compose file: {result.stderr}",
-                    "host_id": host_id,
-                    "stack_name": stack_name,
-                    "timestamp": datetime.now().isoformat(),
-                }
+            return {
+                "success": True,
+                "host_id": host_id,
+                "stack_name": stack_name,
+                "compose_content": compose_content,
+                "compose_file_path": compose_file_path,
+                "timestamp": datetime.now().isoformat(),
+            }
 
         except Exception as e:
             return {
@@ -12,6 +12,13 @@ Created during Phase 3 code cleanup to consolidate:
 Total impact: ~120 lines of duplicate code eliminated.
 """
 
+import asyncio
+import hashlib
+import posixpath
+import shlex
+import subprocess
+from typing import Any
+
 from .constants import SSH_NO_HOST_CHECK
 from .core.config_loader import DockerHost, DockerMCPConfig
 
@@ -69,6 +76,109 @@ def build_ssh_command(host: DockerHost) -> list[str]:
     return ssh_cmd
 
 
+# Printed by the remote side of push_content_via_ssh when it cannot checksum the file
+_NO_CHECKSUM_TOOL = "__no_sha256sum__"
+
+
+async def push_content_via_ssh(
+    host: DockerHost,
+    remote_path: str,
+    content: str | bytes,
+    verify_checksum: bool = True,
+    mode: str | None = None,
+    timeout: int = 60,
+) -> dict[str, Any]:
+    """Write content to a remote file over the stdin of a single SSH exec.
+
+    One round trip creates the parent directory, streams the bytes into a temp
+    file beside the destination and renames it into place, so readers never see
+    a partial file. Replaces the separate ``ssh mkdir`` + ``scp`` sequence.
+
+    Args:
+        host: DockerHost configuration object
+        remote_path: Absolute destination path on the remote host
+        content: File content (str is encoded as UTF-8)
+        verify_checksum: Echo the remote SHA-256 back and compare it with the local one
+        mode: Optional chmod mode for the file (default: keep the existing file's
+            mode, or the remote umask default for a new file)
+        timeout: SSH command timeout in seconds
+
+    Returns:
+        Dict with success, path, bytes_written, checksum and verified (False with a
+        warning when the remote host has no sha256sum), or error
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    quoted_path = shlex.quote(remote_path)
+    script = [
+        "set -e",
+        f"mkdir -p {shlex.quote(posixpath.dirname(remote_path) or '/')}",
+        f'tmp=$(mktemp {shlex.quote(remote_path + ".XXXXXX")})',
+        "trap 'rm -f \"$tmp\"' EXIT",
+        'cat > "$tmp"',
+    ]
+    if mode:
+        script.append(f'chmod {shlex.quote(mode)} "$tmp"')
+    else:
+        # Keep an existing file's mode (as scp did); new files get the umask default.
+        # BusyBox chmod has no --reference, so fall back to stat there.
+        script.append(
+            f"if [ -e {quoted_path} ]; then "
+            f'chmod --reference={quoted_path} "$tmp" 2>/dev/null'
+            f' || chmod "$(stat -c %a {quoted_path})" "$tmp"; '
+            'else chmod "$(printf %o $((0666 & ~$(umask))))" "$tmp"; fi'
+        )
+    script.append(f'mv -f "$tmp" {quoted_path}')
+    if verify_checksum:
+        script.append(
+            f"if command -v sha256sum >/dev/null 2>&1; then sha256sum {quoted_path}; "
+            f"else echo {_NO_CHECKSUM_TOOL}; fi"
+        )
+
+    ssh_cmd = build_ssh_command(host) + ["; ".join(script)]
+    try:
+        result = await asyncio.to_thread(
+            subprocess.run,  # nosec B603
+            ssh_cmd,
+            input=data,
+            check=False,
+            capture_output=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {"success": False, "path": remote_path, "error": f"Timed out after {timeout}s"}
+
+    if result.returncode != 0:
+        return {
+            "success": False,
+            "path": remote_path,
+            "error": result.stderr.decode("utf-8", errors="replace").strip()
+            or f"Remote write exited with code {result.returncode}",
+        }
+
+    response: dict[str, Any] = {
+        "success": True,
+        "path": remote_path,
+        "bytes_written": len(data),
+        "checksum": None,
+        "verified": False,
+    }
+    if verify_checksum:
+        expected = hashlib.sha256(data).hexdigest()
+        reported = result.stdout.decode("utf-8", errors="replace").split()
+        if not reported or reported[0] == _NO_CHECKSUM_TOOL:
+            response["warning"] = "sha256sum not available on remote host; write not verified"
+        elif reported[0] != expected:
+            response["checksum"] = reported[0]
+            response["success"] = False
+            response["error"] = (
+                f"Checksum mismatch after write: expected {expected}, got {reported[0]}"
+            )
+        else:
+            response["checksum"] = reported[0]
+            response["verified"] = True
+    return response
+
+
 def validate_host(config: DockerMCPConfig, host_id: str) -> tuple[bool, str]:
     """Validate host exists in configuration.
 
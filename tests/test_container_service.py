@@ -0,0 +1,37 @@
+"""ContainerService action dispatch tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+
+from docker_mcp.core.config_loader import DockerHost, DockerMCPConfig
+from docker_mcp.models.enums import ContainerAction
+from docker_mcp.services.container import ContainerService
+
+
+@pytest.fixture
+def service() -> ContainerService:
+    config = DockerMCPConfig(hosts={"test-host": DockerHost(hostname="test.local", user="docker")})
+    container_service = ContainerService(config, MagicMock(), logs_service=MagicMock())
+    container_service.manage_container = AsyncMock(
+        return_value=ToolResult(
+            content=[TextContent(type="text", text="Container web done")],
+            structured_content={"success": True, "container_id": "web"},
+        )
+    )
+    return container_service
+
+
+@pytest.mark.parametrize(
+    ("action", "invalidates_log_tail"),
+    [(ContainerAction.START, False), (ContainerAction.RESTART, True)],
+)
+async def test_management_action_through_handle_action(service, action, invalidates_log_tail):
+    result = await service.handle_action(action, host_id="test-host", container_id="web")
+
+    assert result["success"] is True
+    assert result["formatted_output"] == "Container web done"
+    service.manage_container.assert_awaited_once_with("test-host", "web", action.value, False, 10)
+    assert service.logs_service.invalidate_log_tail.called is invalidates_log_tail
@@ -0,0 +1,18 @@
+"""MCP capabilities advertised by the server."""
+
+from fastmcp import Client
+
+from docker_mcp.core.config_loader import DockerHost, DockerMCPConfig
+from docker_mcp.server import DockerMCPServer
+
+
+async def test_initialize_advertises_resource_subscribe(tmp_path):
+    config = DockerMCPConfig(hosts={"test-host": DockerHost(hostname="test.local", user="docker")})
+    server = DockerMCPServer(config, config_path=str(tmp_path / "hosts.yml"))
+    server._initialize_app()
+
+    async with Client(server.app) as client:
+        capabilities = client.initialize_result.capabilities
+
+    assert capabilities.resources is not None
+    assert capabilities.resources.subscribe is True